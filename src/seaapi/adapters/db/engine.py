@@ -0,0 +1,169 @@
+import os
+import time
+import threading
+from typing import Optional
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from src.seaapi.config.settings import (
+    settings,
+    get_database_uri,
+)
+
+# Checkouts que esperam mais que isso indicam pool saturado
+SLOW_CHECKOUT_SECONDS = 0.01
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool que mede a espera de cada checkout (fila, pre-ping e
+    abertura de conexões novas) e conta as conexões abertas, para
+    dimensionar o pool pela quantidade de workers
+    """
+
+    def __init__(
+        self,
+        creator,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        **kwargs,
+    ):
+        super().__init__(
+            creator,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            **kwargs,
+        )
+        self.max_connections = pool_size + max(
+            0, max_overflow
+        )
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        event.listen(self, "connect", self._on_connect)
+
+    def _on_connect(
+        self, dbapi_connection, connection_record
+    ):
+        with self._metrics_lock:
+            self.connects += 1
+
+    def recreate(self):
+        # O pool novo herda os eventos deste, mas conta as próprias
+        # conexões; sem remover o contador, o pool antigo continuaria
+        # referenciado e contando
+        event.remove(self, "connect", self._on_connect)
+        try:
+            return super().recreate()
+        finally:
+            event.listen(self, "connect", self._on_connect)
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._metrics_lock:
+                self.checkouts += 1
+                self._wait_seconds += waited
+                self._max_wait_seconds = max(
+                    self._max_wait_seconds, waited
+                )
+                if waited > SLOW_CHECKOUT_SECONDS:
+                    self.slow_checkouts += 1
+
+    def get_stats(self) -> dict:
+        checked_out = self.checkedout()
+        with self._metrics_lock:
+            return {
+                "pool_size": self.size(),
+                "max_connections": self.max_connections,
+                "checked_out": checked_out,
+                "checked_in": self.checkedin(),
+                "overflow": max(0, self.overflow()),
+                "saturation": round(
+                    checked_out / self.max_connections, 3
+                )
+                if self.max_connections
+                else 0.0,
+                "checkouts": self.checkouts,
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "avg_wait_ms": round(
+                    self._wait_seconds
+                    / self.checkouts
+                    * 1000,
+                    3,
+                )
+                if self.checkouts
+                else 0.0,
+                "max_wait_ms": round(
+                    self._max_wait_seconds * 1000, 3
+                ),
+            }
+
+
+def build_engine(uri: str) -> Engine:
+    if not uri.startswith("postgresql"):
+        # SQLite dos testes e scripts, com o pool padrão
+        return create_engine(uri)
+
+    connect_args = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args[
+            "options"
+        ] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    return create_engine(
+        uri,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        connect_args=connect_args,
+    )
+
+
+_engine: Optional[Engine] = None
+_engine_pid: Optional[int] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Engine do processo atual, criado no primeiro uso. Cada worker do
+    uvicorn abre o próprio pool só quando precisa do banco.
+    """
+    global _engine, _engine_pid
+    pid = os.getpid()
+    if _engine is None or _engine_pid != pid:
+        with _engine_lock:
+            if _engine is None:
+                _engine = build_engine(get_database_uri())
+            elif _engine_pid != pid:
+                # Engine herdado pelo fork: troca o pool sem fechar
+                # as conexões, que ainda pertencem ao processo pai
+                _engine.dispose(close=False)
+            _engine_pid = pid
+    return _engine
+
+
+def get_pool_stats() -> dict:
+    """Retorna as métricas do pool de conexões deste worker"""
+    if _engine is None or _engine_pid != os.getpid():
+        return {"message": "Engine ainda não foi criado"}
+    pool = _engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.get_stats()
+    return {"status": pool.status()}
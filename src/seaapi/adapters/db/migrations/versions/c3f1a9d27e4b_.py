@@ -0,0 +1,55 @@
+"""search indexes
+
+Revision ID: c3f1a9d27e4b
+Revises: 76735a40b3f2
+Create Date: 2026-10-17 10:12:41.537214
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c3f1a9d27e4b"
+down_revision = "76735a40b3f2"
+branch_labels = None
+depends_on = None
+
+# Índices de expressão não são detectados pelo autogenerate; as
+# expressões precisam bater com as geradas em filter_plans.py
+TRIGRAM_INDEXES = [
+    ("ix_users_first_name_trgm", "users", "first_name"),
+    ("ix_users_last_name_trgm", "users", "last_name"),
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_scales_name_trgm", "scales", "name"),
+    ("ix_scales_serial_trgm", "scales", "serial"),
+]
+
+
+def is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not is_postgres():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin (lower({column}) gin_trgm_ops)"
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_foods_search_tsv "
+        "ON foods USING gin (to_tsvector('simple', "
+        "coalesce(name, '') || ' ' || coalesce(description, '')))"
+    )
+
+
+def downgrade() -> None:
+    if not is_postgres():
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_foods_search_tsv")
+    for name, _, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -11,6 +11,9 @@ from src.seaapi.adapters.entrypoints.api.v1 import (
     qrcode,
     user_food,
     rate_limit,
+    storage,
+    hashing,
+    database,
 )
 
 api_router = APIRouter(prefix="/v1")
@@ -82,3 +85,21 @@ api_router.include_router(
     prefix="/rate-limit",
     tags=["System/Rate Limiting"],
 )
+
+api_router.include_router(
+    storage.router,
+    prefix="/storage",
+    tags=["System/Storage"],
+)
+
+api_router.include_router(
+    hashing.router,
+    prefix="/hashing",
+    tags=["System/Hashing"],
+)
+
+api_router.include_router(
+    database.router,
+    prefix="/database",
+    tags=["System/Database"],
+)
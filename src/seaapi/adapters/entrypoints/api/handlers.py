@@ -38,6 +38,7 @@ def register_handlers(app):
 
     @app.exception_handler(CustomException)
     async def http_custom_exception_handler(request, exc):
+        retry_after = getattr(exc, "retry_after", None)
         return JSONResponse(
             content={
                 "message": exc.detail,
@@ -45,6 +46,9 @@ def register_handlers(app):
                 "status_code": exc.status_code,
             },
             status_code=exc.status_code,
+            headers={"Retry-After": str(retry_after)}
+            if retry_after is not None
+            else None,
         )
 
     @app.exception_handler(Exception)
@@ -0,0 +1,96 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+from src.seaapi.domain.shared.etags import (
+    compute_etag,
+    etag_matches,
+)
+
+# Cabeçalhos que não acompanham uma resposta 304
+ENTITY_HEADERS = ("content-length", "content-type")
+
+
+class ConditionalGetMiddleware:
+    """
+    Adiciona ETag às respostas JSON de GET com status 200 e responde
+    304 quando o cliente já tem a mesma versão. Rotas que definem o
+    próprio ETag, como o cardápio, e respostas em streaming, sem
+    Content-Length, são repassadas sem alteração.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get(
+            "if-none-match"
+        )
+        start_message: Message = None
+        chunks = []
+        buffering = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, buffering
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                buffering = (
+                    message["status"] == 200
+                    and "etag" not in headers
+                    and "content-length" in headers
+                    and headers.get(
+                        "content-type", ""
+                    ).startswith("application/json")
+                    and "no-store"
+                    not in headers.get("cache-control", "")
+                )
+                if buffering:
+                    start_message = message
+                    return
+                await send(message)
+                return
+
+            if (
+                not buffering
+                or message["type"] != "http.response.body"
+            ):
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = compute_etag(body)
+            headers = MutableHeaders(
+                raw=start_message["headers"]
+            )
+            headers["etag"] = etag
+
+            if etag_matches(if_none_match, etag):
+                for header in ENTITY_HEADERS:
+                    del headers[header]
+                start_message["status"] = 304
+                body = b""
+
+            await send(start_message)
+            await send(
+                {"type": "http.response.body", "body": body}
+            )
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,22 +1,29 @@
+from typing import Mapping, Optional
 from fastapi import Request, UploadFile, File
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.authentication import (
     AuthenticationBackend,
 )
-from jose import JWTError
-from src.seaapi.domain.shared.security import decode_jwt
+from src.seaapi.domain.shared.security import (
+    TokenVerifier,
+    token_verifier,
+)
 from src.seaapi.domain.ports.shared.exceptions import (
     ExpiredTokenException,
 )
 from src.seaapi.domain.ports.use_cases.users import (
     UserServiceInterface,
 )
-from src.seaapi.domain.entities import UserEntity
+from src.seaapi.domain.entities import UserEntity, Principal
 from src.seaapi.domain.shared.validators import (
     VideoFile,
 )
 
 
 class BearerTokenAuthBackend(AuthenticationBackend):
+    def __init__(self, verifier: TokenVerifier = None):
+        self.verifier = verifier or token_verifier
+
     async def authenticate(self, request: Request):
         if "Authorization" not in request.headers:
             return
@@ -24,9 +31,12 @@ class BearerTokenAuthBackend(AuthenticationBackend):
         auth = request.headers["Authorization"]
         try:
             scheme, token = auth.split()
-            if scheme != "Bearer" or not self.verify_jwt(
-                token
-            ):  # pragma: no cover
+            payload = (
+                self.verify_jwt(token)
+                if scheme == "Bearer"
+                else None
+            )
+            if not payload:  # pragma: no cover
                 raise ExpiredTokenException()
 
         except Exception:  # pragma: no cover
@@ -37,30 +47,25 @@ class BearerTokenAuthBackend(AuthenticationBackend):
         user_service: UserServiceInterface = (
             container.user_service()
         )
-        user_id = self.payload.get("user_id", 0)
+        user_id = payload.get("user_id", 0)
 
-        user = user_service.get_user(
-            id_=user_id, entity=True
+        # O cache e o banco são síncronos; fora do event loop, um
+        # Redis ou banco lento não trava as demais requisições
+        user = await run_in_threadpool(
+            user_service.get_principal, user_id
         )
 
         return auth, user
 
     def verify_jwt(
         self, token: str, token_type: str = "access"
-    ) -> bool:
-        try:
-            self.payload = decode_jwt(token)
-        except JWTError:
-            self.payload = None
-        if not self.payload:
-            return False
-
-        return self.payload.get("type", "") == token_type
+    ) -> Optional[Mapping]:
+        return self.verifier.verify(token, token_type)
 
 
 def get_user(
     request: Request,
-) -> UserEntity:
+) -> Principal:
     return request.user
 
 
@@ -9,7 +9,7 @@ from starlette.authentication import (
     UnauthenticatedUser,
 )
 from src.seaapi.domain.entities import (
-    UserEntity,
+    Principal,
 )
 from src.seaapi.domain import Role
 
@@ -77,7 +77,7 @@ class HasObjectPermission(BasePermission):
         self.resource = resource
 
     def check_permission(self, request: Request):
-        user: UserEntity = request.user
+        user: Principal = request.user
 
         return user.has_permission(
             f"{self.action}_{self.resource}"
@@ -1,21 +1,71 @@
-from typing import Optional, Callable, Dict
+import logging
+from typing import Optional, Callable, Dict, Tuple
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
 from src.seaapi.domain.ports.services.rate_limiter import (
     RateLimiterInterface,
 )
 
+logger = logging.getLogger(__name__)
+
+# Caminhos que não casam com nenhuma rota compartilham uma única chave,
+# para que varreduras de URL não criem um limite por caminho
+UNMATCHED_PATH = "*"
+
+
+class RouteTable:
+    """
+    Resolve o caminho da requisição para o template da rota
+    (/v1/foods/42 -> /v1/foods/{id}). Rotas sem parâmetros são
+    resolvidas por dicionário; as demais, pelas regex do roteador.
+    """
+
+    def __init__(self, routes):
+        self.static: Dict[str, str] = {}
+        self.dynamic = []
+        for route in routes:
+            path_format = getattr(
+                route, "path_format", None
+            )
+            path_regex = getattr(route, "path_regex", None)
+            if path_format is None or path_regex is None:
+                continue
+            if "{" in path_format:
+                self.dynamic.append(
+                    (path_regex, path_format)
+                )
+            else:
+                self.static.setdefault(
+                    path_format, path_format
+                )
+
+    def resolve(self, path: str) -> str:
+        template = self.static.get(path)
+        if template is not None:
+            return template
+        for path_regex, path_format in self.dynamic:
+            if path_regex.match(path):
+                return path_format
+        return UNMATCHED_PATH
+
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    Middleware de rate limiting para FastAPI
+    Middleware ASGI de rate limiting para FastAPI
     Aplica limites de requisições baseados em diferentes estratégias
     """
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         rate_limiter: RateLimiterInterface,
         default_max_requests: int = 100,
         default_window_seconds: int = 3600,  # 1 hora
@@ -27,99 +77,112 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             Dict[str, Dict[str, int]]
         ] = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.rate_limiter = rate_limiter
         self.default_max_requests = default_max_requests
         self.default_window_seconds = default_window_seconds
-        self.identifier_func = (
-            identifier_func or self._default_identifier
+        self.identifier_func = identifier_func
+        self.exempt_endpoints = frozenset(
+            exempt_endpoints or []
         )
-        self.exempt_endpoints = exempt_endpoints or []
         self.custom_limits = custom_limits or {}
+        self._route_table: Optional[RouteTable] = None
+        # (método, template) -> (chave, isento, limite, janela)
+        self._policies: Dict[
+            Tuple[str, str], Tuple[str, bool, int, int]
+        ] = {}
 
-    def _default_identifier(self, request: Request) -> str:
+    def _default_identifier(self, scope: Scope) -> str:
         """
         Identificador padrão baseado em usuário autenticado ou IP
         """
         # Prioriza usuário autenticado
-        if (
-            hasattr(request, "user")
-            and request.user
-            and hasattr(request.user, "id")
-        ):
-            return f"user:{request.user.id}"
+        user = scope.get("user")
+        if user and hasattr(user, "id"):
+            return f"user:{user.id}"
 
         # Fallback para IP
-        client_ip = self._get_client_ip(request)
+        client_ip = self._get_client_ip(scope)
         return f"ip:{client_ip}"
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope: Scope) -> str:
         """Extrai o IP do cliente considerando proxies"""
+        headers = Headers(scope=scope)
         # Verifica headers de proxy
-        forwarded_for = request.headers.get(
-            "X-Forwarded-For"
-        )
+        forwarded_for = headers.get("x-forwarded-for")
         if forwarded_for:
             return forwarded_for.split(",")[0].strip()
 
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
         # IP direto
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
 
         return "unknown"
 
-    def _get_endpoint_key(self, request: Request) -> str:
-        """Gera chave única para o endpoint"""
-        method = request.method
-        path = request.url.path
-        return f"{method}:{path}"
-
-    def _get_limits_for_endpoint(
-        self, endpoint: str
-    ) -> tuple:
-        """Retorna os limites específicos para um endpoint"""
-        if endpoint in self.custom_limits:
-            limits = self.custom_limits[endpoint]
-            return limits.get(
-                "max_requests", self.default_max_requests
-            ), limits.get(
-                "window_seconds",
-                self.default_window_seconds,
+    def _get_policy(
+        self, scope: Scope
+    ) -> Tuple[str, bool, int, int]:
+        """
+        Retorna a chave do endpoint, se ele é isento e os limites,
+        calculados uma única vez por método e template de rota
+        """
+        if self._route_table is None:
+            self._route_table = RouteTable(
+                scope["app"].routes
             )
+        method = scope["method"]
+        template = self._route_table.resolve(scope["path"])
 
-        return (
-            self.default_max_requests,
-            self.default_window_seconds,
-        )
-
-    def _should_exempt(self, request: Request) -> bool:
-        """Verifica se o endpoint deve ser isento do rate limiting"""
-        endpoint = self._get_endpoint_key(request)
-        return any(
-            exempt in endpoint
-            for exempt in self.exempt_endpoints
-        )
+        policy = self._policies.get((method, template))
+        if policy is None:
+            endpoint = f"{method}:{template}"
+            limits = self.custom_limits.get(endpoint, {})
+            policy = (
+                endpoint,
+                endpoint in self.exempt_endpoints,
+                limits.get(
+                    "max_requests",
+                    self.default_max_requests,
+                ),
+                limits.get(
+                    "window_seconds",
+                    self.default_window_seconds,
+                ),
+            )
+            self._policies[(method, template)] = policy
+        return policy
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ):
         """Processa a requisição aplicando rate limiting"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Verifica se deve aplicar rate limiting
-        if self._should_exempt(request):
-            return await call_next(request)
-
-        # Identifica o cliente
-        identifier = self.identifier_func(request)
-        endpoint = self._get_endpoint_key(request)
-
-        # Obtém limites para o endpoint
         (
+            endpoint,
+            exempt,
             max_requests,
             window_seconds,
-        ) = self._get_limits_for_endpoint(endpoint)
+        ) = self._get_policy(scope)
+
+        # Verifica se deve aplicar rate limiting
+        if exempt:
+            await self.app(scope, receive, send)
+            return
+
+        # Identifica o cliente
+        identifier = (
+            self.identifier_func(Request(scope))
+            if self.identifier_func
+            else self._default_identifier(scope)
+        )
 
         try:
             # Verifica rate limit
@@ -132,68 +195,109 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 window_seconds=window_seconds,
                 endpoint=endpoint,
             )
-
-            if not allowed:
-                # Retorna erro 429 (Too Many Requests)
-                headers = {
-                    "X-RateLimit-Limit": str(max_requests),
-                    "X-RateLimit-Window": str(
-                        window_seconds
+        except Exception as e:
+            logger.warning(f"Rate limiter error: {e}")
+            await self.app(
+                scope,
+                receive,
+                self._with_headers(
+                    send,
+                    (
+                        (
+                            b"x-ratelimit-error",
+                            b"rate_limiter_unavailable",
+                        ),
                     ),
-                    "X-RateLimit-Remaining": "0",
+                ),
+            )
+            return
+
+        if not allowed and info.get("error"):
+            # Backend indisponível com fail_open desligado
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "error": info["error"],
+                    "message": "Serviço temporariamente indisponível",
+                },
+                headers={
                     "Retry-After": str(
-                        info.get(
-                            "retry_after", window_seconds
-                        )
-                    ),
-                }
-
-                error_response = {
-                    "error": "rate_limit_exceeded",
-                    "message": f"Limite de {max_requests} requisições por "
-                    f"{window_seconds} segundos excedido",
-                    "details": {
-                        "current_requests": info.get(
-                            "current_requests", 0
-                        ),
-                        "max_requests": max_requests,
-                        "window_seconds": window_seconds,
-                        "reset_time": info.get(
-                            "reset_time"
-                        ),
-                        "retry_after": info.get(
-                            "retry_after"
-                        ),
-                    },
-                }
+                        info.get("retry_after", 1)
+                    )
+                },
+            )
+            await response(scope, receive, send)
+            return
 
-                return JSONResponse(
-                    status_code=429,
-                    content=error_response,
-                    headers=headers,
-                )
+        if not allowed:
+            # Retorna erro 429 (Too Many Requests)
+            headers = {
+                "X-RateLimit-Limit": str(max_requests),
+                "X-RateLimit-Window": str(window_seconds),
+                "X-RateLimit-Remaining": "0",
+                "Retry-After": str(
+                    info.get("retry_after", window_seconds)
+                ),
+            }
 
-            # Processa a requisição
-            response = await call_next(request)
+            error_response = {
+                "error": "rate_limit_exceeded",
+                "message": f"Limite de {max_requests} requisições por "
+                f"{window_seconds} segundos excedido",
+                "details": {
+                    "current_requests": info.get(
+                        "current_requests", 0
+                    ),
+                    "max_requests": max_requests,
+                    "window_seconds": window_seconds,
+                    "reset_time": info.get("reset_time"),
+                    "retry_after": info.get("retry_after"),
+                },
+            }
 
-            # Adiciona headers informativos
-            response.headers["X-RateLimit-Limit"] = str(
-                max_requests
-            )
-            response.headers["X-RateLimit-Window"] = str(
-                window_seconds
-            )
-            response.headers["X-RateLimit-Remaining"] = str(
-                info.get("remaining_requests", 0)
+            response = JSONResponse(
+                status_code=429,
+                content=error_response,
+                headers=headers,
             )
+            await response(scope, receive, send)
+            return
 
-            return response
+        # Processa a requisição adicionando headers informativos
+        await self.app(
+            scope,
+            receive,
+            self._with_headers(
+                send,
+                (
+                    (
+                        b"x-ratelimit-limit",
+                        str(max_requests).encode(),
+                    ),
+                    (
+                        b"x-ratelimit-window",
+                        str(window_seconds).encode(),
+                    ),
+                    (
+                        b"x-ratelimit-remaining",
+                        str(
+                            info.get(
+                                "remaining_requests", 0
+                            )
+                        ).encode(),
+                    ),
+                ),
+            ),
+        )
 
-        except Exception as e:
+    @staticmethod
+    def _with_headers(send: Send, headers) -> Send:
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    *headers,
+                ]
+            await send(message)
 
-            print(f"Rate limiter error: {e}")
-            response = await call_next(request)
-            response.headers[
-                "X-RateLimit-Error"
-            ] = "rate_limiter_unavailable"
-            return response
+        return send_wrapper
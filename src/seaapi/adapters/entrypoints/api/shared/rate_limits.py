@@ -0,0 +1,50 @@
+# Limites por endpoint, no formato "MÉTODO:template da rota", usados
+# pelo RateLimitMiddleware e pelo /v1/rate-limit/my-status
+CUSTOM_LIMITS = {
+    "POST:/v1/auth/login": {
+        "max_requests": 5,
+        "window_seconds": 300,
+    },
+    "POST:/v1/auth/refresh": {
+        "max_requests": 10,
+        "window_seconds": 300,
+    },
+    "POST:/v1/foods": {
+        "max_requests": 20,
+        "window_seconds": 3600,
+    },
+    "POST:/v1/foods/calculate-nutrition": {
+        "max_requests": 5,
+        "window_seconds": 120,
+    },
+    "PUT:/v1/foods/{id}": {
+        "max_requests": 30,
+        "window_seconds": 3600,
+    },
+    "DELETE:/v1/foods/{id}": {
+        "max_requests": 10,
+        "window_seconds": 3600,
+    },
+    "GET:/v1/foods": {
+        "max_requests": 200,
+        "window_seconds": 3600,
+    },
+    "GET:/v1/auth/me": {
+        "max_requests": 100,
+        "window_seconds": 3600,
+    },
+    "GET:/v1/auth/meals/current": {
+        "max_requests": 100,
+        "window_seconds": 60,
+    },
+}
+
+# Endpoints que não passam pelo rate limiting
+EXEMPT_ENDPOINTS = [
+    "GET:/docs",
+    "GET:/docs/oauth2-redirect",
+    "GET:/redoc",
+    "GET:/openapi.json",
+    "GET:/health",
+    "GET:/v1/auth/jwks.json",
+]
@@ -0,0 +1,34 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.seaapi.adapters.unit_of_works.shared import (
+    SessionScope,
+    current_session_scope,
+)
+
+
+class SessionScopeMiddleware:
+    """
+    Middleware ASGI que abre um escopo de sessão por requisição: todas
+    as unidades de trabalho resolvidas durante a requisição, inclusive
+    na autenticação, usam a mesma sessão e a mesma conexão do pool
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_scope = SessionScope()
+        token = current_session_scope.set(session_scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_session_scope.reset(token)
+            if session_scope.session is not None:
+                # Devolver a conexão ao pool faz um rollback no banco
+                await run_in_threadpool(session_scope.close)
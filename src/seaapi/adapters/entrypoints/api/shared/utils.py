@@ -1,7 +1,4 @@
 from fastapi import UploadFile
-from src.seaapi.domain.shared.file import (
-    bytes_to_named_temporary_file,
-)
 from src.seaapi.domain.ports.shared.exceptions import (
     FileBadFormatException,
 )
@@ -11,17 +8,16 @@ from src.seaapi.domain.dtos.mics import UploadedFile
 def convert_upload_file_to_domain(
     upload_file: UploadFile,
 ) -> UploadedFile:
+    """
+    Repassa o arquivo temporário do próprio UploadFile, sem ler o
+    conteúdo para a memória, para que o storage envie em streaming
+    """
     try:
-        content = upload_file.file.read()
-        filename = upload_file.filename
-        relative_path = bytes_to_named_temporary_file(
-            content, filename
-        )
+        upload_file.file.seek(0)
 
         return UploadedFile(
-            content=content,
-            filename=filename,
-            relative_path=relative_path,
+            filename=upload_file.filename,
+            file=upload_file.file,
         )
     except Exception as e:  # pragma: no cover
         print(e)
@@ -8,12 +8,15 @@ from fastapi import (
     Depends,
     Request,
     BackgroundTasks,
+    Response,
 )
 from fastapi.security import HTTPBearer
 from src.seaapi.domain.ports.use_cases.users import (
     UserServiceInterface,
 )
 from src.seaapi.config.containers import Container
+from src.seaapi.config.settings import settings
+from src.seaapi.domain.shared.security import get_jwks
 from src.seaapi.domain.dtos.tokens import Tokens
 from src.seaapi.domain.dtos.users import (
     UserLoginInputDto,
@@ -141,3 +144,19 @@ def password_recover(
         dto=dto,
         token=token,
     )
+
+
+@router.get("/jwks.json")
+def jwks():
+    """
+    Chaves públicas que assinam os tokens (ES256/EdDSA), para que
+    outros serviços os verifiquem sem o segredo nem chamadas à API
+    """
+    return Response(
+        content=get_jwks(),
+        media_type="application/json",
+        headers={
+            "Cache-Control": "public, max-age="
+            + str(settings.JWT_JWKS_CACHE_SECONDS)
+        },
+    )
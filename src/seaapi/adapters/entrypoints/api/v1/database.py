@@ -0,0 +1,34 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+)
+from fastapi.security import HTTPBearer
+from src.seaapi.adapters.db.engine import get_pool_stats
+from src.seaapi.adapters.entrypoints.api.shared.permissions import (
+    PermissionsDependency,
+    And,
+    IsAuthenticated,
+    IsAdministrator,
+)
+
+router = APIRouter()
+auth_scheme = HTTPBearer()
+
+
+@router.get(
+    "/stats",
+    dependencies=[
+        Depends(
+            PermissionsDependency(
+                And([IsAuthenticated(), IsAdministrator()])
+            )
+        ),
+        Depends(auth_scheme),
+    ],
+)
+def get_database_stats():
+    """
+    Retorna ocupação, esperas e timeouts do pool de conexões deste
+    worker. Apenas administradores podem acessar
+    """
+    return {"stats": get_pool_stats()}
@@ -77,7 +77,7 @@ auth_scheme = HTTPBearer()
     ],
 )
 @inject
-def create(
+async def create(
     photo: Optional[UploadFile],
     name: str = Form(),
     description: Optional[str] = Form(None),
@@ -89,7 +89,7 @@ def create(
         Provide[Container.food_service]
     ),
 ):
-    return food_service.create(
+    return await food_service.create(
         FoodCreateInputDto(
             name=name,
             description=description,
@@ -174,7 +174,7 @@ def get_food(
     ],
 )
 @inject
-def edit_food(
+async def edit_food(
     id: int,
     background_tasks: BackgroundTasks,
     name: Optional[str] = Form(None),
@@ -211,7 +211,7 @@ def edit_food(
         k: v for k, v in raw.items() if v is not None
     }
 
-    return food_service.update_food(
+    return await food_service.update_food(
         id,
         FoodUpdateInputDto(**update_data),
         background_tasks,
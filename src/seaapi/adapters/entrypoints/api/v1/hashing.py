@@ -0,0 +1,46 @@
+from dependency_injector.wiring import (
+    Provide,
+    inject,
+)
+from fastapi import (
+    APIRouter,
+    Depends,
+)
+from fastapi.security import HTTPBearer
+from src.seaapi.config.containers import Container
+from src.seaapi.domain.ports.services.hashing import (
+    PasswordHasherInterface,
+)
+from src.seaapi.adapters.entrypoints.api.shared.permissions import (
+    PermissionsDependency,
+    And,
+    IsAuthenticated,
+    IsAdministrator,
+)
+
+router = APIRouter()
+auth_scheme = HTTPBearer()
+
+
+@router.get(
+    "/stats",
+    dependencies=[
+        Depends(
+            PermissionsDependency(
+                And([IsAuthenticated(), IsAdministrator()])
+            )
+        ),
+        Depends(auth_scheme),
+    ],
+)
+@inject
+def get_hashing_stats(
+    password_hasher: PasswordHasherInterface = Depends(
+        Provide[Container.password_hasher]
+    ),
+):
+    """
+    Retorna a fila e as recusas do serviço de hashing de senhas
+    deste worker. Apenas administradores podem acessar
+    """
+    return {"stats": password_hasher.get_stats()}
@@ -12,6 +12,9 @@ from src.seaapi.config.containers import Container
 from src.seaapi.domain.ports.services.rate_limiter import (
     RateLimiterInterface,
 )
+from src.seaapi.adapters.entrypoints.api.shared.rate_limits import (
+    CUSTOM_LIMITS,
+)
 from src.seaapi.adapters.entrypoints.api.shared.permissions import (
     PermissionsDependency,
     And,
@@ -35,7 +38,7 @@ auth_scheme = HTTPBearer()
     ],
 )
 @inject
-def get_rate_limit_stats(
+async def get_rate_limit_stats(
     rate_limiter: RateLimiterInterface = Depends(
         Provide[Container.rate_limiter]
     ),
@@ -44,17 +47,9 @@ def get_rate_limit_stats(
     Retorna estatísticas do rate limiter
     Apenas administradores podem acessar
     """
-    if hasattr(rate_limiter, "get_stats"):
-        return {
-            "rate_limiting_enabled": True,
-            "stats": rate_limiter.get_stats(),
-        }
-
     return {
         "rate_limiting_enabled": True,
-        "stats": {
-            "message": "Estatísticas não disponíveis para este backend"
-        },
+        "stats": await rate_limiter.get_stats(),
     }
 
 
@@ -125,46 +120,33 @@ async def get_my_rate_limit_status(
         )
         identifier = f"ip:{client_ip}"
 
-    # Testa diferentes endpoints comuns para mostrar status
-    endpoints_to_check = [
-        ("POST:/v1/foods", 20, 3600),
-        ("GET:/v1/foods", 200, 3600),
-        ("POST:/v1/auth/refresh", 10, 300),
-    ]
-
-    status = {"identifier": identifier, "endpoints": {}}
-
-    for endpoint, max_req, window in endpoints_to_check:
-        allowed, info = await rate_limiter.is_allowed(
-            identifier=identifier,
-            max_requests=max_req,
-            window_seconds=window,
-            endpoint=endpoint,
-        )
-
-        # "Desfaz" a verificação se foi permitida (para não contar como uso real)
-        if allowed and hasattr(rate_limiter, "_requests"):
-            # Para MemoryRateLimiter, remove a última entrada
-            key = f"{identifier}:{endpoint}"
-            if (
-                key in rate_limiter._requests
-                and rate_limiter._requests[key]
-            ):
-                rate_limiter._requests[key].pop()
-
-        status["endpoints"][endpoint] = {
-            "currently_allowed": allowed,
-            "current_requests": info.get(
-                "current_requests", 0
-            ),
-            "max_requests": max_req,
-            "window_seconds": window,
-            "remaining_requests": info.get(
-                "remaining_requests", 0
-            ),
-            "reset_time": info.get("reset_time")
-            if not allowed
-            else None,
-        }
+    # Consulta todos os limites configurados sem consumir a cota
+    statuses = await rate_limiter.status(
+        identifier,
+        {
+            endpoint: (
+                limits["max_requests"],
+                limits["window_seconds"],
+            )
+            for endpoint, limits in CUSTOM_LIMITS.items()
+        },
+    )
 
-    return status
+    return {
+        "identifier": identifier,
+        "endpoints": {
+            endpoint: {
+                "currently_allowed": info["allowed"],
+                "current_requests": info.get(
+                    "current_requests", 0
+                ),
+                "max_requests": info["max_requests"],
+                "window_seconds": info["window_seconds"],
+                "remaining_requests": info.get(
+                    "remaining_requests", 0
+                ),
+                "reset_time": info.get("reset_time"),
+            }
+            for endpoint, info in statuses.items()
+        },
+    }
@@ -0,0 +1,53 @@
+from dependency_injector.wiring import (
+    Provide,
+    inject,
+)
+from fastapi import (
+    APIRouter,
+    Depends,
+)
+from fastapi.security import HTTPBearer
+from src.seaapi.config.containers import Container
+from src.seaapi.domain.ports.services.storage import (
+    StorageServiceInterface,
+)
+from src.seaapi.adapters.entrypoints.api.shared.permissions import (
+    PermissionsDependency,
+    And,
+    IsAuthenticated,
+    IsAdministrator,
+)
+
+router = APIRouter()
+auth_scheme = HTTPBearer()
+
+
+@router.get(
+    "/stats",
+    dependencies=[
+        Depends(
+            PermissionsDependency(
+                And([IsAuthenticated(), IsAdministrator()])
+            )
+        ),
+        Depends(auth_scheme),
+    ],
+)
+@inject
+def get_storage_stats(
+    storage_service: StorageServiceInterface = Depends(
+        Provide[Container.storage_service]
+    ),
+):
+    """
+    Retorna estatísticas do cache de URLs pré-assinadas
+    Apenas administradores podem acessar
+    """
+    if hasattr(storage_service, "get_stats"):
+        return {"stats": storage_service.get_stats()}
+
+    return {
+        "stats": {
+            "message": "Estatísticas não disponíveis para este backend"
+        },
+    }
@@ -5,6 +5,8 @@ from dependency_injector.wiring import (
 from fastapi import (
     APIRouter,
     Depends,
+    Request,
+    Response,
 )
 from fastapi.security import HTTPBearer
 from src.seaapi.domain.ports.use_cases.foods import (
@@ -15,6 +17,7 @@ from src.seaapi.config.containers import Container
 from src.seaapi.domain.dtos.foods import (
     FoodPaginationData,
 )
+from src.seaapi.domain.shared.etags import etag_matches
 from src.seaapi.adapters.entrypoints.api.shared.permissions import (
     PermissionsDependency,
     And,
@@ -38,9 +41,28 @@ auth_scheme = HTTPBearer()
 )
 @inject
 def get_current_menu(
+    request: Request,
     food_service: FoodServiceInterface = Depends(
         Provide[Container.food_service]
     ),
 ):
+    """
+    Serve o cardápio já serializado do cache; o ETag permite que os
+    clientes que fazem polling recebam 304 enquanto nada mudar
+    """
+    menu = food_service.get_current_menu_payload()
+    headers = {
+        "ETag": menu.etag,
+        "Cache-Control": "no-cache",
+    }
 
-    return food_service.get_current_menu()
+    if etag_matches(
+        request.headers.get("if-none-match"), menu.etag
+    ):
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=menu.body,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -16,8 +16,8 @@ from src.seaapi.domain.ports.use_cases.meals import (
 )
 
 from src.seaapi.config.containers import Container
-from src.seaapi.domain.entities.user_entity import (
-    UserEntity,
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
 )
 from src.seaapi.domain.dtos.meals import (
     MealOutputDto,
@@ -53,7 +53,7 @@ def get_user_meals(
     meal_service: MealServiceInterface = Depends(
         Provide[Container.meal_service]
     ),
-    user: UserEntity = Depends(get_user),
+    user: Principal = Depends(get_user),
 ):
     user_id = user.id
     return meal_service.get_user_meals(
@@ -76,7 +76,7 @@ def get_current_meal(
     meal_service: MealServiceInterface = Depends(
         Provide[Container.meal_service]
     ),
-    user: UserEntity = Depends(get_user),
+    user: Principal = Depends(get_user),
 ):
     user_id = user.id
     return meal_service.get_current_meal(user_id=user_id)
@@ -104,7 +104,7 @@ def get_user_meal(
     meal_service: MealServiceInterface = Depends(
         Provide[Container.meal_service]
     ),
-    user: UserEntity = Depends(get_user),
+    user: Principal = Depends(get_user),
 ):
     user_id = user.id if user else None
     return meal_service.get_user_meal(
@@ -135,7 +135,7 @@ def initialize_meal(
     meal_service: MealServiceInterface = Depends(
         Provide[Container.meal_service]
     ),
-    user: UserEntity = Depends(get_user),
+    user: Principal = Depends(get_user),
 ):
     user_id = user.id if user else None
     return meal_service.initialize_meal(meal, user_id)
@@ -16,6 +16,7 @@ from src.seaapi.config import (
 from src.seaapi.config.containers import (
     Container,
 )
+from src.seaapi.domain.shared.hash import Hasher
 from src.seaapi.adapters.entrypoints.api.handlers import (
     register_handlers,
 )
@@ -25,6 +26,16 @@ from src.seaapi.adapters.entrypoints.api.shared.middlewares import (
 from src.seaapi.adapters.entrypoints.api.shared.rate_limit_middleware import (
     RateLimitMiddleware,
 )
+from src.seaapi.adapters.entrypoints.api.shared.rate_limits import (
+    CUSTOM_LIMITS,
+    EXEMPT_ENDPOINTS,
+)
+from src.seaapi.adapters.entrypoints.api.shared.conditional_get_middleware import (
+    ConditionalGetMiddleware,
+)
+from src.seaapi.adapters.entrypoints.api.shared.session_middleware import (
+    SessionScopeMiddleware,
+)
 from starlette.middleware.authentication import (
     AuthenticationMiddleware,
 )
@@ -37,6 +48,9 @@ def include_router(app_):
 
 
 def register_middleware(app_):
+    if settings.CONDITIONAL_GET_ENABLED:
+        app_.add_middleware(ConditionalGetMiddleware)
+
     app_.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -48,58 +62,13 @@ def register_middleware(app_):
     if settings.RATE_LIMITING_ENABLED:
         rate_limiter = app_.container.rate_limiter()
 
-        custom_limits = {
-            "POST:/v1/auth/login": {
-                "max_requests": 5,
-                "window_seconds": 300,
-            },
-            "POST:/v1/auth/refresh": {
-                "max_requests": 10,
-                "window_seconds": 300,
-            },
-            "POST:/v1/foods": {
-                "max_requests": 20,
-                "window_seconds": 3600,
-            },
-            "POST:/v1/foods/calculate-nutrition": {
-                "max_requests": 5,
-                "window_seconds": 120,
-            },
-            "PUT:/v1/foods": {
-                "max_requests": 30,
-                "window_seconds": 3600,
-            },
-            "DELETE:/v1/foods": {
-                "max_requests": 10,
-                "window_seconds": 3600,
-            },
-            "GET:/v1/foods": {
-                "max_requests": 200,
-                "window_seconds": 3600,
-            },
-            "GET:/v1/auth/me": {
-                "max_requests": 100,
-                "window_seconds": 3600,
-            },
-            "GET:/v1/auth/meals/current": {
-                "max_requests": 100,
-                "window_seconds": 60,
-            },
-        }
-        exempt_endpoints = [
-            "GET:/docs",
-            "GET:/redoc",
-            "GET:/openapi.json",
-            "GET:/health",
-        ]
-
         app_.add_middleware(
             RateLimitMiddleware,
             rate_limiter=rate_limiter,
             default_max_requests=settings.RATE_LIMITING_DEFAULT_MAX_REQUESTS,
             default_window_seconds=settings.RATE_LIMITING_DEFAULT_WINDOW_SECONDS,
-            custom_limits=custom_limits,
-            exempt_endpoints=exempt_endpoints,
+            custom_limits=CUSTOM_LIMITS,
+            exempt_endpoints=EXEMPT_ENDPOINTS,
         )
 
     app_.add_middleware(
@@ -107,6 +76,9 @@ def register_middleware(app_):
         backend=BearerTokenAuthBackend(),
     )
 
+    # Por fora da autenticação, que também consulta o banco
+    app_.add_middleware(SessionScopeMiddleware)
+
 
 def setup_migrations():
     alembic_cfg = Config(
@@ -127,6 +99,7 @@ def start_application():
         version=settings.APP_VERSION,
     )
     app_.container = container
+    Hasher.use(container.password_hasher())
     include_router(app_)
     register_handlers(app_)
     register_middleware(app_)
@@ -7,6 +7,9 @@ from src.seaapi.domain.ports.services.messaging import (
     Message,
 )
 from src.seaapi.config.containers import Container
+from src.seaapi.adapters.unit_of_works.shared import (
+    session_scope,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -24,7 +27,9 @@ class BaseMessageHandler(MessageHandlerInterface):
             logger.info(
                 f"Processando mensagem do tópico: {message.topic}"
             )
-            await self.process_message(message)
+            # Uma sessão por mensagem, como nas requisições
+            with session_scope():
+                await self.process_message(message)
             logger.info(
                 f"Mensagem processada com sucesso: {message.message_id}"
             )
@@ -0,0 +1,231 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from sqlalchemy import or_, and_, not_, func
+from sqlalchemy.orm import noload
+from src.seaapi.domain.dtos.mics import Operator
+
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    Operator.IN.value: lambda attr, v: attr.in_(v),
+    Operator.NOT_IN.value: lambda attr, v: attr.notin_(v),
+    Operator.LTE.value: lambda attr, v: attr <= v,
+    Operator.LT.value: lambda attr, v: attr < v,
+    Operator.GTE.value: lambda attr, v: attr >= v,
+    Operator.GT.value: lambda attr, v: attr > v,
+    Operator.NOT.value: lambda attr, v: not_(attr == v),
+    Operator.EXACT.value: lambda attr, v: attr == v,
+}
+
+EQUALITY_TYPES = (int, bool, float, date, datetime)
+
+# Configuração de texto usada tanto na consulta quanto nos índices
+# criados pela migração; precisam ser idênticas para o índice servir
+FULLTEXT_CONFIG = "simple"
+
+
+@dataclass
+class FilterField:
+    name: str
+    attribute: Any
+    lowered: Any
+    mapper: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass
+class FilterPlan:
+    """
+    Representação compilada do Meta de uma entidade, montada uma
+    única vez por classe e reutilizada em todas as consultas
+    """
+
+    joins: Tuple[Any, ...]
+    options: Tuple[Any, ...]
+    composite_field: Optional[str]
+    composite_attribute: Any
+    search: Tuple[Any, ...]
+    search_backend: str
+    search_document: Any
+    filters: Tuple[FilterField, ...]
+
+    @classmethod
+    def compile(cls, entity) -> "FilterPlan":
+        meta = entity.Meta
+        composite_field = getattr(
+            meta, "composite_field", None
+        )
+        filter_mapper = getattr(meta, "filter_mapper", {})
+        search_fields = getattr(meta, "search", [])
+
+        filters = []
+        for field in getattr(meta, "filters", []):
+            attribute = getattr(entity, field, None)
+            if attribute is None:  # pragma: no cover
+                continue
+            mapper = filter_mapper.get(field)
+            filters.append(
+                FilterField(
+                    name=field,
+                    attribute=attribute,
+                    lowered=func.lower(attribute)
+                    if mapper is None
+                    else None,
+                    mapper=mapper,
+                )
+            )
+
+        return cls(
+            joins=tuple(getattr(meta, "joins", [])),
+            options=tuple(
+                noload(getattr(entity, field))
+                for field in getattr(meta, "no_load", [])
+            ),
+            composite_field=composite_field,
+            composite_attribute=getattr(
+                entity, composite_field
+            )
+            if composite_field
+            else None,
+            search=tuple(
+                func.lower(getattr(entity, field))
+                for field in search_fields
+            ),
+            search_backend=getattr(
+                meta, "search_backend", "like"
+            ),
+            search_document=cls._search_document(
+                entity, search_fields
+            ),
+            filters=tuple(filters),
+        )
+
+    @staticmethod
+    def _search_document(entity, search_fields):
+        if not search_fields:
+            return None
+        document = func.coalesce(
+            getattr(entity, search_fields[0]), ""
+        )
+        for field in search_fields[1:]:
+            document = (
+                document
+                + " "
+                + func.coalesce(getattr(entity, field), "")
+            )
+        return func.to_tsvector(FULLTEXT_CONFIG, document)
+
+    def search_clause(
+        self, search_query: str, dialect: str
+    ) -> Tuple[Any, Any]:
+        """
+        Retorna a cláusula de busca e, quando houver, a expressão de
+        relevância. O backend "fulltext" só vale no Postgres; nos
+        demais bancos a busca cai no LIKE.
+        """
+        if not self.search:
+            return None, None
+
+        if (
+            self.search_backend == "fulltext"
+            and dialect == "postgresql"
+        ):
+            terms = re.findall(r"\w+", search_query.lower())
+            if terms:
+                query = func.to_tsquery(
+                    FULLTEXT_CONFIG,
+                    " & ".join(
+                        f"{term}:*" for term in terms
+                    ),
+                )
+                return (
+                    self.search_document.op("@@")(query),
+                    func.ts_rank(
+                        self.search_document, query
+                    ),
+                )
+
+        # "like" e "trigram" geram o mesmo SQL; no Postgres os
+        # índices GIN com gin_trgm_ops atendem o LIKE '%termo%'
+        term = f"%{search_query.lower()}%"
+        return (
+            or_(
+                *[
+                    column.like(term)
+                    for column in self.search
+                ]
+            ),
+            None,
+        )
+
+    def filter_clauses(self, params) -> List[Any]:
+        clauses = []
+        for field in self.filters:
+            if not hasattr(params, field.name):
+                continue
+            clause = self._filter_clause(
+                field, getattr(params, field.name)
+            )
+            if clause is not None:
+                clauses.append(clause)
+        return clauses
+
+    @staticmethod
+    def _operation(field: FilterField, operator, value):
+        operation = OPERATORS.get(operator)
+        if operation is None:  # pragma: no cover
+            return True
+        return operation(field.attribute, value)
+
+    def _filter_clause(self, field: FilterField, value):
+        if field.mapper is not None:  # pragma: no cover
+            clause = field.mapper(value)
+            if type(clause) is tuple:
+                method, conditions = clause
+                return (
+                    or_(*conditions)
+                    if method == "or"
+                    else and_(*conditions)
+                )
+            elif type(clause) is list:
+                return and_(*clause)
+            return clause
+
+        value_type = type(value)
+        if value_type == str:
+            return field.lowered.like(f"%{value.lower()}%")
+        elif value_type == tuple:  # pragma: no cover
+            operator, v = value
+            return self._operation(field, operator, v)
+        elif value_type == dict:  # pragma: no cover
+            return and_(
+                *[
+                    self._operation(field, operator, v)
+                    for operator, v in value.items()
+                ]
+            )
+        elif value_type in EQUALITY_TYPES:
+            return field.attribute == value
+        return None
+
+
+_plans: Dict[type, FilterPlan] = {}
+
+
+def get_filter_plan(entity) -> FilterPlan:
+    """
+    Retorna o plano da entidade, compilando na primeira chamada.
+    Precisa rodar depois do mapeamento, quando os atributos da
+    classe já são colunas instrumentadas.
+    """
+    plan = _plans.get(entity)
+    if plan is None:
+        plan = FilterPlan.compile(entity)
+        _plans[entity] = plan
+    return plan
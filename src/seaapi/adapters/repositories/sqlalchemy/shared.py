@@ -1,14 +1,29 @@
-from sqlalchemy.orm import Session, noload
-from sqlalchemy import or_, and_, not_, func, desc, asc
+import json
+from sqlalchemy.orm import Session
+from sqlalchemy import (
+    func,
+    desc,
+    asc,
+    tuple_,
+)
 from typing import T, Tuple, List
-from datetime import date, datetime
 from src.seaapi.domain.ports.repositories import (
     BaseWriteableRepositoryInterface,
 )
 from src.seaapi.domain.dtos.mics import (
+    PageItems,
     PaginationParams,
     default_pagination_params,
-    Operator,
+)
+from src.seaapi.domain.ports.shared.exceptions import (
+    InvalidCursorException,
+)
+from src.seaapi.adapters.repositories.sqlalchemy.filter_plans import (
+    get_filter_plan,
+)
+from src.seaapi.domain.shared.cursors import (
+    resolve_order,
+    decode_cursor,
 )
 
 
@@ -93,202 +108,179 @@ class DefaultAlchemyRepository(
         search_query = params.search or ""
         page_size = params.page_size
         page = params.page
+        plan = get_filter_plan(self.entity)
 
         query = self.session.query(self.entity)
 
-        if hasattr(self.entity.Meta, "joins"):
-            for join in getattr(
-                self.entity.Meta, "joins", []
-            ):
-                query = query.outerjoin(join)
-
-        if hasattr(self.entity.Meta, "no_load"):
-            noload_items = []
-            for field in getattr(
-                self.entity.Meta, "no_load", []
-            ):
-                noload_items.append(
-                    getattr(self.entity, field)
-                )
-            query = query.options(
-                noload(item) for item in noload_items
-            )
+        for join in plan.joins:
+            query = query.outerjoin(join)
 
-        composite_field = None
-        if self.entity is not None and hasattr(
-            self.entity.Meta, "composite_field"
-        ):
-            composite_field = (
-                self.entity.Meta.composite_field
-            )
+        if plan.options:
+            query = query.options(*plan.options)
 
         if (
-            kwargs.get(composite_field, None) is not None
+            kwargs.get(plan.composite_field, None)
+            is not None
         ):  # pragma: no cover
-            composite_field_value = kwargs.get(
-                composite_field, None
-            )
             query = query.filter(
-                getattr(self.entity, composite_field)
-                == composite_field_value
+                plan.composite_attribute
+                == kwargs.get(plan.composite_field)
+            )
+
+        rank = None
+        if search_query:
+            clause, rank = plan.search_clause(
+                search_query,
+                self.session.get_bind().dialect.name,
             )
+            if clause is not None:
+                query = query.filter(clause)
 
-        if hasattr(self.entity.Meta, "search"):
-            clauses = [
-                func.lower(
-                    getattr(self.entity, field)
-                ).like(f"%{search_query.lower()}%")
-                for field in self.entity.Meta.search
-            ]
-            if len(clauses) > 0:
-                query = query.filter(or_(*clauses))
-
-        if hasattr(self.entity.Meta, "filters"):
-
-            def operator_mapper(
-                operator, attribute, value
-            ):  # pragma: no cover
-                if operator == Operator.IN.value:
-                    return getattr(
-                        self.entity, attribute
-                    ).in_(value)
-                elif operator == Operator.NOT_IN.value:
-                    return getattr(
-                        self.entity, attribute
-                    ).notin_(value)
-                elif operator == Operator.LTE.value:
-                    return (
-                        getattr(self.entity, attribute)
-                        <= value
-                    )
-                elif operator == Operator.LT.value:
-                    return (
-                        getattr(self.entity, attribute)
-                        < value
-                    )
-                elif operator == Operator.GTE.value:
-                    return (
-                        getattr(self.entity, attribute)
-                        >= value
-                    )
-                elif operator == Operator.GT.value:
-                    return (
-                        getattr(self.entity, attribute)
-                        > value
-                    )
-                elif operator == Operator.NOT.value:
-                    return not_(
-                        getattr(self.entity, attribute)
-                        == value
-                    )
-                elif operator == Operator.EXACT.value:
-                    return (
-                        getattr(self.entity, attribute)
-                        == value
-                    )
-                return True
-
-            def filter_mapper(field):  # pragma: no cover
-                is_valid_field = getattr(
-                    self.entity, field
-                ) and hasattr(params, field)
-                if is_valid_field:
-                    value = getattr(params, field)
-                    value_type = type(value)
-                    if hasattr(
-                        self.entity.Meta, "filter_mapper"
-                    ) and field in getattr(
-                        self.entity.Meta, "filter_mapper"
-                    ):
-                        mapper_func = getattr(
-                            self.entity.Meta,
-                            "filter_mapper",
-                        )
-                        clause = mapper_func[field](value)
-                        if type(clause) is tuple:
-                            method = clause[0]
-                            conditions = clause[1]
-                            return (
-                                or_(*conditions)
-                                if method == "or"
-                                else and_(*conditions)
-                            )
-                        elif type(clause) is list:
-                            return and_(*clause)
-                        else:
-                            return clause
-                    elif value_type == str:
-                        return func.lower(
-                            getattr(self.entity, field)
-                        ).like(f"%{value.lower()}%")
-                    elif value_type == tuple:
-                        operator, v = value
-                        return operator_mapper(
-                            operator=operator,
-                            value=v,
-                            attribute=field,
-                        )
-                    elif value_type == dict:
-                        operations = []
-                        for operator, v in value.items():
-                            operations.append(
-                                operator_mapper(
-                                    operator=operator,
-                                    value=v,
-                                    attribute=field,
-                                )
-                            )
-                        return and_(*operations)
-
-                    elif (
-                        value_type == int
-                        or value_type == bool
-                        or value_type == float
-                        or value_type == date
-                        or value_type == datetime
-                    ):
-                        return (
-                            getattr(self.entity, field)
-                            == value
-                        )
-                return None
-
-            clauses = [
-                filter_mapper(field)
-                for field in self.entity.Meta.filters
-            ]
-            clauses = [
-                clause
-                for clause in clauses
-                if clause is not None
-            ]
-
-            query = query.filter(and_(True, *clauses))
+        clauses = plan.filter_clauses(params)
+        if clauses:
+            query = query.filter(*clauses)
+
+        after = getattr(params, "after", None)
         if (
-            hasattr(params, "order")
-            and params.order != ""
-            and params.order is not None
+            rank is not None
+            and not getattr(params, "order", None)
+            and not after
         ):
-            order = params.order
-            field, direction = order.split(",")
-            if hasattr(self.entity, field):
-                field_attr = getattr(self.entity, field)
-
-                if direction.lower() == "asc":
-                    query = query.order_by(asc(field_attr))
-                elif direction.lower() == "desc":
-                    query = query.order_by(desc(field_attr))
-        else:
+            # Sem ordenação explícita a busca textual volta
+            # ordenada por relevância
+            query = query.order_by(rank.desc())
+
+        order = resolve_order(
+            getattr(params, "order", None)
+        )
+        field, direction = order.split(",")
+        direction = direction.lower()
+        sort = asc if direction == "asc" else desc
+        if hasattr(self.entity, field):
             query = query.order_by(
-                asc(getattr(self.entity, "id"))
+                sort(getattr(self.entity, field))
             )
-        results = query.count()
+            if field != "id":
+                # Desempate pelo id mantém a ordem estável
+                # entre páginas e permite a busca por cursor
+                query = query.order_by(
+                    sort(getattr(self.entity, "id"))
+                )
+
         if page is None:  # pragma: no cover
-            return query.all(), results
-        data = (
-            query.offset((page - 1) * page_size)
+            data = query.all()
+            return data, len(data)
+
+        count_mode = getattr(params, "count", "exact")
+        if count_mode == "window" and not after:
+            return self._find_page_with_total(
+                query, (page - 1) * page_size, page_size
+            )
+
+        results = None
+        if count_mode == "estimate":
+            results = self._estimate_count(query)
+        elif count_mode != "none":
+            results = query.count()
+
+        if after:
+            query = query.filter(
+                self._seek_clause(after, order)
+            )
+            # O total não diz se há linhas depois do cursor: a
+            # linha extra diz
+            page_items = self._find_page_items(
+                query, page_size
+            )
+            if results is None:
+                results = len(page_items)
+            return page_items, results
+
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+
+        if results is None or count_mode == "estimate":
+            # Sem contagem exata: uma linha extra basta para saber
+            # se existe próxima página
+            page_items = self._find_page_items(
+                query, page_size
+            )
+            if results is None:
+                results = offset + len(page_items)
+                results += int(page_items.has_next)
+            return page_items, results
+
+        return query.limit(page_size).all(), results
+
+    def _find_page_items(
+        self, query, page_size: int
+    ) -> PageItems:
+        data = query.limit(page_size + 1).all()
+        page_items = PageItems(data[:page_size])
+        page_items.has_next = len(data) > page_size
+        return page_items
+
+    def _find_page_with_total(
+        self, query, offset: int, page_size: int
+    ) -> Tuple[List[T], int]:
+        """
+        Busca a página e o total numa única ida ao banco usando
+        COUNT(*) OVER (), calculado antes do OFFSET/LIMIT
+        """
+        rows = (
+            query.add_columns(
+                func.count().over().label("total_results")
+            )
+            .offset(offset)
             .limit(page_size)
             .all()
         )
+        if not rows:
+            # Página além do fim: o total não vem junto das linhas
+            return [], query.count() if offset else 0
+        return [row[0] for row in rows], rows[0][1]
+
+    def _estimate_count(self, query) -> int:
+        """
+        Usa a estimativa de linhas do planner do Postgres no lugar
+        do COUNT(*). Em outros bancos faz a contagem exata.
+        """
+        bind = self.session.get_bind()
+        if bind.dialect.name != "postgresql":
+            return query.count()
+
+        compiled = query.order_by(None).statement.compile(
+            dialect=bind.dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        plan = (
+            self.session.connection()
+            .exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}",
+                compiled.params,
+            )
+            .scalar()
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _seek_clause(self, cursor: str, order: str):
+        field, direction, value, id_ = decode_cursor(
+            cursor, order
+        )
+        if not hasattr(self.entity, field):
+            raise InvalidCursorException()
+
+        id_attr = getattr(self.entity, "id")
+        if field == "id":
+            key, value = id_attr, id_
+        else:
+            key = tuple_(
+                getattr(self.entity, field), id_attr
+            )
+            value = tuple_(value, id_)
 
-        return data, results
+        if direction == "desc":
+            return key < value
+        return key > value
@@ -0,0 +1,12 @@
+from .redis_versioned_cache import (  # noqa: F401
+    RedisVersionedCache,
+)
+from .memory_versioned_cache import (  # noqa: F401
+    MemoryVersionedCache,
+)
+from .redis_principal_cache import (  # noqa: F401
+    RedisPrincipalCache,
+)
+from .memory_principal_cache import (  # noqa: F401
+    MemoryPrincipalCache,
+)
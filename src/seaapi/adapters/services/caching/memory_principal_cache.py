@@ -0,0 +1,124 @@
+import time
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
+from src.seaapi.domain.ports.services.cache import (
+    PrincipalCacheInterface,
+)
+
+
+class MemoryPrincipalCache(PrincipalCacheInterface):
+    """
+    Cache LRU com TTL dos usuários autenticados, um por processo. Com
+    vários workers a invalidação só alcança o processo que fez a
+    escrita, então o TTL limita por quanto tempo os demais podem usar
+    permissões antigas.
+
+    A versão de um usuário invalidado só é guardada por um TTL: depois
+    disso a entrada dele já expirou, e uma leitura iniciada antes da
+    invalidação que só grave depois fica sujeita ao mesmo TTL. As
+    versões vêm de um contador global e nunca se repetem.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: int = 60,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._generation = 0
+        # Só guarda usuários invalidados no último TTL, na ordem
+        # da invalidação: (versão, válida até)
+        self._user_versions: "OrderedDict[int, Tuple[int, float]]" = (
+            OrderedDict()
+        )
+        self._invalidations = itertools.count(1)
+        self._entries: "OrderedDict[int, Tuple[Tuple[int, int], Principal, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def version(
+        self, user_id: int
+    ) -> Optional[Tuple[int, int]]:
+        return self._local_version(user_id)
+
+    def _local_version(
+        self, user_id: int
+    ) -> Tuple[int, int]:
+        user_version = self._user_versions.get(user_id)
+        return (
+            self._generation,
+            user_version[0] if user_version else 0,
+        )
+
+    def _set_user_version(
+        self, user_id: int, user_version: int
+    ):
+        """
+        Registra a nova versão do usuário e descarta as que passaram
+        do TTL; deve ser chamado com o lock
+        """
+        now = time.monotonic()
+        self._user_versions.pop(user_id, None)
+        self._user_versions[user_id] = (
+            user_version,
+            now + self.ttl_seconds,
+        )
+        self._entries.pop(user_id, None)
+        while self._user_versions:
+            oldest, (_, valid_until) = next(
+                iter(self._user_versions.items())
+            )
+            if valid_until > now:
+                break
+            del self._user_versions[oldest]
+
+    def get(
+        self, user_id: int, version: Tuple[int, int]
+    ) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            entry_version, principal, valid_until = entry
+            if (
+                entry_version != version
+                or valid_until <= time.monotonic()
+            ):
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def put(
+        self, version: Tuple[int, int], principal: Principal
+    ):
+        with self._lock:
+            if version != self._local_version(principal.id):
+                return
+            self._entries[principal.id] = (
+                version,
+                principal,
+                time.monotonic() + self.ttl_seconds,
+            )
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._set_user_version(
+                user_id, next(self._invalidations)
+            )
+
+    def invalidate_all(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._user_versions.clear()
@@ -0,0 +1,63 @@
+import time
+import threading
+from typing import Optional
+from src.seaapi.domain.ports.services.cache import (
+    CachedPayload,
+    VersionedCacheInterface,
+)
+from src.seaapi.domain.shared.etags import compute_etag
+
+
+class MemoryVersionedCache(VersionedCacheInterface):
+    """
+    Cache versionado em memória, um por processo. Com vários workers
+    a invalidação só alcança o processo que fez a escrita, então o TTL
+    limita por quanto tempo os demais podem servir dados antigos.
+    """
+
+    def __init__(
+        self, namespace: str, ttl_seconds: int = 300
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._version = 0
+        self._payload: Optional[CachedPayload] = None
+        self._valid_until = 0.0
+        self._lock = threading.Lock()
+
+    def version(self) -> int:
+        return self._version
+
+    def get(self, version: int) -> Optional[CachedPayload]:
+        payload = self._payload
+        if (
+            payload is None
+            or payload.version != version
+            or self._valid_until <= time.monotonic()
+        ):
+            return None
+        return payload
+
+    def put(
+        self, version: int, body: bytes
+    ) -> CachedPayload:
+        payload = CachedPayload(
+            version=version,
+            body=body,
+            etag=compute_etag(body),
+        )
+        self._store(payload)
+        return payload
+
+    def _store(self, payload: CachedPayload):
+        with self._lock:
+            if payload.version == self._version:
+                self._payload = payload
+                self._valid_until = (
+                    time.monotonic() + self.ttl_seconds
+                )
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._payload = None
@@ -0,0 +1,180 @@
+import json
+import logging
+from typing import Optional, Tuple
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
+from src.seaapi.adapters.services.caching.memory_principal_cache import (
+    MemoryPrincipalCache,
+)
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Versões vêm de um contador global, então não se repetem mesmo depois
+# que a chave de versão de um usuário expira
+INVALIDATE_USER = """
+local version = redis.call('INCR', KEYS[1])
+redis.call('SET', KEYS[2], version, 'EX', ARGV[1])
+return version
+"""
+
+
+class RedisPrincipalCache(MemoryPrincipalCache):
+    """
+    Cache dos usuários autenticados em duas camadas: os carimbos e os
+    usuários ficam no Redis, compartilhados entre os workers, e cada
+    processo mantém uma cópia local. Um acerto custa apenas a leitura
+    dos carimbos (um MGET). O cliente é síncrono, com timeout curto:
+    deve ser chamado fora do event loop, e um Redis lento só faz a
+    consulta cair no banco.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: int = 60,
+        redis_url: str = "redis://localhost:6379",
+        timeout_seconds: float = 0.1,
+        **redis_kwargs,
+    ):
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "Redis não está disponível. Instale com: pip install redis"
+            )
+
+        super().__init__(max_entries, ttl_seconds)
+        self.redis_client = redis.from_url(
+            redis_url,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+            **redis_kwargs,
+        )
+        self.key_prefix = "principal_cache"
+        self._invalidate_user = (
+            self.redis_client.register_script(
+                INVALIDATE_USER
+            )
+        )
+
+    def _generation_key(self) -> str:
+        return f"{self.key_prefix}:generation"
+
+    def _counter_key(self) -> str:
+        return f"{self.key_prefix}:versions"
+
+    def _version_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:user:{user_id}:version"
+
+    def _principal_key(
+        self, user_id: int, version: Tuple[int, int]
+    ) -> str:
+        generation, user_version = version
+        return (
+            f"{self.key_prefix}:user:{user_id}"
+            f":{generation}:{user_version}"
+        )
+
+    def version(
+        self, user_id: int
+    ) -> Optional[Tuple[int, int]]:
+        try:
+            (
+                generation,
+                user_version,
+            ) = self.redis_client.mget(
+                self._generation_key(),
+                self._version_key(user_id),
+            )
+        except redis.RedisError as e:
+            # Sem o Redis não há como saber se outro worker
+            # invalidou o usuário; None força a leitura no banco
+            logger.warning(
+                f"Erro ao ler versão do cache de usuários: {e}"
+            )
+            return None
+
+        version = (
+            int(generation or 0),
+            int(user_version or 0),
+        )
+        with self._lock:
+            if version[0] != self._generation:
+                self._generation = version[0]
+                self._entries.clear()
+            if (
+                version[1]
+                != self._local_version(user_id)[1]
+            ):
+                self._set_user_version(user_id, version[1])
+        return version
+
+    def get(
+        self, user_id: int, version: Tuple[int, int]
+    ) -> Optional[Principal]:
+        principal = super().get(user_id, version)
+        if principal is not None:
+            return principal
+
+        try:
+            data = self.redis_client.get(
+                self._principal_key(user_id, version)
+            )
+        except redis.RedisError as e:
+            logger.warning(
+                f"Erro ao ler cache de usuários: {e}"
+            )
+            return None
+        if data is None:
+            return None
+
+        principal = Principal.from_dict(json.loads(data))
+        super().put(version, principal)
+        return principal
+
+    def put(
+        self, version: Tuple[int, int], principal: Principal
+    ):
+        super().put(version, principal)
+        try:
+            self.redis_client.set(
+                self._principal_key(principal.id, version),
+                json.dumps(principal.to_dict()),
+                ex=self.ttl_seconds,
+            )
+        except redis.RedisError as e:
+            logger.warning(
+                f"Erro ao gravar cache de usuários: {e}"
+            )
+
+    def invalidate(self, user_id: int):
+        super().invalidate(user_id)
+        try:
+            # A versão vive dois TTLs: as entradas gravadas com ela
+            # expiram antes, inclusive as de leituras em andamento
+            self._invalidate_user(
+                keys=[
+                    self._counter_key(),
+                    self._version_key(user_id),
+                ],
+                args=[self.ttl_seconds * 2],
+            )
+        except redis.RedisError as e:
+            logger.error(
+                f"Erro ao invalidar cache de usuários: {e}"
+            )
+
+    def invalidate_all(self):
+        super().invalidate_all()
+        try:
+            self.redis_client.incr(self._generation_key())
+        except redis.RedisError as e:
+            logger.error(
+                f"Erro ao invalidar cache de usuários: {e}"
+            )
@@ -0,0 +1,125 @@
+import logging
+from typing import Optional
+from src.seaapi.domain.ports.services.cache import (
+    CachedPayload,
+)
+from src.seaapi.adapters.services.caching.memory_versioned_cache import (
+    MemoryVersionedCache,
+)
+from src.seaapi.domain.shared.etags import compute_etag
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class RedisVersionedCache(MemoryVersionedCache):
+    """
+    Cache versionado em duas camadas: a versão e o payload ficam no
+    Redis, compartilhados entre os workers, e cada processo mantém uma
+    cópia local. Um acerto custa apenas a leitura da versão. Com o
+    timeout curto, um Redis lento só faz a consulta cair no banco.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: int = 300,
+        redis_url: str = "redis://localhost:6379",
+        timeout_seconds: float = 0.1,
+        **redis_kwargs,
+    ):
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "Redis não está disponível. Instale com: pip install redis"
+            )
+
+        super().__init__(namespace, ttl_seconds)
+        self.redis_client = redis.from_url(
+            redis_url,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+            **redis_kwargs,
+        )
+        self.key_prefix = f"versioned_cache:{namespace}"
+
+    def _version_key(self) -> str:
+        return f"{self.key_prefix}:version"
+
+    def _body_key(self, version: int) -> str:
+        return f"{self.key_prefix}:body:{version}"
+
+    def version(self) -> int:
+        try:
+            version = int(
+                self.redis_client.get(self._version_key())
+                or 0
+            )
+        except redis.RedisError as e:
+            # Sem o Redis não há como saber se outro worker
+            # invalidou o cache; -1 força a leitura no banco
+            logger.warning(
+                f"Erro ao ler versão do cache: {e}"
+            )
+            return -1
+
+        if version != self._version:
+            with self._lock:
+                self._version = version
+                self._payload = None
+        return version
+
+    def get(self, version: int) -> Optional[CachedPayload]:
+        if version < 0:
+            return None
+
+        payload = super().get(version)
+        if payload is not None:
+            return payload
+
+        try:
+            body = self.redis_client.get(
+                self._body_key(version)
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Erro ao ler cache: {e}")
+            return None
+        if body is None:
+            return None
+
+        payload = CachedPayload(
+            version=version,
+            body=body,
+            etag=compute_etag(body),
+        )
+        self._store(payload)
+        return payload
+
+    def put(
+        self, version: int, body: bytes
+    ) -> CachedPayload:
+        payload = super().put(version, body)
+        if version < 0:
+            return payload
+
+        try:
+            self.redis_client.set(
+                self._body_key(version),
+                body,
+                ex=self.ttl_seconds,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Erro ao gravar cache: {e}")
+        return payload
+
+    def invalidate(self):
+        super().invalidate()
+        try:
+            self.redis_client.incr(self._version_key())
+        except redis.RedisError as e:
+            logger.error(f"Erro ao invalidar cache: {e}")
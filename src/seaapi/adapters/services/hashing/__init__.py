@@ -0,0 +1,6 @@
+from .inline_password_hasher import (  # noqa: F401
+    InlinePasswordHasher,
+)
+from .process_pool_password_hasher import (  # noqa: F401
+    ProcessPoolPasswordHasher,
+)
@@ -0,0 +1,31 @@
+from src.seaapi.domain.ports.services.hashing import (
+    PasswordHasherInterface,
+)
+from src.seaapi.domain.shared.hash import (
+    get_context,
+    hash_password,
+)
+
+
+class InlinePasswordHasher(PasswordHasherInterface):
+    """
+    Calcula os hashes na thread que chamou. Serve para testes e
+    ambientes com um único usuário; sob carga, cada login ocupa uma
+    thread das rotas pelo tempo inteiro do bcrypt.
+    """
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+        self.context = get_context(rounds)
+
+    def hash(self, password: str) -> str:
+        return hash_password(password, self.rounds)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self.context.verify(password, hashed)
+
+    def needs_update(self, hashed: str) -> bool:
+        return self.context.needs_update(hashed)
+
+    def get_stats(self) -> dict:
+        return {"backend": "inline", "rounds": self.rounds}
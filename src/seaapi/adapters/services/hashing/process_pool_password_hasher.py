@@ -0,0 +1,119 @@
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from src.seaapi.domain.ports.services.hashing import (
+    PasswordHasherInterface,
+)
+from src.seaapi.domain.ports.shared.exceptions import (
+    PasswordHashingUnavailableException,
+)
+from src.seaapi.domain.shared.hash import (
+    get_context,
+    hash_password,
+    verify_password,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPoolPasswordHasher(PasswordHasherInterface):
+    """
+    Calcula os hashes do bcrypt em um pool de processos próprio, fora
+    do event loop e do GIL do worker. A fila é limitada: com
+    `max_pending` hashes pendentes, novos pedidos são recusados na
+    hora com 503, em vez de prenderem mais threads das rotas
+    esperando a vez.
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: int = 1,
+        max_pending: int = 8,
+    ):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.context = get_context(rounds)
+        self._lock = threading.Lock()
+        self.executor = self._create_executor()
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_seconds = 0.0
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: o fork de um worker com threads pode herdar locks
+        # presos no processo filho
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _run(self, func, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHashingUnavailableException()
+            self.pending += 1
+            self.peak_pending = max(
+                self.peak_pending, self.pending
+            )
+            executor = self.executor
+
+        started = time.perf_counter()
+        try:
+            return executor.submit(func, *args).result()
+        except BrokenProcessPool:
+            logger.warning(
+                "Password hashing pool broken, restarting"
+            )
+            with self._lock:
+                if self.executor is executor:
+                    self.executor = self._create_executor()
+            raise PasswordHashingUnavailableException()
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self._total_seconds += (
+                    time.perf_counter() - started
+                )
+
+    def hash(self, password: str) -> str:
+        return self._run(
+            hash_password, password, self.rounds
+        )
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self._run(verify_password, password, hashed)
+
+    def needs_update(self, hashed: str) -> bool:
+        # Só lê o custo do hash, não precisa do pool
+        return self.context.needs_update(hashed)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "process",
+                "rounds": self.rounds,
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                # Inclui a espera na fila
+                "avg_duration_ms": round(
+                    self._total_seconds
+                    / self.completed
+                    * 1000,
+                    2,
+                )
+                if self.completed
+                else 0.0,
+            }
@@ -4,3 +4,6 @@ from .redis_rate_limiter import (  # noqa: F401
 from .memory_rate_limiter import (  # noqa: F401
     MemoryRateLimiter,
 )
+from .leasing_rate_limiter import (  # noqa: F401
+    LeasingRateLimiter,
+)
@@ -0,0 +1,291 @@
+import time
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from src.seaapi.domain.ports.services.rate_limiter import (
+    RateLimiterInterface,
+)
+from .redis_rate_limiter import RedisRateLimiter
+
+
+@dataclass
+class Lease:
+    tokens: int = 0
+    expires_at: float = 0.0
+    # Requisições restantes na janela global na última consulta
+    remaining: int = 0
+    denied_until: float = 0.0
+    denied_info: Optional[dict] = None
+    refill: Optional[asyncio.Task] = None
+
+
+class LeasingRateLimiter(RateLimiterInterface):
+    """
+    Rate limiter em dois níveis: cada worker reserva fichas do
+    RedisRateLimiter em lotes e as consome localmente, renovando o
+    lote em background antes de acabar. A maior parte das requisições
+    não vai ao Redis.
+
+    Cada worker guarda no máximo `limite * max_overshoot / workers`
+    fichas por chave, então em qualquer janela o total liberado pelos
+    workers passa do limite em no máximo `max_overshoot`. Limites
+    pequenos demais para um lote de duas fichas vão direto ao Redis e
+    continuam exatos.
+    """
+
+    def __init__(
+        self,
+        limiter: RedisRateLimiter,
+        max_overshoot: float = 0.1,
+        workers: int = 1,
+        max_keys: int = 10000,
+    ):
+        self.limiter = limiter
+        self.max_overshoot = max_overshoot
+        self.workers = max(1, workers)
+        self.max_keys = max_keys
+        self._leases: "OrderedDict[Tuple[str, int, int], Lease]" = (
+            OrderedDict()
+        )
+        self.local_hits = 0
+        self.remote_calls = 0
+
+    def get_key(
+        self,
+        identifier: str,
+        endpoint: Optional[str] = None,
+    ) -> str:
+        return self.limiter.get_key(identifier, endpoint)
+
+    def _lease_size(self, max_requests: int) -> int:
+        """
+        Tamanho de cada lote; o próximo lote é pedido quando resta
+        no máximo um lote, então o worker nunca guarda mais que
+        `holding` fichas
+        """
+        holding = int(
+            max_requests * self.max_overshoot / self.workers
+        )
+        return holding // 2
+
+    def _get_lease(
+        self, key: Tuple[str, int, int], now: float
+    ) -> Lease:
+        lease = self._leases.get(key)
+        if lease is None or (
+            lease.expires_at <= now
+            and lease.refill is None
+            and lease.denied_until <= now
+        ):
+            lease = Lease()
+            self._leases[key] = lease
+            while len(self._leases) > self.max_keys:
+                self._leases.popitem(last=False)
+        else:
+            self._leases.move_to_end(key)
+        return lease
+
+    async def is_allowed(
+        self,
+        identifier: str,
+        max_requests: int,
+        window_seconds: int,
+        endpoint: Optional[str] = None,
+    ) -> Tuple[bool, dict]:
+        """
+        Consome uma ficha local ou, sem fichas, espera um novo lote
+        do Redis antes de responder
+        """
+        lease_size = self._lease_size(max_requests)
+        if lease_size < 1:
+            self.remote_calls += 1
+            return await self.limiter.is_allowed(
+                identifier,
+                max_requests,
+                window_seconds,
+                endpoint,
+            )
+
+        key = (
+            self.get_key(identifier, endpoint),
+            max_requests,
+            window_seconds,
+        )
+        now = time.monotonic()
+        lease = self._get_lease(key, now)
+
+        if lease.expires_at <= now:
+            # Fichas que passaram da janela não valem mais
+            lease.tokens = 0
+
+        if lease.tokens <= 0 and lease.denied_until > now:
+            self.local_hits += 1
+            return False, lease.denied_info
+
+        waited = False
+        while lease.tokens <= 0:
+            # Sem fichas, espera o lote; um único pedido por chave
+            # fica em andamento, compartilhado pelas requisições
+            self._start_refill(
+                lease,
+                identifier,
+                max_requests,
+                window_seconds,
+                endpoint,
+                lease_size,
+            )
+            granted, info = await asyncio.shield(
+                lease.refill
+            )
+            if not granted:
+                return info["allowed"], info
+            waited = True
+
+        lease.tokens -= 1
+        if not waited:
+            self.local_hits += 1
+        if (
+            lease.tokens <= lease_size
+            and lease.denied_until <= now
+        ):
+            self._start_refill(
+                lease,
+                identifier,
+                max_requests,
+                window_seconds,
+                endpoint,
+                lease_size,
+            )
+        remaining = lease.remaining + lease.tokens
+        return True, {
+            "allowed": True,
+            "current_requests": max_requests - remaining,
+            "max_requests": max_requests,
+            "window_seconds": window_seconds,
+            "remaining_requests": remaining,
+        }
+
+    def _start_refill(self, lease: Lease, *args):
+        if lease.refill is None:
+            lease.refill = asyncio.create_task(
+                self._refill(lease, *args)
+            )
+
+    async def _lease(
+        self,
+        lease: Lease,
+        identifier: str,
+        max_requests: int,
+        window_seconds: int,
+        endpoint: Optional[str],
+        lease_size: int,
+    ) -> Tuple[int, dict]:
+        self.remote_calls += 1
+        granted, info = await self.limiter.acquire(
+            identifier,
+            max_requests,
+            window_seconds,
+            endpoint,
+            tokens=lease_size,
+        )
+        now = time.monotonic()
+        if granted:
+            lease.tokens += granted
+            lease.expires_at = now + window_seconds
+            lease.remaining = info["remaining_requests"]
+        elif not info["allowed"] and not info.get("error"):
+            # Recusas do Redis valem até a janela liberar; o
+            # retry_after é arredondado para baixo, o reset_time não
+            lease.denied_until = (
+                now
+                + datetime.fromisoformat(
+                    info["reset_time"]
+                ).timestamp()
+                - time.time()
+            )
+            lease.denied_info = info
+        return granted, info
+
+    async def _refill(
+        self, lease: Lease, *args
+    ) -> Tuple[int, dict]:
+        try:
+            return await self._lease(lease, *args)
+        finally:
+            lease.refill = None
+
+    async def status(
+        self,
+        identifier: str,
+        limits: Dict[Optional[str], Tuple[int, int]],
+    ) -> Dict[Optional[str], dict]:
+        """
+        Consulta o Redis e devolve à cota as fichas que este worker
+        reservou e ainda não consumiu
+        """
+        status = await self.limiter.status(
+            identifier, limits
+        )
+        now = time.monotonic()
+        for endpoint, (
+            max_requests,
+            window_seconds,
+        ) in limits.items():
+            lease = self._leases.get(
+                (
+                    self.get_key(identifier, endpoint),
+                    max_requests,
+                    window_seconds,
+                )
+            )
+            info = status[endpoint]
+            if (
+                lease is None
+                or lease.tokens <= 0
+                or lease.expires_at <= now
+                or info.get("error")
+            ):
+                continue
+            info["current_requests"] = max(
+                0, info["current_requests"] - lease.tokens
+            )
+            info["remaining_requests"] = (
+                max_requests - info["current_requests"]
+            )
+            if not info["allowed"]:
+                info["allowed"] = True
+                info.pop("reset_time", None)
+                info.pop("retry_after", None)
+        return status
+
+    async def reset_limit(
+        self,
+        identifier: str,
+        endpoint: Optional[str] = None,
+    ) -> bool:
+        """
+        Reseta o limite no Redis e descarta as fichas deste worker;
+        os demais workers consomem o que ainda tinham reservado
+        """
+        prefix = self.get_key(identifier, endpoint)
+        for key in [
+            k for k in self._leases if k[0] == prefix
+        ]:
+            del self._leases[key]
+        return await self.limiter.reset_limit(
+            identifier, endpoint
+        )
+
+    async def get_stats(self) -> dict:
+        """Retorna estatísticas do Redis e do nível local"""
+        stats = await self.limiter.get_stats()
+        stats["local_lease"] = {
+            "max_overshoot": self.max_overshoot,
+            "workers": self.workers,
+            "tracked_keys": len(self._leases),
+            "local_hits": self.local_hits,
+            "remote_calls": self.remote_calls,
+        }
+        return stats
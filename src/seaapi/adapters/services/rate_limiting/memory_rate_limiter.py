@@ -1,41 +1,203 @@
+import math
 import time
-from typing import Tuple, Optional, Dict, List
+import asyncio
+from typing import Tuple, Optional, Dict
 from datetime import datetime
 from src.seaapi.domain.ports.services.rate_limiter import (
     RateLimiterInterface,
 )
 
+ALGORITHMS = ("sliding_window", "fixed_window", "gcra")
+
 
 class MemoryRateLimiter(RateLimiterInterface):
     """
-    Implementação de rate limiter em memória usando sliding window
-    Adequado para desenvolvimento e aplicações de pequeno porte
+    Implementação de rate limiter em memória com estado de tamanho
+    fixo por chave. Algoritmos disponíveis:
+
+    - sliding_window: contador da janela atual e da anterior,
+      ponderado pela fração da janela que já passou
+    - fixed_window: um contador por janela alinhada ao relógio
+    - gcra: token bucket guardando apenas o próximo horário teórico
+      de chegada
+
+    O primeiro item do estado de cada chave é o instante a partir do
+    qual ela equivale a uma chave nova; uma tarefa em background
+    remove essas chaves periodicamente.
     """
 
-    def __init__(self):
-        self._requests: Dict[str, List[float]] = {}
+    def __init__(
+        self,
+        algorithm: str = "sliding_window",
+        sweep_interval_seconds: int = 60,
+        sweep_batch_size: int = 1000,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Algoritmo de rate limiting inválido: {algorithm}"
+            )
+        self.algorithm = algorithm
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.sweep_batch_size = sweep_batch_size
+        self._check = getattr(self, f"_check_{algorithm}")
+        self._buckets: Dict[str, tuple] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+        self._evicted_keys = 0
+
+    def _ensure_sweeper(self):
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = (
+                asyncio.get_running_loop().create_task(
+                    self._sweep_forever()
+                )
+            )
+
+    async def _sweep_forever(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval_seconds)
+            await self.evict_idle_keys()
+
+    async def evict_idle_keys(self) -> int:
+        """
+        Remove as chaves ociosas em lotes, liberando o event loop
+        entre um lote e outro
+        """
+        evicted = 0
+        keys = list(self._buckets)
+        for batch in range(
+            0, len(keys), self.sweep_batch_size
+        ):
+            now = time.time()
+            end = batch + self.sweep_batch_size
+            for key in keys[batch:end]:
+                state = self._buckets.get(key)
+                if state is not None and state[0] <= now:
+                    del self._buckets[key]
+                    evicted += 1
+            await asyncio.sleep(0)
+        self._evicted_keys += evicted
+        return evicted
 
-    def _get_key(
+    def _check_fixed_window(
         self,
-        identifier: str,
-        endpoint: Optional[str] = None,
-    ) -> str:
-        """Gera chave única para o identificador e endpoint"""
-        if endpoint:
-            return f"{identifier}:{endpoint}"
-        return identifier
-
-    def _cleanup_old_requests(
-        self, requests: List[float], window_seconds: int
-    ) -> List[float]:
-        """Remove requisições antigas fora da janela de tempo"""
-        current_time = time.time()
-        cutoff_time = current_time - window_seconds
-        return [
-            req_time
-            for req_time in requests
-            if req_time > cutoff_time
-        ]
+        key: str,
+        now: float,
+        max_requests: int,
+        window_seconds: int,
+        consume: bool = True,
+    ) -> Tuple[bool, int, float]:
+        window_start = now - now % window_seconds
+        window_end = window_start + window_seconds
+        state = self._buckets.get(key)
+        count = (
+            state[1]
+            if state is not None and state[0] == window_end
+            else 0
+        )
+
+        if count >= max_requests:
+            return False, count, window_end - now
+
+        if not consume:
+            return True, count, 0.0
+        self._buckets[key] = (window_end, count + 1)
+        return True, count + 1, 0.0
+
+    def _check_sliding_window(
+        self,
+        key: str,
+        now: float,
+        max_requests: int,
+        window_seconds: int,
+        consume: bool = True,
+    ) -> Tuple[bool, int, float]:
+        window_start = now - now % window_seconds
+        state = self._buckets.get(key)
+        previous, current = 0, 0
+        if state is not None:
+            # state = (fim da janela seguinte, início, anterior, atual)
+            (
+                _,
+                started_at,
+                state_previous,
+                state_current,
+            ) = state
+            if started_at == window_start:
+                previous, current = (
+                    state_previous,
+                    state_current,
+                )
+            elif (
+                started_at == window_start - window_seconds
+            ):
+                previous = state_current
+
+        elapsed = (now - window_start) / window_seconds
+        estimated = previous * (1 - elapsed) + current
+
+        if estimated + 1 > max_requests:
+            if previous and current + 1 <= max_requests:
+                # Espera a janela anterior "escorrer" o suficiente
+                unblock_at = (
+                    window_start
+                    + window_seconds
+                    * (
+                        1
+                        - (max_requests - 1 - current)
+                        / previous
+                    )
+                )
+            elif current:
+                # A janela atual vira a anterior e também precisa
+                # escorrer na janela seguinte
+                unblock_at = (
+                    window_start
+                    + window_seconds
+                    * (2 - (max_requests - 1) / current)
+                )
+            else:
+                unblock_at = window_start + window_seconds
+            return (
+                False,
+                math.ceil(estimated),
+                unblock_at - now,
+            )
+
+        if not consume:
+            return True, math.ceil(estimated), 0.0
+        self._buckets[key] = (
+            window_start + 2 * window_seconds,
+            window_start,
+            previous,
+            current + 1,
+        )
+        return True, math.ceil(estimated + 1), 0.0
+
+    def _check_gcra(
+        self,
+        key: str,
+        now: float,
+        max_requests: int,
+        window_seconds: int,
+        consume: bool = True,
+    ) -> Tuple[bool, int, float]:
+        interval = window_seconds / max_requests
+        state = self._buckets.get(key)
+        tat = (
+            max(state[0], now) if state is not None else now
+        )
+        new_tat = tat + interval
+        allow_at = new_tat - window_seconds
+
+        if now < allow_at:
+            return False, max_requests, allow_at - now
+
+        if not consume:
+            used = math.ceil((tat - now) / interval - 1e-9)
+            return True, min(used, max_requests), 0.0
+        self._buckets[key] = (new_tat,)
+        used = math.ceil((new_tat - now) / interval - 1e-9)
+        return True, min(used, max_requests), 0.0
 
     async def is_allowed(
         self,
@@ -45,32 +207,64 @@ class MemoryRateLimiter(RateLimiterInterface):
         endpoint: Optional[str] = None,
     ) -> Tuple[bool, dict]:
         """
-        Verifica se a requisição deve ser permitida usando sliding window
+        Verifica se a requisição deve ser permitida usando o
+        algoritmo configurado
         """
-        key = self._get_key(identifier, endpoint)
+        self._ensure_sweeper()
+        key = self.get_key(identifier, endpoint)
         current_time = time.time()
 
-        # Inicializa se não existir
-        if key not in self._requests:
-            self._requests[key] = []
-
-        # Remove requisições antigas
-        self._requests[key] = self._cleanup_old_requests(
-            self._requests[key], window_seconds
+        return self._info(
+            *self._check(
+                key,
+                current_time,
+                max_requests,
+                window_seconds,
+            ),
+            current_time,
+            max_requests,
+            window_seconds,
         )
 
-        current_count = len(self._requests[key])
-
-        # Verifica se excedeu o limite
-        if current_count >= max_requests:
-            # Calcula quando a próxima requisição será permitida
-            oldest_request = (
-                min(self._requests[key])
-                if self._requests[key]
-                else current_time
+    async def status(
+        self,
+        identifier: str,
+        limits: Dict[Optional[str], Tuple[int, int]],
+    ) -> Dict[Optional[str], dict]:
+        """
+        Consulta o estado dos endpoints sem registrar requisições
+        """
+        current_time = time.time()
+        result = {}
+        for endpoint, (
+            max_requests,
+            window_seconds,
+        ) in limits.items():
+            _, result[endpoint] = self._info(
+                *self._check(
+                    self.get_key(identifier, endpoint),
+                    current_time,
+                    max_requests,
+                    window_seconds,
+                    consume=False,
+                ),
+                current_time,
+                max_requests,
+                window_seconds,
             )
-            reset_time = oldest_request + window_seconds
+        return result
 
+    def _info(
+        self,
+        allowed: bool,
+        current_count: int,
+        retry_after: float,
+        current_time: float,
+        max_requests: int,
+        window_seconds: int,
+    ) -> Tuple[bool, dict]:
+        if not allowed:
+            reset_time = current_time + retry_after
             return False, {
                 "allowed": False,
                 "current_requests": current_count,
@@ -80,21 +274,18 @@ class MemoryRateLimiter(RateLimiterInterface):
                     reset_time
                 ).isoformat(),
                 "retry_after": max(
-                    0, int(reset_time - current_time)
+                    0, math.ceil(retry_after)
                 ),
             }
 
-        # Adiciona a requisição atual
-        self._requests[key].append(current_time)
-
         return True, {
             "allowed": True,
-            "current_requests": current_count + 1,
+            "current_requests": current_count,
             "max_requests": max_requests,
             "window_seconds": window_seconds,
-            "remaining_requests": max_requests
-            - current_count
-            - 1,
+            "remaining_requests": max(
+                0, max_requests - current_count
+            ),
         }
 
     async def reset_limit(
@@ -103,23 +294,26 @@ class MemoryRateLimiter(RateLimiterInterface):
         endpoint: Optional[str] = None,
     ) -> bool:
         """Reseta o limite para um identificador específico"""
-        key = self._get_key(identifier, endpoint)
-        if key in self._requests:
-            del self._requests[key]
+        key = self.get_key(identifier, endpoint)
+        if key in self._buckets:
+            del self._buckets[key]
             return True
         return False
 
-    def get_stats(self) -> dict:
+    async def get_stats(self) -> dict:
         """Retorna estatísticas do rate limiter"""
-        total_keys = len(self._requests)
-        total_requests = sum(
-            len(requests)
-            for requests in self._requests.values()
+        now = time.time()
+        total_keys = len(self._buckets)
+        idle_keys = sum(
+            1
+            for state in self._buckets.values()
+            if state[0] <= now
         )
 
         return {
             "type": "memory",
+            "algorithm": self.algorithm,
             "total_tracked_keys": total_keys,
-            "total_active_requests": total_requests,
-            "memory_usage_estimate": f"{total_requests * 8} bytes",  # Aproximação
+            "idle_keys_pending_eviction": idle_keys,
+            "evicted_keys": self._evicted_keys,
         }
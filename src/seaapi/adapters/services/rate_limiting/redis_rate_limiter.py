@@ -1,5 +1,9 @@
+import os
+import math
 import time
-from typing import Tuple, Optional
+import asyncio
+import logging
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 from src.seaapi.domain.ports.services.rate_limiter import (
     RateLimiterInterface,
@@ -7,45 +11,174 @@ from src.seaapi.domain.ports.services.rate_limiter import (
 
 try:
     import redis
+    import redis.asyncio as aioredis
 
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Cada algoritmo define check(), que concede até `requested` fichas e
+# devolve {fichas concedidas, requisições na janela, segundos até
+# liberar}. O último valor volta como string porque o Redis trunca
+# números do Lua.
+SLIDING_LOG_CHECK = """
+local function check(key, now, window, limit, member, requested)
+    redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+    local count = redis.call('ZCARD', key)
+
+    if count >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        local reset = now + window
+        if oldest[2] then
+            reset = tonumber(oldest[2]) + window
+        end
+        return {0, count, string.format('%.6f', reset - now)}
+    end
+
+    local granted = math.min(requested, limit - count)
+    for i = 1, granted do
+        redis.call('ZADD', key, now, member .. ':' .. i)
+    end
+    redis.call('PEXPIRE', key, math.ceil(window * 1000) + 1000)
+    return {granted, count + granted, '0'}
+end
+"""
+
+GCRA_CHECK = """
+local function check(key, now, window, limit, member, requested)
+    local interval = window / limit
+
+    local tat = tonumber(redis.call('GET', key))
+    if not tat or tat < now then
+        tat = now
+    end
+
+    local available = math.floor((now + window - tat) / interval + 1e-9)
+    if available < 1 then
+        local allow_at = tat + interval - window
+        return {0, limit, string.format('%.6f', allow_at - now)}
+    end
+
+    local granted = math.min(requested, available)
+    local new_tat = tat + granted * interval
+    redis.call(
+        'SET', key, string.format('%.6f', new_tat),
+        'PX', math.ceil((new_tat - now) * 1000)
+    )
+    local used = math.ceil((new_tat - now) / interval - 1e-9)
+    return {granted, math.min(used, limit), '0'}
+end
+"""
+
+# Estatísticas incrementais no balde do minuto atual:
+# KEYS[2] HyperLogLog de identificadores, KEYS[3]/KEYS[4] hashes de
+# permitidas/negadas por endpoint, KEYS[5] sorted set de requisições
+# por identificador e KEYS[6] sorted set de negadas por identificador.
+# Fichas concedidas em lote contam como requisições permitidas.
+RECORD_STATS = """
+local result = check(
+    KEYS[1], tonumber(ARGV[1]), tonumber(ARGV[2]),
+    tonumber(ARGV[3]), ARGV[4], tonumber(ARGV[8])
+)
+
+local identifier = ARGV[5]
+redis.call('PFADD', KEYS[2], identifier)
+redis.call('ZINCRBY', KEYS[5], math.max(result[1], 1), identifier)
+if result[1] > 0 then
+    redis.call('HINCRBY', KEYS[3], ARGV[6], result[1])
+else
+    redis.call('HINCRBY', KEYS[4], ARGV[6], 1)
+    redis.call('ZINCRBY', KEYS[6], 1, identifier)
+end
+for i = 2, 6 do
+    redis.call('EXPIRE', KEYS[i], ARGV[7])
+end
+
+return result
+"""
+
+ALGORITHMS = {
+    "sliding_log": ("rate_limit", SLIDING_LOG_CHECK),
+    "gcra": ("rate_limit_gcra", GCRA_CHECK),
+}
+
+STATS_BUCKETS = (
+    "identifiers",
+    "allowed",
+    "denied",
+    "usage",
+    "offenders",
+)
+PERCENTILES = (50, 90, 99)
+
 
 class RedisRateLimiter(RateLimiterInterface):
     """
-    Implementação de rate limiter usando Redis com sliding window
+    Implementação de rate limiter usando Redis, com a verificação e o
+    registro feitos por um único script Lua (EVALSHA): uma ida ao
+    Redis por requisição e sem corrida entre a contagem e a inserção.
+    O cliente é o redis.asyncio, então a espera não bloqueia o event
+    loop. Se o Redis falhar ou estourar o timeout, a requisição é
+    liberada ou recusada conforme `fail_open`.
     Adequado para produção e aplicações distribuídas
     """
 
     def __init__(
         self,
         redis_url: str = "redis://localhost:6379",
+        algorithm: str = "sliding_log",
+        fail_open: bool = True,
+        timeout_seconds: float = 0.1,
+        max_connections: int = 50,
+        stats_window_minutes: int = 5,
         **redis_kwargs,
     ):
         if not REDIS_AVAILABLE:
             raise ImportError(
                 "Redis não está disponível. Instale com: pip install redis"
             )
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Algoritmo de rate limiting inválido: {algorithm}"
+            )
 
-        self.redis_client = redis.from_url(
-            redis_url, **redis_kwargs
+        self.redis_client = aioredis.from_url(
+            redis_url,
+            max_connections=max_connections,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+            **redis_kwargs,
+        )
+        self.fail_open = fail_open
+        self.timeout_seconds = timeout_seconds
+        self.algorithm = algorithm
+        self.stats_window_minutes = stats_window_minutes
+        self.key_prefix, check = ALGORITHMS[algorithm]
+        self._script = self.redis_client.register_script(
+            check + RECORD_STATS
         )
-        self.key_prefix = "rate_limit"
 
-    def _get_key(
+    def get_key(
         self,
         identifier: str,
         endpoint: Optional[str] = None,
     ) -> str:
-        """Gera chave única para o identificador e endpoint"""
+        """Gera a chave do limite com o prefixo do algoritmo"""
         if endpoint:
             return (
                 f"{self.key_prefix}:{identifier}:{endpoint}"
             )
         return f"{self.key_prefix}:{identifier}"
 
+    def _stats_keys(self, minute: int) -> List[str]:
+        """Chaves das estatísticas do balde de um minuto"""
+        return [
+            f"{self.key_prefix}:stats:{minute}:{bucket}"
+            for bucket in STATS_BUCKETS
+        ]
+
     async def is_allowed(
         self,
         identifier: str,
@@ -54,37 +187,207 @@ class RedisRateLimiter(RateLimiterInterface):
         endpoint: Optional[str] = None,
     ) -> Tuple[bool, dict]:
         """
-        Verifica se a requisição deve ser permitida usando sliding window no Redis
+        Verifica e registra a requisição atomicamente no Redis
         """
-        key = self._get_key(identifier, endpoint)
+        _, info = await self.acquire(
+            identifier,
+            max_requests,
+            window_seconds,
+            endpoint,
+        )
+        return info["allowed"], info
+
+    async def acquire(
+        self,
+        identifier: str,
+        max_requests: int,
+        window_seconds: int,
+        endpoint: Optional[str] = None,
+        tokens: int = 1,
+    ) -> Tuple[int, dict]:
+        """
+        Reserva até `tokens` requisições da janela de uma só vez e
+        retorna quantas foram concedidas. Com o Redis indisponível
+        nenhuma é concedida e `info["allowed"]` segue `fail_open`.
+        """
+        key = self.get_key(identifier, endpoint)
         current_time = time.time()
-        cutoff_time = current_time - window_seconds
 
-        # Pipeline para operações atômicas
-        pipe = self.redis_client.pipeline()
+        try:
+            (
+                granted,
+                current_count,
+                retry_after,
+            ) = await asyncio.wait_for(
+                self._script(
+                    keys=[key]
+                    + self._stats_keys(
+                        int(current_time // 60)
+                    ),
+                    args=[
+                        repr(current_time),
+                        window_seconds,
+                        max_requests,
+                        # Membro único no sorted set, mesmo para
+                        # requisições com o mesmo horário
+                        f"{current_time}:{os.urandom(6).hex()}",
+                        identifier,
+                        endpoint or "*",
+                        # Mantém os baldes por toda a janela de
+                        # estatísticas mais o minuto em andamento
+                        (self.stats_window_minutes + 1)
+                        * 60,
+                        tokens,
+                    ],
+                ),
+                self.timeout_seconds,
+            )
+        except (
+            redis.RedisError,
+            asyncio.TimeoutError,
+        ) as e:
+            logger.warning(
+                f"Rate limiter indisponível: {e}"
+            )
+            _, info = self._unavailable(
+                max_requests, window_seconds
+            )
+            return 0, info
+        _, info = self._info(
+            bool(granted),
+            current_count,
+            float(retry_after),
+            current_time,
+            max_requests,
+            window_seconds,
+        )
+        return granted, info
+
+    async def status(
+        self,
+        identifier: str,
+        limits: Dict[Optional[str], Tuple[int, int]],
+    ) -> Dict[Optional[str], dict]:
+        """
+        Consulta o estado dos endpoints em um único pipeline, sem
+        registrar requisições
+        """
+        current_time = time.time()
+        pipe = self.redis_client.pipeline(transaction=False)
+        for endpoint, (_, window_seconds) in limits.items():
+            key = self.get_key(identifier, endpoint)
+            if self.algorithm == "gcra":
+                pipe.get(key)
+            else:
+                window_start = (
+                    f"({current_time - window_seconds!r}"
+                )
+                pipe.zcount(key, window_start, "+inf")
+                pipe.zrangebyscore(
+                    key,
+                    window_start,
+                    "+inf",
+                    start=0,
+                    num=1,
+                    withscores=True,
+                )
 
-        # Remove entradas antigas
-        pipe.zremrangebyscore(key, 0, cutoff_time)
+        try:
+            results = await asyncio.wait_for(
+                pipe.execute(), self.timeout_seconds
+            )
+        except (
+            redis.RedisError,
+            asyncio.TimeoutError,
+        ) as e:
+            logger.warning(
+                f"Rate limiter indisponível: {e}"
+            )
+            return {
+                endpoint: self._unavailable(
+                    max_requests, window_seconds
+                )[1]
+                for endpoint, (
+                    max_requests,
+                    window_seconds,
+                ) in limits.items()
+            }
 
-        # Conta requisições atuais
-        pipe.zcard(key)
+        status = {}
+        results = iter(results)
+        for endpoint, (
+            max_requests,
+            window_seconds,
+        ) in limits.items():
+            if self.algorithm == "gcra":
+                state = self._peek_gcra(
+                    next(results),
+                    current_time,
+                    max_requests,
+                    window_seconds,
+                )
+            else:
+                state = self._peek_sliding_log(
+                    next(results),
+                    next(results),
+                    current_time,
+                    max_requests,
+                    window_seconds,
+                )
+            _, status[endpoint] = self._info(
+                *state,
+                current_time,
+                max_requests,
+                window_seconds,
+            )
+        return status
 
-        # Executa pipeline
-        results = pipe.execute()
-        current_count = results[1]
+    @staticmethod
+    def _peek_sliding_log(
+        count: int,
+        oldest: list,
+        now: float,
+        max_requests: int,
+        window_seconds: int,
+    ) -> Tuple[bool, int, float]:
+        if count < max_requests:
+            return True, count, 0.0
+        reset = (
+            oldest[0][1] + window_seconds
+            if oldest
+            else now + window_seconds
+        )
+        return False, count, reset - now
 
-        # Verifica se excedeu o limite
-        if current_count >= max_requests:
-            # Pega a requisição mais antiga para calcular reset_time
-            oldest_requests = self.redis_client.zrange(
-                key, 0, 0, withscores=True
+    @staticmethod
+    def _peek_gcra(
+        tat,
+        now: float,
+        max_requests: int,
+        window_seconds: int,
+    ) -> Tuple[bool, int, float]:
+        interval = window_seconds / max_requests
+        tat = max(float(tat), now) if tat else now
+        if tat + interval - window_seconds > now:
+            return (
+                False,
+                max_requests,
+                tat + interval - window_seconds - now,
             )
-            if oldest_requests:
-                oldest_time = oldest_requests[0][1]
-                reset_time = oldest_time + window_seconds
-            else:
-                reset_time = current_time + window_seconds
+        used = math.ceil((tat - now) / interval - 1e-9)
+        return True, min(used, max_requests), 0.0
 
+    def _info(
+        self,
+        allowed: bool,
+        current_count: int,
+        retry_after: float,
+        current_time: float,
+        max_requests: int,
+        window_seconds: int,
+    ) -> Tuple[bool, dict]:
+        if not allowed:
+            reset_time = current_time + retry_after
             return False, {
                 "allowed": False,
                 "current_requests": current_count,
@@ -93,28 +396,34 @@ class RedisRateLimiter(RateLimiterInterface):
                 "reset_time": datetime.fromtimestamp(
                     reset_time
                 ).isoformat(),
-                "retry_after": max(
-                    0, int(reset_time - current_time)
-                ),
+                "retry_after": max(0, int(retry_after)),
             }
 
-        # Adiciona a requisição atual
-        pipe = self.redis_client.pipeline()
-        pipe.zadd(key, {str(current_time): current_time})
-        pipe.expire(
-            key, window_seconds + 1
-        )  # TTL ligeiramente maior que a janela
-        pipe.execute()
-
         return True, {
             "allowed": True,
-            "current_requests": current_count + 1,
+            "current_requests": current_count,
+            "max_requests": max_requests,
+            "window_seconds": window_seconds,
+            "remaining_requests": max(
+                0, max_requests - current_count
+            ),
+        }
+
+    def _unavailable(
+        self, max_requests: int, window_seconds: int
+    ) -> Tuple[bool, dict]:
+        info = {
+            "allowed": self.fail_open,
+            "current_requests": 0,
             "max_requests": max_requests,
             "window_seconds": window_seconds,
-            "remaining_requests": max_requests
-            - current_count
-            - 1,
+            "error": "rate_limiter_unavailable",
         }
+        if self.fail_open:
+            info["remaining_requests"] = max_requests
+        else:
+            info["retry_after"] = 1
+        return self.fail_open, info
 
     async def reset_limit(
         self,
@@ -122,29 +431,141 @@ class RedisRateLimiter(RateLimiterInterface):
         endpoint: Optional[str] = None,
     ) -> bool:
         """Reseta o limite para um identificador específico"""
-        key = self._get_key(identifier, endpoint)
-        result = self.redis_client.delete(key)
+        key = self.get_key(identifier, endpoint)
+        result = await self.redis_client.delete(key)
         return result > 0
 
-    def get_stats(self) -> dict:
-        """Retorna estatísticas do rate limiter"""
-        pattern = f"{self.key_prefix}:*"
-        keys = self.redis_client.keys(pattern)
+    async def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do rate limiter lendo apenas os baldes
+        incrementais dos últimos minutos, sem varrer as chaves de
+        limite
+        """
+        current_minute = int(time.time() // 60)
+        minutes = [
+            current_minute - offset
+            for offset in range(self.stats_window_minutes)
+        ]
+        buckets = [self._stats_keys(m) for m in minutes]
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.pfcount(*[keys[0] for keys in buckets])
+        pipe.zcard(buckets[0][3])
+        for keys in buckets:
+            pipe.hgetall(keys[1])
+            pipe.hgetall(keys[2])
+            pipe.zrevrange(keys[4], 0, 9, withscores=True)
+        results = await pipe.execute()
+        distinct_identifiers, current_identifiers = results[
+            :2
+        ]
 
-        total_requests = 0
-        for key in keys:
-            total_requests += self.redis_client.zcard(key)
+        allowed: Dict[str, int] = {}
+        denied: Dict[str, int] = {}
+        offenders: Dict[str, float] = {}
+        for index in range(2, len(results), 3):
+            minute_allowed, minute_denied, top = results[
+                index : index + 3  # noqa: E203
+            ]
+            _merge_counters(allowed, minute_allowed)
+            _merge_counters(denied, minute_denied)
+            for identifier, score in top:
+                identifier = _decode(identifier)
+                offenders[identifier] = (
+                    offenders.get(identifier, 0) + score
+                )
+
+        percentiles = await self._usage_percentiles(
+            buckets[0][3], current_identifiers
+        )
+        info = await self.redis_client.info()
 
+        total_allowed = sum(allowed.values())
+        total_denied = sum(denied.values())
         return {
             "type": "redis",
-            "total_tracked_keys": len(keys),
-            "total_active_requests": total_requests,
+            "algorithm": self.algorithm,
+            "fail_open": self.fail_open,
+            "window_minutes": self.stats_window_minutes,
+            "distinct_identifiers": distinct_identifiers,
+            "requests": {
+                "total": total_allowed + total_denied,
+                "allowed": total_allowed,
+                "denied": total_denied,
+            },
+            "endpoints": {
+                endpoint: {
+                    "allowed": allowed.get(endpoint, 0),
+                    "denied": denied.get(endpoint, 0),
+                }
+                for endpoint in sorted(
+                    set(allowed) | set(denied)
+                )
+            },
+            # Aproximado: soma o top 10 de cada minuto
+            "top_offenders": [
+                {
+                    "identifier": identifier,
+                    "denied": int(score),
+                }
+                for identifier, score in sorted(
+                    offenders.items(),
+                    key=lambda item: item[1],
+                    reverse=True,
+                )[:10]
+            ],
+            "current_minute": {
+                "identifiers": current_identifiers,
+                "requests_per_identifier": percentiles,
+            },
             "redis_info": {
-                "memory_usage": self.redis_client.info().get(
+                "memory_usage": info.get(
                     "used_memory_human", "N/A"
                 ),
-                "connected_clients": self.redis_client.info().get(
+                "connected_clients": info.get(
                     "connected_clients", 0
                 ),
             },
         }
+
+    async def _usage_percentiles(
+        self, usage_key: str, total: int
+    ) -> Dict[str, int]:
+        """
+        Lê os percentis de requisições por identificador direto pelo
+        rank no sorted set, um ZRANGE de um elemento por percentil
+        """
+        if not total:
+            return {}
+        names = [f"p{p}" for p in PERCENTILES] + ["max"]
+        ranks = [
+            min(total - 1, math.ceil(total * p / 100) - 1)
+            for p in PERCENTILES
+        ] + [total - 1]
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for rank in ranks:
+            pipe.zrange(
+                usage_key, rank, rank, withscores=True
+            )
+        results = await pipe.execute()
+        return {
+            name: int(result[0][1]) if result else 0
+            for name, result in zip(names, results)
+        }
+
+
+def _decode(value) -> str:
+    return (
+        value.decode()
+        if isinstance(value, bytes)
+        else value
+    )
+
+
+def _merge_counters(target: Dict[str, int], counters: dict):
+    for endpoint, count in counters.items():
+        endpoint = _decode(endpoint)
+        target[endpoint] = target.get(endpoint, 0) + int(
+            count
+        )
@@ -1,2 +1,3 @@
 from .minio import MinIOStorageService  # noqa: F401
 from .s3 import S3StorageService  # noqa: F401
+from .executor import ExecutorStorageService  # noqa: F401
@@ -0,0 +1,82 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class PresignedUrlCache:
+    """
+    Cache LRU com TTL para URLs pré-assinadas, compartilhado pelo
+    processo. Uma URL é reaproveitada apenas enquanto ainda lhe resta
+    pelo menos (1 - ttl_ratio) da validade solicitada.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_ratio: float = 0.5,
+    ):
+        self.max_entries = max_entries
+        self.ttl_ratio = ttl_ratio
+        self._entries: "OrderedDict[Tuple[str, str, int], Tuple[str, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self, bucket: str, path: str, expires: int
+    ) -> Optional[str]:
+        key = (bucket, path, expires)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            url, valid_until = entry
+            if valid_until <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return url
+
+    def put(
+        self, bucket: str, path: str, expires: int, url: str
+    ):
+        key = (bucket, path, expires)
+        valid_until = (
+            time.monotonic() + expires * self.ttl_ratio
+        )
+        with self._lock:
+            self._entries[key] = (url, valid_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, bucket: str, path: str):
+        with self._lock:
+            for key in [
+                k
+                for k in self._entries
+                if k[0] == bucket and k[1] == path
+            ]:
+                del self._entries[key]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4)
+                if lookups
+                else 0.0,
+            }
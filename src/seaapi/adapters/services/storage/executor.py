@@ -0,0 +1,58 @@
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+from src.seaapi.domain.ports.services.storage import (
+    AsyncStorageServiceInterface,
+    StorageServiceInterface,
+)
+
+
+class ExecutorStorageService(AsyncStorageServiceInterface):
+    """
+    Versão assíncrona de um serviço de storage síncrono. As chamadas
+    rodam em um pool de threads próprio, do mesmo tamanho do pool de
+    conexões do cliente, e não ocupam os workers das requisições.
+    """
+
+    def __init__(
+        self,
+        storage_service: StorageServiceInterface,
+        max_workers: int = 10,
+    ):
+        self.storage_service = storage_service
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="storage",
+        )
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(func, *args, **kwargs)
+        )
+
+    async def upload(
+        self,
+        path: str,
+        content: bytes = None,
+        file: BinaryIO = None,
+    ):
+        return await self._run(
+            self.storage_service.upload,
+            path,
+            content=content,
+            file=file,
+        )
+
+    async def get(
+        self, path: str, expires: int = None
+    ) -> str:
+        return await self._run(
+            self.storage_service.get, path, expires=expires
+        )
+
+    async def delete(self, path: str):
+        return await self._run(
+            self.storage_service.delete, path
+        )
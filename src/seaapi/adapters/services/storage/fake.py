@@ -1,3 +1,4 @@
+from typing import BinaryIO
 from src.seaapi.domain.ports.services.storage import (
     StorageServiceInterface,
 )
@@ -7,8 +8,9 @@ class FakeStorageService(StorageServiceInterface):
     def upload(
         self,
         path: str,
-        content: bytes,
+        content: bytes = None,
         temp_file_path: str = None,
+        file: BinaryIO = None,
     ):
         print("Uploading file " + path)
 
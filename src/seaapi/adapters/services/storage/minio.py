@@ -1,11 +1,15 @@
 import os
 import boto3
+from io import BytesIO
+from typing import BinaryIO
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from src.seaapi.domain.ports.services.storage import (
     StorageServiceInterface,
 )
 from src.seaapi.config.settings import settings
-from src.seaapi.domain.shared.file import (
-    bytes_to_named_temporary_file,
+from src.seaapi.adapters.services.storage.cache import (
+    PresignedUrlCache,
 )
 
 
@@ -18,6 +22,20 @@ class MinIOStorageService(
             endpoint_url=settings.STORAGE_ENDPOINT_URL,
             aws_access_key_id=settings.STORAGE_ACCESS_KEY,
             aws_secret_access_key=settings.STORAGE_SECRET_KEY,
+            config=Config(
+                max_pool_connections=settings.STORAGE_MAX_CONNECTIONS,
+                retries={
+                    "max_attempts": settings.STORAGE_MAX_RETRIES,
+                    "mode": "standard",
+                },
+            ),
+        )
+        self.url_cache = PresignedUrlCache(
+            max_entries=settings.STORAGE_URL_CACHE_MAX_ENTRIES
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.STORAGE_MULTIPART_THRESHOLD,
+            multipart_chunksize=settings.STORAGE_MULTIPART_CHUNKSIZE,
         )
 
     def upload(
@@ -25,22 +43,37 @@ class MinIOStorageService(
         path: str,
         content: bytes = None,
         temp_file_path: str = None,
+        file: BinaryIO = None,
     ):  # pragma: no cover
-        if temp_file_path is None:
-            temp_file_path = bytes_to_named_temporary_file(
-                content, path
+        if file is None and content is not None:
+            file = BytesIO(content)
+
+        if file is not None:
+            # Envia o próprio arquivo recebido, em partes quando
+            # passar do limite, sem cópia intermediária em disco
+            file.seek(0)
+            self.client.upload_fileobj(
+                file,
+                settings.STORAGE_BUCKET,
+                path,
+                Config=self.transfer_config,
             )
-        if temp_file_path is None and content is None:
+        elif temp_file_path is not None:
+            self.client.upload_file(
+                temp_file_path,
+                settings.STORAGE_BUCKET,
+                path,
+                Config=self.transfer_config,
+            )
+            os.remove(temp_file_path)
+        else:
             raise Exception(
                 "Cannot upload empty file or content"
             )
 
-        self.client.upload_file(
-            temp_file_path,
-            settings.STORAGE_BUCKET,
-            path,
+        self.url_cache.invalidate(
+            settings.STORAGE_BUCKET, path
         )
-        os.remove(temp_file_path)
 
     def get(
         self, path: str, expires: int = None
@@ -48,6 +81,12 @@ class MinIOStorageService(
         if expires is None:
             return f"{settings.STORAGE_ENDPOINT_URL}/{settings.STORAGE_BUCKET}/{path}"
 
+        cached = self.url_cache.get(
+            settings.STORAGE_BUCKET, path, expires
+        )
+        if cached is not None:
+            return cached
+
         response = self.client.generate_presigned_url(
             "get_object",
             Params={
@@ -56,6 +95,9 @@ class MinIOStorageService(
             },
             ExpiresIn=expires,
         )
+        self.url_cache.put(
+            settings.STORAGE_BUCKET, path, expires, response
+        )
         return response
 
     def delete(self, path: str):  # pragma: no cover
@@ -63,3 +105,12 @@ class MinIOStorageService(
             Bucket=settings.STORAGE_BUCKET,
             Key=path,
         )
+        self.url_cache.invalidate(
+            settings.STORAGE_BUCKET, path
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "provider": "minio",
+            "presigned_url_cache": self.url_cache.get_stats(),
+        }
@@ -15,6 +15,6 @@ class FoodSqlAlchemyUnitOfWork(
     DefaultAlchemyUnitOfWork, FoodUnitOfWorkInterface
 ):
     def __enter__(self):
-        self.session: Session = self.session_factory()
+        self.session: Session = self._open_session()
         self.foods = FoodSqlAlchemyRepository(self.session)
         return super().__enter__()
@@ -14,7 +14,7 @@ class GroupSqlAlchemyUnitOfWork(
     DefaultAlchemyUnitOfWork, GroupUnitOfWorkInterface
 ):
     def __enter__(self):
-        self.session: Session = self.session_factory()
+        self.session: Session = self._open_session()
         self.groups = GroupSqlAlchemyRepository(
             self.session
         )
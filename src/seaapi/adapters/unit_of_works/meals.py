@@ -15,6 +15,6 @@ class MealSqlAlchemyUnitOfWork(
     DefaultAlchemyUnitOfWork, MealUnitOfWorkInterface
 ):
     def __enter__(self):
-        self.session: Session = self.session_factory()
+        self.session: Session = self._open_session()
         self.meals = MealSqlAlchemyRepository(self.session)
         return super().__enter__()
@@ -14,7 +14,7 @@ class PermissionSqlAlchemyUnitOfWork(
     DefaultAlchemyUnitOfWork, PermissionUnitOfWorkInterface
 ):
     def __enter__(self):
-        self.session: Session = self.session_factory()
+        self.session: Session = self._open_session()
         self.permissions = PermissionSqlAlchemyRepository(
             self.session
         )
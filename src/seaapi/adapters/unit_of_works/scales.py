@@ -15,7 +15,7 @@ class ScaleSqlAlchemyUnitOfWork(
     DefaultAlchemyUnitOfWork, ScaleUnitOfWorkInterface
 ):
     def __enter__(self):
-        self.session: Session = self.session_factory()
+        self.session: Session = self._open_session()
         self.scales = ScaleSqlAlchemyRepository(
             self.session
         )
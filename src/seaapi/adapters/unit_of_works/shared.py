@@ -1,9 +1,80 @@
-from typing import Any, Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, List, Optional
 from sqlalchemy.orm import Session
 
 from src.seaapi.domain.ports.unit_of_works import (
     DefaultUnitOfWorkInterface,
 )
+from src.seaapi.domain.ports.shared.exceptions import (
+    TransactionRolledBackException,
+)
+
+
+class SessionScope:
+    """
+    Sessão compartilhada pelas unidades de trabalho abertas dentro do
+    escopo. A primeira UoW abre a sessão; as aninhadas usam a mesma
+    transação, e commits pedidos por elas só acontecem quando a UoW
+    mais externa termina. Sem commit pedido, a UoW mais externa
+    descarta a transação ao sair. As ações registradas com
+    `after_commit` esperam o commit real e são descartadas num
+    rollback. Se uma UoW aninhada sai com exceção, a transação só pode
+    ser desfeita, mesmo que a exceção seja tratada por quem chamou. A
+    sessão é fechada ao fim do escopo.
+    """
+
+    def __init__(self, private: bool = False):
+        # Escopo de uma única UoW, usado fora de requisições
+        self.private = private
+        self.session: Optional[Session] = None
+        self.depth = 0
+        self.commit_requested = False
+        self.rollback_only = False
+        self.after_commit_callbacks: List[
+            Callable[[], Any]
+        ] = []
+
+    def enter(self, session_factory: Callable[[], Session]):
+        if self.session is None:
+            self.session = session_factory()
+        self.depth += 1
+        return self.session
+
+    def leave(self) -> bool:
+        """Retorna se a UoW que saiu era a mais externa"""
+        self.depth -= 1
+        return self.depth == 0
+
+    def pop_after_commit(self) -> List[Callable[[], Any]]:
+        callbacks = self.after_commit_callbacks
+        self.after_commit_callbacks = []
+        return callbacks
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+        self.commit_requested = False
+        self.rollback_only = False
+        self.after_commit_callbacks = []
+
+
+current_session_scope: ContextVar[
+    Optional[SessionScope]
+] = ContextVar("current_session_scope", default=None)
+
+
+@contextmanager
+def session_scope():
+    """Compartilha uma sessão entre as UoWs abertas no bloco"""
+    scope = SessionScope()
+    token = current_session_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        current_session_scope.reset(token)
+        scope.close()
 
 
 class DefaultAlchemyUnitOfWork(DefaultUnitOfWorkInterface):
@@ -11,16 +82,88 @@ class DefaultAlchemyUnitOfWork(DefaultUnitOfWorkInterface):
 
     def __init__(self, session_factory: Callable[[], Any]):
         self.session_factory = session_factory()
+        self._scopes: List[SessionScope] = []
+
+    def _open_session(self) -> Session:
+        scope = current_session_scope.get()
+        if scope is None:
+            # Sem escopo a UoW tem a própria sessão, que continua a
+            # mesma se ela for reaberta dentro de si mesma
+            if self._scopes and self._scopes[-1].private:
+                scope = self._scopes[-1]
+            else:
+                scope = SessionScope(private=True)
+        self._scopes.append(scope)
+        return scope.enter(self.session_factory)
 
     def __exit__(self, *args):
-        super().__exit__(*args)
-        self.session.close()
+        scope = self._scopes.pop()
+        if not scope.leave():
+            if args[1] is not None:
+                # As escritas parciais desta UoW ficam na transação
+                # compartilhada; a mais externa não pode confirmá-las
+                scope.rollback_only = True
+            return
+        committed = False
+        try:
+            if args[1] is None and scope.commit_requested:
+                self._commit_session(scope)
+                committed = True
+        finally:
+            try:
+                super().__exit__(*args)
+                if args[1] is None and not committed:
+                    # Sem commit pedido, o que ficou pendente na
+                    # transação não vaza para a próxima UoW do escopo
+                    self.session.rollback()
+            finally:
+                scope.commit_requested = False
+                scope.rollback_only = False
+                callbacks = scope.pop_after_commit()
+                if scope.private:
+                    scope.close()
+        if committed:
+            for callback in callbacks:
+                callback()
+
+    def _commit_session(
+        self, scope: Optional[SessionScope]
+    ):
+        if scope is not None and scope.rollback_only:
+            self.session.rollback()
+            raise TransactionRolledBackException()
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
 
     def _commit(self):
-        self.session.commit()
+        scope = self._scopes[-1] if self._scopes else None
+        if scope is not None and scope.depth > 1:
+            scope.commit_requested = True
+            return
+        self._commit_session(scope)
+        if scope is not None:
+            scope.commit_requested = False
+            for callback in scope.pop_after_commit():
+                callback()
+
+    def after_commit(self, callback: Callable[[], Any]):
+        """
+        Executa `callback` depois do commit real da transação, que
+        numa UoW aninhada só acontece quando a mais externa termina.
+        Deve ser registrado antes do commit; num rollback é descartado.
+        """
+        self._scopes[-1].after_commit_callbacks.append(
+            callback
+        )
 
     def rollback(self):
         self.session.rollback()
+        if self._scopes:
+            self._scopes[-1].rollback_only = False
+            self._scopes[-1].pop_after_commit()
 
     def expunge(self):
         self.session.expunge_all()
@@ -14,7 +14,7 @@ class TokenSqlAlchemyUnitOfWork(
     DefaultAlchemyUnitOfWork, TokenUnitOfWorkInterface
 ):
     def __enter__(self):
-        self.session: Session = self.session_factory()
+        self.session: Session = self._open_session()
         self.tokens = TokenSqlAlchemyRepository(
             self.session
         )
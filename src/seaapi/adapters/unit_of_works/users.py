@@ -15,6 +15,6 @@ class UserSqlAlchemyUnitOfWork(
     DefaultAlchemyUnitOfWork, UserUnitOfWorkInterface
 ):
     def __enter__(self):
-        self.session: Session = self.session_factory()
+        self.session: Session = self._open_session()
         self.users = UserSqlAlchemyRepository(self.session)
         return super().__enter__()
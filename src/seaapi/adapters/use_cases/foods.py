@@ -1,6 +1,9 @@
-from typing import Union
-from datetime import datetime
+import asyncio
 import logging
+import contextvars
+from functools import partial
+from typing import Optional, Union
+from datetime import datetime
 from src.seaapi.domain.entities import (
     FoodEntity,
     ScaleEntity,
@@ -19,13 +22,20 @@ from src.seaapi.domain.dtos.mics import (
     SuccessResponse,
     PaginationParams,
     PaginationData,
-    PaginationOptions,
+    pagination_options,
 )
 from src.seaapi.domain.ports.services.storage import (
+    AsyncStorageServiceInterface,
     StorageServiceInterface,
 )
+from src.seaapi.domain.ports.services.cache import (
+    CachedPayload,
+    VersionedCacheInterface,
+)
 from src.seaapi.domain.entities.food_entity import (
     food_model_factory,
+    food_photo_path,
+    upload_food_photo,
 )
 from src.seaapi.domain.ports.unit_of_works.foods import (
     FoodUnitOfWorkInterface,
@@ -40,6 +50,7 @@ from src.seaapi.domain.ports.services.nutrition import (
     NutritionServiceInterface,
 )
 from src.seaapi.domain.ports.shared.exceptions import (
+    CannotStorageFileException,
     NotAuthorizedException,
 )
 
@@ -47,6 +58,10 @@ from src.seaapi.domain.ports.shared.exceptions import (
 from src.seaapi.domain.shared.validators import (
     check_or_get_entity_if_exists,
 )
+from src.seaapi.domain.shared.cursors import next_cursor
+from src.seaapi.domain.shared.presign import (
+    PresignedUrlBatch,
+)
 from src.seaapi.adapters.use_cases.food_events import (
     FoodEventPublisher,
 )
@@ -60,19 +75,67 @@ class FoodService(FoodServiceInterface):
         uow: FoodUnitOfWorkInterface,
         scale_uow: ScaleUnitOfWorkInterface,
         storage_service: StorageServiceInterface,
+        async_storage_service: AsyncStorageServiceInterface,
         nutrition_service: NutritionServiceInterface,
         food_event_publisher: FoodEventPublisher,
+        menu_cache: VersionedCacheInterface,
     ):
         self.uow = uow
         self.scale_uow = scale_uow
         self.storage_service = storage_service
+        self.async_storage_service = async_storage_service
         self.nutrition_service = nutrition_service
         self.food_event_publisher = food_event_publisher
+        self.menu_cache = menu_cache
+
+    async def _run_sync(self, func, *args):
+        # Sessões e repositórios são síncronos e presos à thread,
+        # então cada bloco com a unit of work roda inteiro no pool.
+        # O contexto vai junto para a unit of work usar a sessão da
+        # requisição
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            None, partial(context.run, func, *args)
+        )
+
+    async def _discard_photo(self, path: str):
+        try:
+            await self.async_storage_service.delete(path)
+        except Exception as e:  # pragma: no cover
+            logger.error(
+                f"Erro ao remover foto {path}: {e}"
+            )
 
-    def _create(
+    async def _create(
         self, food: FoodCreateInputDto
     ) -> SuccessResponse:
+        new_food = await self._run_sync(
+            self._insert_food, food
+        )
+
+        if food.photo is not None:
+            try:
+                await upload_food_photo(
+                    self.async_storage_service,
+                    path=new_food.photo,
+                    file=food.photo,
+                )
+            except CannotStorageFileException:
+                await self._run_sync(
+                    self._discard_food, new_food.id
+                )
+                raise
 
+        return SuccessResponse(
+            message="Comida criada com sucesso!",
+            code="food_registered",
+            status_code=201,
+        )
+
+    def _insert_food(
+        self, food: FoodCreateInputDto
+    ) -> FoodEntity:
         with self.uow:
             new_food = food_model_factory(
                 name=food.name,
@@ -88,26 +151,79 @@ class FoodService(FoodServiceInterface):
             self.uow.flush()
 
             if food.photo is not None:
-                new_food.upload_photo(
-                    storage_service=self.storage_service,
-                    file=food.photo,
-                    replace=True,
+                new_food.set_photo(
+                    food_photo_path(
+                        new_food.id, food.photo.filename
+                    )
                 )
 
+            self.uow.after_commit(
+                self.menu_cache.invalidate
+            )
             self.uow.commit()
 
-            return SuccessResponse(
-                message="Comida criada com sucesso!",
-                code="food_registered",
-                status_code=201,
+            return new_food
+
+    def _discard_food(self, id_: int):
+        with self.uow:
+            existing_food = check_or_get_entity_if_exists(
+                id_=id_,
+                repository=self.uow.foods,
+                entity_class=FoodEntity,
             )
+            self.uow.foods.delete(existing_food)
+            self.uow.after_commit(
+                self.menu_cache.invalidate
+            )
+            self.uow.commit()
 
-    def _update_food(
+    async def _update_food(
         self,
         id_: int,
         food: FoodUpdateInputDto,
         scheduler,
     ) -> SuccessResponse:
+        # A nova foto sobe antes da transação; se a atualização
+        # falhar, o arquivo enviado é descartado
+        photo_path = None
+        if food.photo is not None:
+            photo_path = food_photo_path(
+                id_, food.photo.filename
+            )
+            await upload_food_photo(
+                self.async_storage_service,
+                path=photo_path,
+                file=food.photo,
+            )
+
+        try:
+            previous_photo = await self._run_sync(
+                self._apply_update,
+                id_,
+                food,
+                photo_path,
+                scheduler,
+            )
+        except Exception:
+            if photo_path is not None:
+                await self._discard_photo(photo_path)
+            raise
+
+        if photo_path is not None and previous_photo:
+            await self._discard_photo(previous_photo)
+
+        return SuccessResponse(
+            message="Dados do alimento atualizados com sucesso!",
+            code="food_updated",
+        )
+
+    def _apply_update(
+        self,
+        id_: int,
+        food: FoodUpdateInputDto,
+        photo_path: Optional[str],
+        scheduler,
+    ) -> Optional[str]:
         with self.uow:
             existing_food = check_or_get_entity_if_exists(
                 id_=id_,
@@ -142,11 +258,10 @@ class FoodService(FoodServiceInterface):
                 if field not in special_fields:
                     setattr(existing_food, field, value)
 
-            if food.photo is not None:
-                existing_food.upload_photo(
-                    storage_service=self.storage_service,
-                    file=food.photo,
-                    replace=True,
+            previous_photo = None
+            if photo_path is not None:
+                previous_photo = existing_food.set_photo(
+                    photo_path
                 )
 
             existing_food.updated_at = datetime.now()
@@ -222,6 +337,9 @@ class FoodService(FoodServiceInterface):
                     f"Erro ao preparar eventos: {e}"
                 )
 
+            self.uow.after_commit(
+                self.menu_cache.invalidate
+            )
             self.uow.commit()
 
             for event_coro in events_scheduled:
@@ -229,10 +347,7 @@ class FoodService(FoodServiceInterface):
                     event_coro, scheduler
                 )
 
-            return SuccessResponse(
-                message="Dados do alimento atualizados com sucesso!",
-                code="food_updated",
-            )
+            return previous_photo
 
     def _get_food(
         self, id_: int, entity: bool = False
@@ -255,27 +370,25 @@ class FoodService(FoodServiceInterface):
         self, params: PaginationParams
     ) -> PaginationData:
         with self.uow:
-            page = params.page
-            page_size = params.page_size
             foods, results = self.uow.foods.find_all(
                 params=params,
             )
-            pages = (results + page_size - 1) // page_size
+            storage_service = PresignedUrlBatch(
+                self.storage_service
+            )
             return PaginationData(
                 data=[
                     FoodOutputDto(
                         **food.to_beautiful_dict(
-                            storage_service=self.storage_service
+                            storage_service=storage_service
                         )
                     )
                     for food in foods
                 ],
-                options=PaginationOptions(
-                    page=page,
-                    pages=pages,
-                    size=page_size,
-                    results=results,
+                options=pagination_options(
+                    params, results, foods
                 ),
+                next_cursor=next_cursor(foods, params),
             )
 
     def _get_current_menu(
@@ -287,17 +400,33 @@ class FoodService(FoodServiceInterface):
                     scale_id={"not": None}, page=None
                 ),
             )
+            storage_service = PresignedUrlBatch(
+                self.storage_service
+            )
             return PaginationData(
                 data=[
                     FoodOutputDto(
                         **food.to_beautiful_dict(
-                            storage_service=self.storage_service
+                            storage_service=storage_service
                         )
                     )
                     for food in foods
                 ]
             )
 
+    def _get_current_menu_payload(self) -> CachedPayload:
+        # A versão é lida antes da consulta: se uma escrita acontecer
+        # no meio, o payload fica com a versão antiga e não é servido
+        version = self.menu_cache.version()
+        payload = self.menu_cache.get(version)
+        if payload is not None:
+            return payload
+
+        menu = self._get_current_menu()
+        return self.menu_cache.put(
+            version, menu.json().encode()
+        )
+
     def _delete_food(
         self,
         id_: int,
@@ -328,6 +457,9 @@ class FoodService(FoodServiceInterface):
                 )
 
             self.uow.foods.delete(existing_food)
+            self.uow.after_commit(
+                self.menu_cache.invalidate
+            )
             self.uow.commit()
 
             if event_coro:
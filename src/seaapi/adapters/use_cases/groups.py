@@ -12,7 +12,7 @@ from src.seaapi.domain.dtos.groups import (
 from src.seaapi.domain.dtos.mics import (
     SuccessResponse,
     PaginationData,
-    PaginationOptions,
+    pagination_options,
     PaginationParams,
 )
 
@@ -25,6 +25,9 @@ from src.seaapi.domain.ports.unit_of_works.permissions import (
 from src.seaapi.domain.ports.use_cases.groups import (
     GroupServiceInterface,
 )
+from src.seaapi.domain.ports.services.cache import (
+    PrincipalCacheInterface,
+)
 from src.seaapi.domain.shared.utils import (
     update_entity_list,
 )
@@ -38,9 +41,11 @@ class GroupService(GroupServiceInterface):
         self,
         uow: GroupUnitOfWorkInterface,
         permission_uow: PermissionUnitOfWorkInterface,
+        principal_cache: PrincipalCacheInterface,
     ):
         self.uow = uow
         self.permission_uow = permission_uow
+        self.principal_cache = principal_cache
 
     def _create(
         self, group: GroupCreateInputDto
@@ -95,6 +100,10 @@ class GroupService(GroupServiceInterface):
                 repository="permissions",
                 uow=self.permission_uow,
             )
+            # As permissões de todos os membros do grupo podem mudar
+            self.uow.after_commit(
+                self.principal_cache.invalidate_all
+            )
             self.uow.commit()
 
             return SuccessResponse(
@@ -106,20 +115,13 @@ class GroupService(GroupServiceInterface):
         self, params: PaginationParams
     ) -> PaginationData:
         with self.uow:
-            page = params.page
-            page_size = params.page_size
-
             groups, results = self.uow.groups.find_all(
                 params=params,
             )
-            pages = (results + page_size - 1) // page_size
 
             return PaginationData(
                 data=groups,
-                options=PaginationOptions(
-                    page=page,
-                    pages=pages,
-                    size=page_size,
-                    results=results,
+                options=pagination_options(
+                    params, results, groups
                 ),
             )
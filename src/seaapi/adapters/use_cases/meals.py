@@ -20,7 +20,7 @@ from src.seaapi.domain.dtos.mics import (
     SuccessResponse,
     PaginationParams,
     PaginationData,
-    PaginationOptions,
+    pagination_options,
 )
 from src.seaapi.domain.entities.meal_entity import (
     meal_model_factory,
@@ -47,6 +47,10 @@ from src.seaapi.domain.ports.shared.exceptions import (
 from src.seaapi.domain.shared.validators import (
     check_or_get_entity_if_exists,
 )
+from src.seaapi.domain.shared.cursors import next_cursor
+from src.seaapi.domain.shared.presign import (
+    PresignedUrlBatch,
+)
 
 
 class MealService(MealServiceInterface):
@@ -158,27 +162,25 @@ class MealService(MealServiceInterface):
         self, params: PaginationParams
     ) -> PaginationData:
         with self.uow:
-            page = params.page
-            page_size = params.page_size
             meals, results = self.uow.meals.find_all(
                 params=params,
             )
-            pages = (results + page_size - 1) // page_size
+            storage_service = PresignedUrlBatch(
+                self.storage_service
+            )
             return PaginationData(
                 data=[
                     MealOutputDto(
                         **meal.to_beautiful_dict(
-                            storage_service=self.storage_service
+                            storage_service=storage_service
                         )
                     )
                     for meal in meals
                 ],
-                options=PaginationOptions(
-                    page=page,
-                    pages=pages,
-                    size=page_size,
-                    results=results,
+                options=pagination_options(
+                    params, results, meals
                 ),
+                next_cursor=next_cursor(meals, params),
             )
 
     def _get_meal(
@@ -229,29 +231,26 @@ class MealService(MealServiceInterface):
         self, user_id: int, params: PaginationParams
     ) -> PaginationData:
         with self.uow:
-            page = params.page
-            page_size = params.page_size
-
             params.user_id = user_id
             meals, results = self.uow.meals.find_all(
                 params=params
             )
-            pages = (results + page_size - 1) // page_size
+            storage_service = PresignedUrlBatch(
+                self.storage_service
+            )
             return PaginationData(
                 data=[
                     MealOutputDto(
                         **meal.to_beautiful_dict(
-                            storage_service=self.storage_service
+                            storage_service=storage_service
                         )
                     )
                     for meal in meals
                 ],
-                options=PaginationOptions(
-                    page=page,
-                    pages=pages,
-                    size=page_size,
-                    results=results,
+                options=pagination_options(
+                    params, results, meals
                 ),
+                next_cursor=next_cursor(meals, params),
             )
 
     def _get_user_meal(
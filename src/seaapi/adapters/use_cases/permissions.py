@@ -7,7 +7,7 @@ from src.seaapi.domain.dtos.permissions import (
 from src.seaapi.domain.dtos.mics import (
     SuccessResponse,
     PaginationData,
-    PaginationOptions,
+    pagination_options,
     PaginationParams,
 )
 
@@ -47,22 +47,16 @@ class PermissionService(PermissionServiceInterface):
         self, params: PaginationParams
     ) -> PaginationData:
         with self.uow:
-            page = params.page
-            page_size = params.page_size
             (
                 permissions,
                 results,
             ) = self.uow.permissions.find_all(
                 params=params,
             )
-            pages = (results + page_size - 1) // page_size
 
             return PaginationData(
                 data=permissions,
-                options=PaginationOptions(
-                    page=page,
-                    pages=pages,
-                    size=page_size,
-                    results=results,
+                options=pagination_options(
+                    params, results, permissions
                 ),
             )
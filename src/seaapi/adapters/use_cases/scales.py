@@ -11,7 +11,7 @@ from src.seaapi.domain.dtos.mics import (
     SuccessResponse,
     PaginationParams,
     PaginationData,
-    PaginationOptions,
+    pagination_options,
 )
 from src.seaapi.domain.entities.scale_entity import (
     scale_model_factory,
@@ -22,6 +22,9 @@ from src.seaapi.domain.ports.unit_of_works.scales import (
 from src.seaapi.domain.ports.use_cases.scales import (
     ScaleServiceInterface,
 )
+from src.seaapi.domain.ports.services.cache import (
+    VersionedCacheInterface,
+)
 from src.seaapi.domain.ports.shared.exceptions import (
     NotAuthorizedException,
 )
@@ -30,14 +33,17 @@ from src.seaapi.domain.ports.shared.exceptions import (
 from src.seaapi.domain.shared.validators import (
     check_or_get_entity_if_exists,
 )
+from src.seaapi.domain.shared.cursors import next_cursor
 
 
 class ScaleService(ScaleServiceInterface):
     def __init__(
         self,
         uow: ScaleUnitOfWorkInterface,
+        menu_cache: VersionedCacheInterface,
     ):
         self.uow = uow
+        self.menu_cache = menu_cache
 
     def _create(
         self, scale: ScaleCreateInputDto
@@ -73,6 +79,9 @@ class ScaleService(ScaleServiceInterface):
                 exclude_unset=True
             ).items():
                 setattr(existing_scale, field, value)
+            self.uow.after_commit(
+                self.menu_cache.invalidate
+            )
             self.uow.commit()
 
             return SuccessResponse(
@@ -99,23 +108,18 @@ class ScaleService(ScaleServiceInterface):
         self, params: PaginationParams
     ) -> PaginationData:
         with self.uow:
-            page = params.page
-            page_size = params.page_size
             scales, results = self.uow.scales.find_all(
                 params=params,
             )
-            pages = (results + page_size - 1) // page_size
             return PaginationData(
                 data=[
                     ScaleOutputDto(**scale.to_dict())
                     for scale in scales
                 ],
-                options=PaginationOptions(
-                    page=page,
-                    pages=pages,
-                    size=page_size,
-                    results=results,
+                options=pagination_options(
+                    params, results, scales
                 ),
+                next_cursor=next_cursor(scales, params),
             )
 
     def _delete_scale(
@@ -133,6 +137,9 @@ class ScaleService(ScaleServiceInterface):
 
             self.uow.scales.delete(existing_scale)
 
+            self.uow.after_commit(
+                self.menu_cache.invalidate
+            )
             self.uow.commit()
 
             return SuccessResponse(
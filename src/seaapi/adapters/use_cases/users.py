@@ -1,5 +1,6 @@
 import json
 import base64
+from functools import partial
 from typing import Union
 from datetime import datetime
 from src.seaapi.domain.shared.hash import Hasher
@@ -7,6 +8,7 @@ from src.seaapi.config.settings import settings
 from src.seaapi.domain.entities import (
     UserEntity,
     GroupEntity,
+    Principal,
 )
 from src.seaapi.domain.dtos.users import (
     UserCreateInputDto,
@@ -20,7 +22,7 @@ from src.seaapi.domain.dtos.mics import (
     SuccessResponse,
     PaginationParams,
     PaginationData,
-    PaginationOptions,
+    pagination_options,
 )
 from src.seaapi.domain.dtos.tokens import (
     TokenCreateInputDto,
@@ -59,6 +61,9 @@ from src.seaapi.domain.ports.use_cases.tokens import (
 from src.seaapi.domain.ports.services.notification import (
     NotificationServiceInterface,
 )
+from src.seaapi.domain.ports.services.cache import (
+    PrincipalCacheInterface,
+)
 
 from src.seaapi.domain.shared.security import (
     password_reset_token_generator,
@@ -73,6 +78,7 @@ from src.seaapi.domain.shared.utils import (
 from src.seaapi.domain.shared.validators import (
     check_or_get_entity_if_exists,
 )
+from src.seaapi.domain.shared.cursors import next_cursor
 
 
 class UserService(UserServiceInterface):
@@ -82,12 +88,14 @@ class UserService(UserServiceInterface):
         group_uow: GroupUnitOfWorkInterface,
         token_service: TokenServiceInterface,
         notification_service: NotificationServiceInterface,
+        principal_cache: PrincipalCacheInterface,
     ):
         self.uow = uow
         self.group_uow = group_uow
 
         self.token_service = token_service
         self.notification_service = notification_service
+        self.principal_cache = principal_cache
 
     def _create(
         self, user: UserCreateInputDto, raises=True
@@ -217,6 +225,11 @@ class UserService(UserServiceInterface):
                 )
 
             existing_user.updated_at = datetime.now()
+            self.uow.after_commit(
+                partial(
+                    self.principal_cache.invalidate, id_
+                )
+            )
             self.uow.commit()
 
             return SuccessResponse(
@@ -260,8 +273,27 @@ class UserService(UserServiceInterface):
                 **user_.to_beautiful_dict(),
             )
 
+    def _get_principal(self, id_: int) -> Principal:
+        version = self.principal_cache.version(id_)
+        if version is not None:
+            principal = self.principal_cache.get(
+                id_, version
+            )
+            if principal is not None:
+                return principal
+
+        with self.uow:
+            principal = check_or_get_entity_if_exists(
+                id_=id_,
+                repository=self.uow.users,
+                entity_class=UserEntity,
+            ).principal
+        if version is not None:
+            self.principal_cache.put(version, principal)
+        return principal
+
     def _get_authenticated_user(
-        self, entity: UserEntity
+        self, entity: Principal
     ) -> UserOutputDto:
         return self._get_user(id_=entity.id)
 
@@ -269,12 +301,9 @@ class UserService(UserServiceInterface):
         self, params: PaginationParams
     ) -> PaginationData:
         with self.uow:
-            page = params.page
-            page_size = params.page_size
             users, results = self.uow.users.find_all(
                 params=params,
             )
-            pages = (results + page_size - 1) // page_size
 
             return PaginationData(
                 data=[
@@ -283,12 +312,10 @@ class UserService(UserServiceInterface):
                     )
                     for user in users
                 ],
-                options=PaginationOptions(
-                    page=page,
-                    pages=pages,
-                    size=page_size,
-                    results=results,
+                options=pagination_options(
+                    params, results, users
                 ),
+                next_cursor=next_cursor(users, params),
             )
 
     def _deactivate_user(
@@ -306,6 +333,11 @@ class UserService(UserServiceInterface):
 
             existing_user.soft_delete()
 
+            self.uow.after_commit(
+                partial(
+                    self.principal_cache.invalidate, id_
+                )
+            )
             self.uow.commit()
 
             return SuccessResponse(
@@ -329,6 +361,11 @@ class UserService(UserServiceInterface):
 
             existing_user.recover()
 
+            self.uow.after_commit(
+                partial(
+                    self.principal_cache.invalidate, id_
+                )
+            )
             self.uow.commit()
 
             return SuccessResponse(
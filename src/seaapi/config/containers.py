@@ -1,7 +1,5 @@
 from dependency_injector import containers, providers
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
-from src.seaapi import config
 from src.seaapi.adapters.unit_of_works import (
     UserSqlAlchemyUnitOfWork,
     GroupSqlAlchemyUnitOfWork,
@@ -23,6 +21,7 @@ from src.seaapi.adapters.use_cases import (
     QRCodeService,
 )
 from src.seaapi.config.settings import settings
+from src.seaapi.adapters.db.engine import get_engine
 
 from src.seaapi.adapters.services.notification.email import (
     EmailNotificationService,
@@ -47,18 +46,28 @@ from src.seaapi.adapters.services.qrcode import (
 from src.seaapi.adapters.services.storage import (
     S3StorageService,
     MinIOStorageService,
+    ExecutorStorageService,
 )
 
 from src.seaapi.adapters.services.nutrition import (
     OpenAINutritionService,
 )
 
+from src.seaapi.adapters.services.caching import (
+    MemoryVersionedCache,
+    RedisVersionedCache,
+    MemoryPrincipalCache,
+    RedisPrincipalCache,
+)
 from src.seaapi.adapters.services.rate_limiting import (
+    LeasingRateLimiter,
     MemoryRateLimiter,
     RedisRateLimiter,
 )
-
-ENGINE = create_engine(config.get_database_uri())
+from src.seaapi.adapters.services.hashing import (
+    InlinePasswordHasher,
+    ProcessPoolPasswordHasher,
+)
 
 
 class Container(containers.DeclarativeContainer):
@@ -71,7 +80,7 @@ class Container(containers.DeclarativeContainer):
     def DEFAULT_SESSION_FACTORY():
         return scoped_session(
             sessionmaker(
-                bind=ENGINE, expire_on_commit=False
+                bind=get_engine(), expire_on_commit=False
             )
         )
 
@@ -128,15 +137,54 @@ class Container(containers.DeclarativeContainer):
         else MinIOStorageService,
     )
 
+    async_storage_service = providers.Singleton(
+        ExecutorStorageService,
+        storage_service=storage_service,
+        max_workers=settings.STORAGE_MAX_CONNECTIONS,
+    )
+
+    password_hasher = (
+        providers.Singleton(
+            ProcessPoolPasswordHasher,
+            rounds=settings.PASSWORD_HASH_ROUNDS,
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+        )
+        if settings.PASSWORD_HASH_BACKEND == "process"
+        else providers.Singleton(
+            InlinePasswordHasher,
+            rounds=settings.PASSWORD_HASH_ROUNDS,
+        )
+    )
+
     token_service = providers.Factory(
         TokenService,
         uow=token_uow,
     )
 
+    principal_cache = (
+        providers.Singleton(
+            RedisPrincipalCache,
+            max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+            redis_url=settings.REDIS_URL,
+            timeout_seconds=settings.PRINCIPAL_CACHE_REDIS_TIMEOUT_SECONDS,
+            password=settings.REDIS_PASSWORD,
+            db=settings.REDIS_DB,
+        )
+        if settings.PRINCIPAL_CACHE_BACKEND == "redis"
+        else providers.Singleton(
+            MemoryPrincipalCache,
+            max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+    )
+
     group_service = providers.Factory(
         GroupService,
         uow=group_uow,
         permission_uow=permission_uow,
+        principal_cache=principal_cache,
     )
 
     permission_service = providers.Factory(
@@ -144,15 +192,53 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Rate Limiter Configuration
+    redis_rate_limiter = providers.Singleton(
+        RedisRateLimiter,
+        redis_url=settings.REDIS_URL,
+        algorithm=settings.RATE_LIMITING_REDIS_ALGORITHM,
+        fail_open=settings.RATE_LIMITING_FAIL_OPEN,
+        timeout_seconds=settings.RATE_LIMITING_REDIS_TIMEOUT_SECONDS,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        stats_window_minutes=settings.RATE_LIMITING_STATS_WINDOW_MINUTES,
+        password=settings.REDIS_PASSWORD,
+        db=settings.REDIS_DB,
+    )
+
     rate_limiter = (
+        (
+            providers.Singleton(
+                LeasingRateLimiter,
+                limiter=redis_rate_limiter,
+                max_overshoot=settings.RATE_LIMITING_LOCAL_MAX_OVERSHOOT,
+                workers=settings.RATE_LIMITING_LOCAL_WORKERS,
+            )
+            if settings.RATE_LIMITING_LOCAL_LEASE_ENABLED
+            else redis_rate_limiter
+        )
+        if settings.RATE_LIMITING_BACKEND == "redis"
+        else providers.Singleton(
+            MemoryRateLimiter,
+            algorithm=settings.RATE_LIMITING_ALGORITHM,
+            sweep_interval_seconds=settings.RATE_LIMITING_SWEEP_INTERVAL_SECONDS,
+        )
+    )
+
+    menu_cache = (
         providers.Singleton(
-            RedisRateLimiter,
+            RedisVersionedCache,
+            namespace="menu",
+            ttl_seconds=settings.MENU_CACHE_TTL_SECONDS,
             redis_url=settings.REDIS_URL,
+            timeout_seconds=settings.MENU_CACHE_REDIS_TIMEOUT_SECONDS,
             password=settings.REDIS_PASSWORD,
             db=settings.REDIS_DB,
         )
-        if settings.RATE_LIMITING_BACKEND == "redis"
-        else providers.Singleton(MemoryRateLimiter)
+        if settings.MENU_CACHE_BACKEND == "redis"
+        else providers.Singleton(
+            MemoryVersionedCache,
+            namespace="menu",
+            ttl_seconds=settings.MENU_CACHE_TTL_SECONDS,
+        )
     )
 
     mqtt_publisher = providers.Factory(MQTTPublisher)
@@ -185,8 +271,10 @@ class Container(containers.DeclarativeContainer):
         uow=food_uow,
         scale_uow=scale_uow,
         storage_service=storage_service,
+        async_storage_service=async_storage_service,
         nutrition_service=nutrition_service,
         food_event_publisher=food_event_publisher,
+        menu_cache=menu_cache,
     )
 
     user_service = providers.Factory(
@@ -195,6 +283,7 @@ class Container(containers.DeclarativeContainer):
         group_uow=group_uow,
         token_service=token_service,
         notification_service=notification_service,
+        principal_cache=principal_cache,
     )
 
     meal_service = providers.Factory(
@@ -208,6 +297,7 @@ class Container(containers.DeclarativeContainer):
     scale_service = providers.Factory(
         ScaleService,
         uow=scale_uow,
+        menu_cache=menu_cache,
     )
 
     qrcode_service = providers.Factory(
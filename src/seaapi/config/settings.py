@@ -33,11 +33,59 @@ class Settings:
         + f"@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
     )
     DATABASE_URL = DATABASE_URL.replace("%", "%%")
+    # Pool de conexões, por worker do uvicorn: o total de conexões é
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) e precisa caber no
+    # max_connections do Postgres
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5))
+    DB_POOL_TIMEOUT_SECONDS = float(
+        os.getenv("DB_POOL_TIMEOUT_SECONDS", 10)
+    )
+    DB_POOL_PRE_PING = (
+        os.getenv("DB_POOL_PRE_PING", "true").lower()
+        == "true"
+    )
+    DB_POOL_RECYCLE_SECONDS = int(
+        os.getenv("DB_POOL_RECYCLE_SECONDS", 1800)
+    )
+    # 0 desliga o limite
+    DB_STATEMENT_TIMEOUT_MS = int(
+        os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000)
+    )
 
     SECRET_KEY: str = os.getenv("SECRET_KEY")
-    ALGORITHM = "HS256"
+    ALGORITHM = os.getenv(
+        "JWT_ALGORITHM", "HS256"
+    )  # HS256, ES256 or EdDSA
+    # Chaves PEM (P-256 ou Ed25519) dos modos ES256/EdDSA, separadas por
+    # vírgula. A primeira assina os tokens; as demais, que podem ser só
+    # públicas, continuam aceitas e publicadas no JWKS até os tokens
+    # assinados com elas expirarem
+    JWT_KEY_PATHS = [
+        path.strip()
+        for path in os.getenv("JWT_KEY_PATHS", "").split(
+            ","
+        )
+        if path.strip()
+    ]
+    # Serviços que só verificam tokens podem ler as chaves públicas do
+    # JWKS da API em vez de receber os arquivos
+    JWT_JWKS_URL = os.getenv("JWT_JWKS_URL")
+    JWT_JWKS_CACHE_SECONDS = int(
+        os.getenv("JWT_JWKS_CACHE_SECONDS", 300)
+    )
     ACCESS_TOKEN_EXPIRE_MINUTES = 30  # in mins
     REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24  # in mins
+    # native: HMAC verificado direto com hashlib, com fallback para o
+    # python-jose em tokens fora do formato emitido pela API; jose: só
+    # python-jose
+    JWT_VERIFY_BACKEND = os.getenv(
+        "JWT_VERIFY_BACKEND", "native"
+    )  # native or jose
+    # Tokens já verificados, guardados até expirarem
+    JWT_VERIFY_CACHE_MAX_ENTRIES = int(
+        os.getenv("JWT_VERIFY_CACHE_MAX_ENTRIES", 10000)
+    )
 
     TEST_USER_EMAIL = "test@example.com"
 
@@ -46,6 +94,25 @@ class Settings:
 
     FORGOT_PASSWORD_TOKEN_DURATION = 60 * 24
 
+    # Password Hashing Configuration
+    PASSWORD_HASH_BACKEND = os.getenv(
+        "PASSWORD_HASH_BACKEND", "process"
+    )  # process or inline
+    # Custo do bcrypt (2^rounds iterações). Hashes com outro custo são
+    # refeitos no próximo login do usuário
+    PASSWORD_HASH_ROUNDS = int(
+        os.getenv("PASSWORD_HASH_ROUNDS", 12)
+    )
+    # Processos de hashing por worker do uvicorn
+    PASSWORD_HASH_WORKERS = int(
+        os.getenv("PASSWORD_HASH_WORKERS", 1)
+    )
+    # Hashes na fila ou em execução antes de responder 503; precisa
+    # ficar bem abaixo do pool de threads das rotas síncronas (40)
+    PASSWORD_HASH_MAX_PENDING = int(
+        os.getenv("PASSWORD_HASH_MAX_PENDING", 8)
+    )
+
     MAIL_SERVER: str = os.getenv(
         "MAIL_SERVER", "smtp.example.com"
     )
@@ -76,9 +143,64 @@ class Settings:
     STORAGE_SECRET_KEY = os.getenv("STORAGE_SECRET_KEY")
     STORAGE_BUCKET = os.getenv("STORAGE_BUCKET")
     STORAGE_REGION = os.getenv("STORAGE_REGION")
+    STORAGE_URL_CACHE_MAX_ENTRIES = int(
+        os.getenv("STORAGE_URL_CACHE_MAX_ENTRIES", 2048)
+    )
+    STORAGE_MULTIPART_THRESHOLD = int(
+        os.getenv(
+            "STORAGE_MULTIPART_THRESHOLD", 8 * 1024 * 1024
+        )
+    )
+    STORAGE_MULTIPART_CHUNKSIZE = int(
+        os.getenv(
+            "STORAGE_MULTIPART_CHUNKSIZE", 8 * 1024 * 1024
+        )
+    )
+    STORAGE_MAX_CONNECTIONS = int(
+        os.getenv("STORAGE_MAX_CONNECTIONS", 20)
+    )
+    STORAGE_MAX_RETRIES = int(
+        os.getenv("STORAGE_MAX_RETRIES", 3)
+    )
 
     PRICE_PER_KG = float(os.getenv("PRICE_PER_KG", 49.9))
 
+    CONDITIONAL_GET_ENABLED = (
+        os.getenv("CONDITIONAL_GET_ENABLED", "true").lower()
+        == "true"
+    )
+
+    # Menu Cache Configuration
+    MENU_CACHE_BACKEND = os.getenv(
+        "MENU_CACHE_BACKEND", "memory"
+    )  # memory or redis
+    # Precisa ficar abaixo da validade das URLs das fotos (3000s)
+    MENU_CACHE_TTL_SECONDS = int(
+        os.getenv("MENU_CACHE_TTL_SECONDS", 300)
+    )
+    # Com o backend redis, a consulta cai no banco se o Redis demorar
+    MENU_CACHE_REDIS_TIMEOUT_SECONDS = float(
+        os.getenv("MENU_CACHE_REDIS_TIMEOUT_SECONDS", 0.1)
+    )
+    # Cache do usuário autenticado e suas permissões
+    PRINCIPAL_CACHE_BACKEND = os.getenv(
+        "PRINCIPAL_CACHE_BACKEND", "memory"
+    )  # memory or redis
+    # Com o backend memory, é o atraso máximo para os outros workers
+    # enxergarem uma alteração de permissões
+    PRINCIPAL_CACHE_TTL_SECONDS = int(
+        os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 60)
+    )
+    PRINCIPAL_CACHE_MAX_ENTRIES = int(
+        os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000)
+    )
+    # Com o backend redis, a consulta cai no banco se o Redis demorar
+    PRINCIPAL_CACHE_REDIS_TIMEOUT_SECONDS = float(
+        os.getenv(
+            "PRINCIPAL_CACHE_REDIS_TIMEOUT_SECONDS", 0.1
+        )
+    )
+
     # Messaging Configuration
     MESSAGING_ENABLED = (
         os.getenv("MESSAGING_ENABLED", "false").lower()
@@ -125,6 +247,17 @@ class Settings:
     RATE_LIMITING_BACKEND = os.getenv(
         "RATE_LIMITING_BACKEND", "memory"
     )  # memory or redis
+    RATE_LIMITING_ALGORITHM = os.getenv(
+        "RATE_LIMITING_ALGORITHM", "sliding_window"
+    )  # sliding_window, fixed_window or gcra
+    RATE_LIMITING_REDIS_ALGORITHM = os.getenv(
+        "RATE_LIMITING_REDIS_ALGORITHM", "sliding_log"
+    )  # sliding_log or gcra
+    RATE_LIMITING_SWEEP_INTERVAL_SECONDS = int(
+        os.getenv(
+            "RATE_LIMITING_SWEEP_INTERVAL_SECONDS", 60
+        )
+    )
     RATE_LIMITING_DEFAULT_MAX_REQUESTS = int(
         os.getenv("RATE_LIMITING_DEFAULT_MAX_REQUESTS", 100)
     )
@@ -140,6 +273,39 @@ class Settings:
     )
     REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
     REDIS_DB = int(os.getenv("REDIS_DB", 0))
+    REDIS_MAX_CONNECTIONS = int(
+        os.getenv("REDIS_MAX_CONNECTIONS", 50)
+    )
+    RATE_LIMITING_REDIS_TIMEOUT_SECONDS = float(
+        os.getenv(
+            "RATE_LIMITING_REDIS_TIMEOUT_SECONDS", 0.1
+        )
+    )
+    # Minutos cobertos pelas estatísticas incrementais do Redis
+    RATE_LIMITING_STATS_WINDOW_MINUTES = int(
+        os.getenv("RATE_LIMITING_STATS_WINDOW_MINUTES", 5)
+    )
+    # Fichas reservadas do Redis em lotes e consumidas em cada worker;
+    # o limite global pode ser excedido em até MAX_OVERSHOOT (fração)
+    RATE_LIMITING_LOCAL_LEASE_ENABLED = (
+        os.getenv(
+            "RATE_LIMITING_LOCAL_LEASE_ENABLED", "false"
+        ).lower()
+        == "true"
+    )
+    RATE_LIMITING_LOCAL_MAX_OVERSHOOT = float(
+        os.getenv("RATE_LIMITING_LOCAL_MAX_OVERSHOOT", 0.1)
+    )
+    # Quantidade de workers do uvicorn que dividem o excedente
+    RATE_LIMITING_LOCAL_WORKERS = int(
+        os.getenv("RATE_LIMITING_LOCAL_WORKERS", 6)
+    )
+    # Libera (true) ou recusa (false) as requisições quando o Redis
+    # do rate limiter estiver fora ou lento
+    RATE_LIMITING_FAIL_OPEN = (
+        os.getenv("RATE_LIMITING_FAIL_OPEN", "true").lower()
+        == "true"
+    )
 
 
 settings = Settings()
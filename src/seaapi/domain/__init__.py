@@ -11,31 +11,31 @@ class Role(Enum):
     def id(self):
         return self.value.get("id")
 
-    def check_privileges(self, groups, exact=False):
-        user_priority = float(
-            "inf"
-        )  # Initialize with positive infinity
-        value = self.value
+    @property
+    def priority(self):
+        return self.value.get("priority", float("inf"))
+
+    @classmethod
+    def effective_priority(cls, groups) -> int:
+        """
+        Menor prioridade entre os cargos do usuário; quem não tem
+        nenhum dos cargos fixos fica com a de NORMAL
+        """
+        priority = cls.NORMAL.priority
         for group_id in groups:
             if group_id >= 0 and group_id <= 2:
-                group = self._member_map_[
-                    self._member_names_[group_id]
+                group = cls._member_map_[
+                    cls._member_names_[group_id]
                 ]
-                if "priority" in group.value:
-                    user_priority = min(
-                        user_priority,
-                        group.value["priority"],
-                    )
-        priority = min(
-            user_priority,
-            self.NORMAL.value.get("priority", float("inf")),
-        )
-
-        target_priority = value.get(
-            "priority", float("inf")
-        )
+                priority = min(priority, group.priority)
+        return priority
 
+    def allows(self, priority, exact=False) -> bool:
         if exact:
-            return target_priority == priority
-        else:
-            return priority <= target_priority
+            return self.priority == priority
+        return priority <= self.priority
+
+    def check_privileges(self, groups, exact=False):
+        return self.allows(
+            self.effective_priority(groups), exact
+        )
@@ -11,7 +11,7 @@ from pydantic import (
     errors,
 )
 from pydantic.datetime_parse import parse_date
-from typing import List, Optional
+from typing import Any, List, Optional, Literal
 
 
 class OrderField(ConstrainedStr):
@@ -46,23 +46,88 @@ class SuccessWithIdResponse(SuccessResponse):
     reference_id: int
 
 
+CountMode = Literal["exact", "window", "estimate", "none"]
+
+
 class PaginationParams(BaseModel):
     page: Optional[int] = 1
     page_size: int = 10
     search: Optional[str]
     order: Optional[OrderField]
+    after: Optional[str]
+    count: CountMode = "exact"
 
 
 class PaginationOptions(BaseModel):
     page: int
-    pages: int
-    results: int
+    pages: Optional[int]
+    results: Optional[int]
     size: int
+    count_mode: CountMode = "exact"
+    has_next: Optional[bool]
 
 
 class PaginationData(BaseModel):
     data: List
     options: Optional[PaginationOptions]
+    next_cursor: Optional[str]
+
+
+class PageItems(list):
+    """
+    Linhas de uma página lida com uma linha extra além do tamanho da
+    página, que diz em `has_next` se existe próxima página.
+    """
+
+    has_next: Optional[bool] = None
+
+
+def pagination_options(
+    params: PaginationParams,
+    results: int,
+    items: Optional[List] = None,
+) -> PaginationOptions:
+    """
+    Monta as opções de paginação de acordo com o modo de contagem.
+    No modo "none" `results` é apenas o total de linhas já vistas
+    (offset + linhas lidas), suficiente para saber se há próxima página.
+    Quando o repositório leu uma linha extra, `has_next` vem de `items`,
+    e não do total, que pode ser estimado. Páginas por cursor não têm
+    número de páginas.
+    """
+    page_size = params.page_size
+    counted = params.count != "none"
+    has_next = getattr(items, "has_next", None)
+
+    if params.after:
+        return PaginationOptions(
+            page=params.page,
+            size=page_size,
+            results=results if counted else None,
+            count_mode=params.count,
+            has_next=has_next,
+        )
+
+    if has_next is None:
+        offset = (params.page - 1) * page_size
+        has_next = results > offset + page_size
+
+    if not counted:
+        return PaginationOptions(
+            page=params.page,
+            size=page_size,
+            count_mode=params.count,
+            has_next=has_next,
+        )
+
+    return PaginationOptions(
+        page=params.page,
+        pages=(results + page_size - 1) // page_size,
+        size=page_size,
+        results=results,
+        count_mode=params.count,
+        has_next=has_next,
+    )
 
 
 class ZipCode(ConstrainedStr):
@@ -329,9 +394,10 @@ default_pagination_params = PaginationParams(
 
 
 class UploadedFile(BaseModel):
-    content: bytes
     filename: str
-    relative_path: str
+    content: Optional[bytes] = None
+    file: Optional[Any] = None
+    relative_path: Optional[str] = None
 
 
 def partial(*fields):
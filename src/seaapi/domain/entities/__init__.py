@@ -14,4 +14,5 @@ from .food_measurement_entity import (  # noqa: #F401
     FoodMeasurementEntity,
 )
 from .meal_entity import MealEntity  # noqa: #F401
+from .principal_entity import Principal  # noqa: #F401
 from .base import BaseEntity  # noqa: #F401
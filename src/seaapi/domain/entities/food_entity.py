@@ -1,9 +1,11 @@
+import logging
 from time import time
 from dataclasses import dataclass, field
 from typing import Optional
 
 from src.seaapi.domain.entities.base import BaseEntity
 from src.seaapi.domain.ports.services.storage import (
+    AsyncStorageServiceInterface,
     StorageServiceInterface,
 )
 from src.seaapi.domain.ports.shared.exceptions import (
@@ -14,6 +16,28 @@ from src.seaapi.domain.entities.scale_entity import (
 )
 from src.seaapi.domain.dtos.mics import UploadedFile
 
+logger = logging.getLogger(__name__)
+
+
+def food_photo_path(food_id: int, filename: str) -> str:
+    return f"photos/meals/{food_id}/{time()}_{filename}"
+
+
+async def upload_food_photo(
+    storage_service: AsyncStorageServiceInterface,
+    path: str,
+    file: UploadedFile,
+):
+    try:
+        await storage_service.upload(
+            path=path,
+            content=file.content,
+            file=file.file,
+        )
+    except Exception as e:  # pragma: no cover
+        logger.error(f"Erro ao enviar foto {path}: {e}")
+        raise CannotStorageFileException()
+
 
 @dataclass
 class FoodEntity(BaseEntity):
@@ -38,6 +62,7 @@ class FoodEntity(BaseEntity):
         display_name = "Food"
         name = "food"
         search = ["name", "description"]
+        search_backend = "fulltext"
         filters = [
             "id",
             "name",
@@ -60,30 +85,14 @@ class FoodEntity(BaseEntity):
             self.scale_id = scale_id
         return True
 
-    def upload_photo(
-        self,
-        storage_service: StorageServiceInterface,
-        file: UploadedFile = None,
-        replace: bool = False,
-    ):
-        now = time()
-        icon_path = (
-            f"photos/meals/{self.id}/{now}_{file.filename}"
-        )
-
-        if replace and self.photo is not None:
-            storage_service.delete(self.photo)
-
-        self.photo = icon_path
-
-        try:
-            storage_service.upload(
-                path=icon_path,
-                content=file.content,
-            )
-        except Exception as e:  # pragma: no cover
-            print(e)
-            raise CannotStorageFileException()
+    def set_photo(self, path: str) -> Optional[str]:
+        """
+        Aponta a foto para o novo caminho e retorna o anterior,
+        que só deve ser removido depois que o novo arquivo subir
+        """
+        previous_photo = self.photo
+        self.photo = path
+        return previous_photo
 
     def to_beautiful_dict(
         self, storage_service: StorageServiceInterface
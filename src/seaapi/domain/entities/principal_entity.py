@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from typing import FrozenSet, Tuple
+from src.seaapi.domain import Role
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Versão compacta do usuário autenticado, com apenas o que as
+    verificações de permissão precisam. É o que fica em request.user
+    e no cache de autenticação.
+    """
+
+    id: int
+    is_active: bool
+    is_super_user: bool
+    groups_ids: Tuple[int, ...]
+    permissions_codes: FrozenSet[str]
+    # Calculada uma vez, já que as dependências de permissão de uma
+    # rota consultam o cargo várias vezes
+    role_priority: int = field(init=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "role_priority",
+            Role.effective_priority(self.groups_ids),
+        )
+
+    @property
+    def is_authenticated(self) -> bool:
+        return True
+
+    def has_role(self, role: Role, exact=False) -> bool:
+        return role.allows(self.role_priority, exact)
+
+    def has_permission(self, permission: str) -> bool:
+        if self.is_super_user:
+            return True
+        return permission in self.permissions_codes
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "is_active": self.is_active,
+            "is_super_user": self.is_super_user,
+            "groups_ids": list(self.groups_ids),
+            "permissions_codes": sorted(
+                self.permissions_codes
+            ),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Principal":
+        return cls(
+            id=data["id"],
+            is_active=data["is_active"],
+            is_super_user=data["is_super_user"],
+            groups_ids=tuple(data["groups_ids"]),
+            permissions_codes=frozenset(
+                data["permissions_codes"]
+            ),
+        )
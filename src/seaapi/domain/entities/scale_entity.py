@@ -17,6 +17,7 @@ class ScaleEntity(BaseEntity):
         display_name = "Scale"
         name = "Scale"
         search = ["name", "serial"]
+        search_backend = "trigram"
         filters = ["id", "name", "serial", "is_attached"]
         composite_field = None
         active_field = None
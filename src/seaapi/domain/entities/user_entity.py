@@ -1,7 +1,14 @@
 from datetime import datetime
 from dataclasses import asdict
 from copy import deepcopy
-from typing import List, Optional, Set, Tuple, Dict
+from typing import (
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Dict,
+)
 from dataclasses import dataclass, field
 from src.seaapi.domain.shared.hash import Hasher
 from src.seaapi.domain.shared.security import create_token
@@ -10,6 +17,7 @@ from src.seaapi.domain.ports.shared.exceptions import (
     UserNotActiveException,
     InvalidCredentialsException,
     SamePasswordBeforeException,
+    PasswordHashingUnavailableException,
 )
 from src.seaapi.domain.entities.group_entity import (
     GroupEntity,
@@ -18,6 +26,9 @@ from src.seaapi.domain.entities.permission_entity import (
     PermissionEntity,
 )
 from src.seaapi.domain.entities.base import BaseEntity
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
 from src.seaapi.domain import Role
 
 
@@ -57,6 +68,7 @@ class UserEntity(BaseEntity):
         display_name = "User"
         name = "user"
         search = ["first_name", "last_name", "email"]
+        search_backend = "trigram"
         filters = [
             "id",
             "first_name",
@@ -90,10 +102,15 @@ class UserEntity(BaseEntity):
 
     @property
     def permissions_codes(self) -> List[str]:
-        permissions_code = []
-        for permission in self.permissions:
-            permissions_code.append(permission.code)
-        return permissions_code
+        return list(self.permissions_codes_set)
+
+    @property
+    def permissions_codes_set(self) -> FrozenSet[str]:
+        return frozenset(
+            permission.code
+            for group in self.groups
+            for permission in group.permissions
+        )
 
     @property
     def groups_ids(self) -> List[int]:
@@ -105,6 +122,16 @@ class UserEntity(BaseEntity):
     def has_role(self, role: Role, exact=False) -> bool:
         return role.check_privileges(self.groups_ids, exact)
 
+    @property
+    def principal(self) -> Principal:
+        return Principal(
+            id=self.id,
+            is_active=self.is_active,
+            is_super_user=self.is_super_user,
+            groups_ids=tuple(self.groups_ids),
+            permissions_codes=self.permissions_codes_set,
+        )
+
     @property
     def city_composed(self) -> Dict:
         if self.cidade is not None:
@@ -113,7 +140,11 @@ class UserEntity(BaseEntity):
     def has_permission(self, permission: str) -> bool:
         if self.is_super_user:
             return True
-        return permission in self.permissions_codes
+        return any(
+            p.code == permission
+            for group in self.groups
+            for p in group.permissions
+        )
 
     def check_password(self, password) -> bool:
         return Hasher.verify_password(
@@ -148,6 +179,15 @@ class UserEntity(BaseEntity):
         if not self.check_password(password):
             raise InvalidCredentialsException()
 
+        if Hasher.needs_update(self.password):
+            # Atualiza hashes de um custo antigo enquanto a senha é
+            # conhecida; se o hashing estiver sobrecarregado, fica
+            # para o próximo login
+            try:
+                self.set_password(password)
+            except PasswordHashingUnavailableException:
+                pass
+
         self.last_login = datetime.now()
         return True
 
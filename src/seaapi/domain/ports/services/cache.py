@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    version: int
+    body: bytes
+    etag: str
+
+
+class VersionedCacheInterface(ABC):
+    """
+    Interface para caches de respostas prontas. Cada escrita nos dados
+    de origem incrementa a versão, e só payloads montados na versão
+    atual são servidos.
+    """
+
+    @abstractmethod
+    def version(self) -> int:
+        """Retorna a versão atual dos dados em cache"""
+
+    @abstractmethod
+    def get(self, version: int) -> Optional[CachedPayload]:
+        """
+        Retorna o payload montado para a versão informada, se ainda
+        estiver válido
+        """
+
+    @abstractmethod
+    def put(
+        self, version: int, body: bytes
+    ) -> CachedPayload:
+        """
+        Guarda o payload montado a partir dos dados lidos na versão
+        informada. Se a versão já tiver mudado, ele nunca será servido.
+        """
+
+    @abstractmethod
+    def invalidate(self):
+        """Incrementa a versão, descartando os payloads anteriores"""
+
+
+class PrincipalCacheInterface(ABC):
+    """
+    Interface para o cache dos usuários autenticados. O carimbo de
+    cada usuário combina uma geração global, incrementada em edições
+    de grupos e permissões, com a versão do próprio usuário.
+    """
+
+    @abstractmethod
+    def version(
+        self, user_id: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Retorna o carimbo atual do usuário, ou None quando não é
+        possível saber se ele mudou
+        """
+
+    @abstractmethod
+    def get(
+        self, user_id: int, version: Tuple[int, int]
+    ) -> Optional[Principal]:
+        """Retorna o usuário guardado com o carimbo informado"""
+
+    @abstractmethod
+    def put(
+        self, version: Tuple[int, int], principal: Principal
+    ):
+        """
+        Guarda o usuário lido no carimbo informado. Se o carimbo já
+        tiver mudado, ele nunca será servido.
+        """
+
+    @abstractmethod
+    def invalidate(self, user_id: int):
+        """Incrementa a versão do usuário"""
+
+    @abstractmethod
+    def invalidate_all(self):
+        """Incrementa a geração, descartando todos os usuários"""
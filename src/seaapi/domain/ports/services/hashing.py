@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+
+class PasswordHasherInterface(ABC):
+    """
+    Interface para o cálculo e a verificação dos hashes de senha.
+    Hashes gerados com um custo diferente do configurado continuam
+    válidos, mas devem ser refeitos quando a senha for conhecida.
+    """
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """Retorna o hash da senha no custo configurado"""
+
+    @abstractmethod
+    def verify(self, password: str, hashed: str) -> bool:
+        """Confere a senha com o hash informado"""
+
+    @abstractmethod
+    def needs_update(self, hashed: str) -> bool:
+        """
+        Indica se o hash foi gerado com um custo ou esquema
+        diferente do configurado
+        """
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """Retorna estatísticas do serviço de hashing"""
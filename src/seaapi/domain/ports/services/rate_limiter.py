@@ -1,10 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 
 class RateLimiterInterface(ABC):
     """Interface para serviços de rate limiting"""
 
+    def get_key(
+        self,
+        identifier: str,
+        endpoint: Optional[str] = None,
+    ) -> str:
+        """
+        Gera a chave única do identificador e endpoint, a mesma usada
+        para guardar o estado do limite
+        """
+        if endpoint:
+            return f"{identifier}:{endpoint}"
+        return identifier
+
     @abstractmethod
     async def is_allowed(
         self,
@@ -42,3 +55,48 @@ class RateLimiterInterface(ABC):
         Returns:
             bool: True se resetado com sucesso
         """
+
+    @abstractmethod
+    async def status(
+        self,
+        identifier: str,
+        limits: Dict[Optional[str], Tuple[int, int]],
+    ) -> Dict[Optional[str], dict]:
+        """
+        Consulta o estado de vários endpoints de uma vez, sem
+        registrar requisições
+
+        Args:
+            identifier: Identificador único
+            limits: Endpoint -> (máximo de requisições, janela)
+
+        Returns:
+            Dict[Optional[str], dict]: informações de cada endpoint, no formato
+            de is_allowed, com `allowed` indicando se a próxima
+            requisição seria permitida
+        """
+
+    @abstractmethod
+    async def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do rate limiter
+
+        Returns:
+            dict: informações do backend e contadores de uso
+        """
+
+    async def peek(
+        self,
+        identifier: str,
+        max_requests: int,
+        window_seconds: int,
+        endpoint: Optional[str] = None,
+    ) -> dict:
+        """
+        Consulta o estado de um endpoint sem registrar a requisição
+        """
+        result = await self.status(
+            identifier,
+            {endpoint: (max_requests, window_seconds)},
+        )
+        return result[endpoint]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO
 
 
 class StorageServiceInterface(ABC):
@@ -8,6 +9,7 @@ class StorageServiceInterface(ABC):
         path: str,
         content: bytes = None,
         temp_file_path: str = None,
+        file: BinaryIO = None,
     ):
         raise NotImplementedError
 
@@ -17,3 +19,23 @@ class StorageServiceInterface(ABC):
 
     def delete(self, path: str):
         raise NotImplementedError
+
+
+class AsyncStorageServiceInterface(ABC):
+    @abstractmethod
+    async def upload(
+        self,
+        path: str,
+        content: bytes = None,
+        file: BinaryIO = None,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(
+        self, path: str, expires: int = None
+    ) -> str:
+        raise NotImplementedError
+
+    async def delete(self, path: str):
+        raise NotImplementedError
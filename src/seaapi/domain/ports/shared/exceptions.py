@@ -387,3 +387,50 @@ class QRCodeGenerationException(CustomException):
             status_code=status_code,
             error_code=error_code,
         )
+
+
+class InvalidCursorException(CustomException):
+    def __init__(
+        self,
+        detail: str = "O cursor de paginação informado é inválido "
+        + "ou não corresponde à ordenação solicitada.",
+        status_code: int = 400,
+        error_code: str = "invalid_cursor",
+    ):
+        super().__init__(
+            detail=detail,
+            status_code=status_code,
+            error_code=error_code,
+        )
+
+
+class PasswordHashingUnavailableException(CustomException):
+    def __init__(
+        self,
+        detail: str = "Muitas autenticações em andamento, "
+        + "tente novamente em instantes.",
+        status_code: int = 503,
+        error_code: str = "password_hashing_unavailable",
+        retry_after: int = 1,
+    ):
+        super().__init__(
+            detail=detail,
+            status_code=status_code,
+            error_code=error_code,
+        )
+        self.retry_after = retry_after
+
+
+class TransactionRolledBackException(CustomException):
+    def __init__(
+        self,
+        detail: str = "A operação foi desfeita por uma falha "
+        + "anterior na mesma transação.",
+        status_code: int = 500,
+        error_code: str = "transaction_rolled_back",
+    ):
+        super().__init__(
+            detail=detail,
+            status_code=status_code,
+            error_code=error_code,
+        )
@@ -1,4 +1,5 @@
 import abc
+from typing import Any, Callable
 
 
 class DefaultUnitOfWorkInterface(abc.ABC):
@@ -14,6 +15,10 @@ class DefaultUnitOfWorkInterface(abc.ABC):
     def _commit(self):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def after_commit(self, callback: Callable[[], Any]):
+        raise NotImplementedError
+
     @abc.abstractmethod
     def rollback(self):
         raise NotImplementedError
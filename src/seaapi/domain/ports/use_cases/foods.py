@@ -14,6 +14,9 @@ from src.seaapi.domain.dtos.mics import (
     PaginationParams,
     PaginationData,
 )
+from src.seaapi.domain.ports.services.cache import (
+    CachedPayload,
+)
 from src.seaapi.domain.dtos.nutrition import (
     NutritionCalculateInputDto,
     NutritionCalculateOutputDto,
@@ -21,10 +24,10 @@ from src.seaapi.domain.dtos.nutrition import (
 
 
 class FoodServiceInterface(abc.ABC):
-    def create(
+    async def create(
         self, food: FoodCreateInputDto
     ) -> SuccessResponse:
-        return self._create(food)
+        return await self._create(food)
 
     def get_all(
         self,
@@ -35,15 +38,18 @@ class FoodServiceInterface(abc.ABC):
     def get_current_menu(self) -> PaginationData:
         return self._get_current_menu()
 
+    def get_current_menu_payload(self) -> CachedPayload:
+        return self._get_current_menu_payload()
+
     def get_food(
         self, id_: int, entity: bool = False
     ) -> Union[FoodEntity, FoodOutputDto]:
         return self._get_food(id_, entity)
 
-    def update_food(
+    async def update_food(
         self, id_: int, food: FoodUpdateInputDto, scheduler
     ) -> SuccessResponse:
-        return self._update_food(id_, food, scheduler)
+        return await self._update_food(id_, food, scheduler)
 
     def delete_food(
         self,
@@ -57,7 +63,7 @@ class FoodServiceInterface(abc.ABC):
         return self._calculate_nutrition(food_data)
 
     @abc.abstractmethod
-    def _create(
+    async def _create(
         self, food: FoodUpdateInputDto
     ) -> SuccessResponse:
         raise NotImplementedError
@@ -69,7 +75,7 @@ class FoodServiceInterface(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def _update_food(
+    async def _update_food(
         self, id_: int, food: FoodUpdateInputDto, scheduler
     ) -> SuccessResponse:
         raise NotImplementedError
@@ -87,6 +93,10 @@ class FoodServiceInterface(abc.ABC):
     ) -> PaginationData:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_current_menu_payload(self) -> CachedPayload:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _delete_food(
         self,
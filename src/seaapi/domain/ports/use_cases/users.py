@@ -3,6 +3,7 @@ from typing import Union
 
 from src.seaapi.domain.entities import (
     UserEntity,
+    Principal,
 )
 from src.seaapi.domain.dtos.users import (
     UserCreateInputDto,
@@ -50,8 +51,11 @@ class UserServiceInterface(abc.ABC):
     ) -> Union[UserEntity, UserOutputDto]:
         return self._get_user(id_, entity)
 
+    def get_principal(self, id_: int) -> Principal:
+        return self._get_principal(id_)
+
     def get_authenticated_user(
-        self, entity: UserEntity
+        self, entity: Principal
     ) -> UserOutputDto:
         return self._get_authenticated_user(entity)
 
@@ -106,6 +110,10 @@ class UserServiceInterface(abc.ABC):
     ) -> Union[UserEntity, UserOutputDto]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _get_principal(self, id_: int) -> Principal:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _update_user(
         self, id_: int, user: UserUpdateInputDto
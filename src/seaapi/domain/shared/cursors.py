@@ -0,0 +1,139 @@
+import json
+import base64
+from uuid import UUID
+from decimal import Decimal
+from datetime import date, datetime, time
+from typing import Any, List, Optional, Tuple
+from src.seaapi.domain.ports.shared.exceptions import (
+    InvalidCursorException,
+)
+
+DEFAULT_ORDER = "id,asc"
+
+
+def resolve_order(order: Optional[str]) -> str:
+    if order is None or order == "":
+        return DEFAULT_ORDER
+    return order
+
+
+# Tipos sem representação em JSON viajam como texto, com uma
+# etiqueta que diz como reconstruí-los
+_TAGGED_TYPES = (
+    ("dt", datetime, datetime.fromisoformat),
+    ("d", date, date.fromisoformat),
+    ("t", time, time.fromisoformat),
+    ("n", Decimal, Decimal),
+    ("u", UUID, UUID),
+)
+_JSON_TYPES = (str, int, float, bool)
+
+
+def _dump_value(value: Any) -> Any:
+    for tag, type_, _ in _TAGGED_TYPES:
+        if isinstance(value, type_):
+            if isinstance(value, (date, time)):
+                return {tag: value.isoformat()}
+            return {tag: str(value)}
+    if isinstance(value, _JSON_TYPES):
+        return value
+    raise InvalidCursorException(
+        detail="O campo de ordenação não suporta "
+        + "paginação por cursor."
+    )
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        for tag, _, parse in _TAGGED_TYPES:
+            if tag in value:
+                return parse(value[tag])
+        raise InvalidCursorException()
+    return value
+
+
+def supports_cursor(value: Any) -> bool:
+    return isinstance(
+        value,
+        _JSON_TYPES
+        + tuple(type_ for _, type_, _ in _TAGGED_TYPES),
+    )
+
+
+def encode_cursor(entity: Any, order: Optional[str]) -> str:
+    """
+    Gera um cursor opaco a partir do campo de ordenação
+    ativo e do id da última linha retornada
+    """
+    order = resolve_order(order)
+    field, _ = order.split(",")
+    payload = {
+        "o": order,
+        "v": _dump_value(getattr(entity, field)),
+        "id": entity.id,
+    }
+    raw = json.dumps(payload, separators=(",", ":"))
+    return (
+        base64.urlsafe_b64encode(raw.encode())
+        .decode()
+        .rstrip("=")
+    )
+
+
+def decode_cursor(
+    cursor: str, order: Optional[str]
+) -> Tuple[str, str, Any, int]:
+    """
+    Decodifica o cursor e valida se ele foi gerado para a
+    mesma ordenação da requisição atual
+    """
+    order = resolve_order(order)
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        payload = json.loads(
+            base64.urlsafe_b64decode(cursor + padding)
+        )
+        cursor_order = payload["o"]
+        value = _load_value(payload["v"])
+        id_ = payload["id"]
+    except InvalidCursorException:
+        raise
+    except Exception:
+        raise InvalidCursorException()
+
+    if cursor_order != order or id_ is None:
+        raise InvalidCursorException()
+
+    field, direction = order.split(",")
+    return field, direction.lower(), value, id_
+
+
+def next_cursor(
+    items: List[Any], params: Any
+) -> Optional[str]:
+    """
+    Retorna o cursor da próxima página quando a página atual
+    veio completa e, nas páginas por cursor, há linhas depois
+    dela. Campos de ordenação nulos ou de tipos que o cursor não
+    representa não geram cursor, nem buscas sem ordenação
+    explícita, que podem vir por relevância.
+    """
+    page_size = getattr(params, "page_size", None)
+    if getattr(items, "has_next", None) is False:
+        return None
+    if (
+        not items
+        or page_size is None
+        or len(items) < page_size
+    ):
+        return None
+    if getattr(params, "search", None) and not getattr(
+        params, "order", None
+    ):
+        return None
+
+    order = resolve_order(getattr(params, "order", None))
+    field, _ = order.split(",")
+    if not supports_cursor(getattr(items[-1], field, None)):
+        return None
+    return encode_cursor(items[-1], order)
@@ -0,0 +1,31 @@
+import hashlib
+from typing import Optional
+
+
+def compute_etag(body: bytes) -> str:
+    """Gera um ETag forte a partir do conteúdo serializado"""
+    return (
+        '"%s"'
+        % hashlib.blake2b(body, digest_size=16).hexdigest()
+    )
+
+
+def etag_matches(
+    if_none_match: Optional[str], etag: str
+) -> bool:
+    """
+    Compara o cabeçalho If-None-Match com o ETag atual usando a
+    comparação fraca, como pede a RFC 7232 para requisições GET
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
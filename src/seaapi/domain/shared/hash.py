@@ -1,17 +1,70 @@
+from functools import lru_cache
+from typing import Optional
 from passlib.context import CryptContext
-
-pwd_context = CryptContext(
-    schemes=["bcrypt"], deprecated="auto"
+from src.seaapi.config.settings import settings
+from src.seaapi.domain.ports.services.hashing import (
+    PasswordHasherInterface,
 )
 
 
+@lru_cache(maxsize=None)
+def get_context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+    )
+
+
+pwd_context = get_context(settings.PASSWORD_HASH_ROUNDS)
+
+
+# Funções de módulo para que possam rodar em outros processos
+def hash_password(password: str, rounds: int) -> str:
+    return get_context(rounds).hash(password)
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    return pwd_context.verify(password, hashed)
+
+
 class Hasher:
-    @staticmethod
-    def verify_password(plain_password, hashed_password):
-        return pwd_context.verify(
+    """
+    Ponto de acesso das entidades ao hashing de senhas. Sem um
+    serviço configurado, o hash é calculado na própria thread, como
+    nos scripts e testes.
+    """
+
+    backend: Optional[PasswordHasherInterface] = None
+
+    @classmethod
+    def use(
+        cls, backend: Optional[PasswordHasherInterface]
+    ):
+        cls.backend = backend
+
+    @classmethod
+    def verify_password(
+        cls, plain_password, hashed_password
+    ):
+        if cls.backend is None:
+            return verify_password(
+                plain_password, hashed_password
+            )
+        return cls.backend.verify(
             plain_password, hashed_password
         )
 
-    @staticmethod
-    def get_password_hash(password):
-        return pwd_context.hash(password)
+    @classmethod
+    def get_password_hash(cls, password):
+        if cls.backend is None:
+            return hash_password(
+                password, settings.PASSWORD_HASH_ROUNDS
+            )
+        return cls.backend.hash(password)
+
+    @classmethod
+    def needs_update(cls, hashed_password) -> bool:
+        if cls.backend is None:
+            return pwd_context.needs_update(hashed_password)
+        return cls.backend.needs_update(hashed_password)
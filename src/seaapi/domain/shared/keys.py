@@ -0,0 +1,314 @@
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import (
+    hashes,
+    serialization,
+)
+from cryptography.hazmat.primitives.asymmetric import (
+    ec,
+    ed25519,
+)
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
+
+logger = logging.getLogger(__name__)
+
+ASYMMETRIC_ALGORITHMS = ("ES256", "EdDSA")
+
+# Membros obrigatórios de cada tipo de chave, usados no thumbprint
+# (RFC 7638) que vira o kid
+_THUMBPRINT_MEMBERS = {
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+
+def b64encode(data: bytes) -> str:
+    return (
+        base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+    )
+
+
+def b64decode(data) -> bytes:
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    return base64.urlsafe_b64decode(
+        data + b"=" * (-len(data) % 4)
+    )
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """
+    Chave de assinatura dos tokens. Sem a chave privada, serve apenas
+    para verificar e ser publicada no JWKS.
+    """
+
+    algorithm: str
+    public_key: Any
+    private_key: Any = None
+    kid: str = field(default="")
+
+    def __post_init__(self):
+        if self.algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported key algorithm: {self.algorithm}"
+            )
+        if not self.kid:
+            object.__setattr__(
+                self, "kid", self.thumbprint()
+            )
+
+    def sign(self, data: bytes) -> bytes:
+        if self.algorithm == "EdDSA":
+            return self.private_key.sign(data)
+        r, s = decode_dss_signature(
+            self.private_key.sign(
+                data, ec.ECDSA(hashes.SHA256())
+            )
+        )
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        try:
+            if self.algorithm == "EdDSA":
+                self.public_key.verify(signature, data)
+            else:
+                if len(signature) != 64:
+                    return False
+                self.public_key.verify(
+                    encode_dss_signature(
+                        int.from_bytes(
+                            signature[:32], "big"
+                        ),
+                        int.from_bytes(
+                            signature[32:], "big"
+                        ),
+                    ),
+                    data,
+                    ec.ECDSA(hashes.SHA256()),
+                )
+        except InvalidSignature:
+            return False
+        return True
+
+    def _public_members(self) -> Dict[str, str]:
+        if self.algorithm == "EdDSA":
+            return {
+                "kty": "OKP",
+                "crv": "Ed25519",
+                "x": b64encode(
+                    self.public_key.public_bytes(
+                        serialization.Encoding.Raw,
+                        serialization.PublicFormat.Raw,
+                    )
+                ),
+            }
+        numbers = self.public_key.public_numbers()
+        return {
+            "kty": "EC",
+            "crv": "P-256",
+            "x": b64encode(numbers.x.to_bytes(32, "big")),
+            "y": b64encode(numbers.y.to_bytes(32, "big")),
+        }
+
+    def thumbprint(self) -> str:
+        members = self._public_members()
+        canonical = json.dumps(
+            {
+                name: members[name]
+                for name in _THUMBPRINT_MEMBERS[
+                    members["kty"]
+                ]
+            },
+            separators=(",", ":"),
+        )
+        return b64encode(
+            hashlib.sha256(canonical.encode()).digest()
+        )
+
+    def to_jwk(self) -> dict:
+        return {
+            **self._public_members(),
+            "kid": self.kid,
+            "alg": self.algorithm,
+            "use": "sig",
+        }
+
+    @classmethod
+    def from_pem(cls, pem: bytes) -> "SigningKey":
+        """Aceita chaves privadas ou públicas P-256 e Ed25519"""
+        if b"PRIVATE KEY" in pem:
+            private_key = (
+                serialization.load_pem_private_key(
+                    pem, password=None
+                )
+            )
+            public_key = private_key.public_key()
+        else:
+            private_key = None
+            public_key = serialization.load_pem_public_key(
+                pem
+            )
+        if isinstance(public_key, ed25519.Ed25519PublicKey):
+            algorithm = "EdDSA"
+        elif isinstance(
+            public_key, ec.EllipticCurvePublicKey
+        ) and isinstance(public_key.curve, ec.SECP256R1):
+            algorithm = "ES256"
+        else:
+            raise ValueError(
+                "Only P-256 and Ed25519 keys are supported"
+            )
+        return cls(
+            algorithm=algorithm,
+            public_key=public_key,
+            private_key=private_key,
+        )
+
+    @classmethod
+    def from_jwk(cls, jwk: dict) -> "SigningKey":
+        if (
+            jwk.get("kty") == "OKP"
+            and jwk.get("crv") == "Ed25519"
+        ):
+            public_key = (
+                ed25519.Ed25519PublicKey.from_public_bytes(
+                    b64decode(jwk["x"])
+                )
+            )
+            algorithm = "EdDSA"
+        elif (
+            jwk.get("kty") == "EC"
+            and jwk.get("crv") == "P-256"
+        ):
+            public_key = ec.EllipticCurvePublicNumbers(
+                int.from_bytes(b64decode(jwk["x"]), "big"),
+                int.from_bytes(b64decode(jwk["y"]), "big"),
+                ec.SECP256R1(),
+            ).public_key()
+            algorithm = "ES256"
+        else:
+            raise ValueError("Unsupported JWK")
+        return cls(
+            algorithm=algorithm,
+            public_key=public_key,
+            kid=jwk.get("kid", ""),
+        )
+
+
+class KeySet:
+    """
+    Conjunto de chaves indexado por kid. A primeira chave com parte
+    privada assina os tokens; as demais continuam aceitas e publicadas
+    até os tokens assinados com elas expirarem, o que permite a
+    rotação sem derrubar as sessões abertas.
+    """
+
+    def __init__(self, keys: List[SigningKey]):
+        self._set_keys(keys)
+
+    def _set_keys(self, keys: List[SigningKey]):
+        self.keys = {key.kid: key for key in keys}
+        self.signing_key = next(
+            (
+                key
+                for key in keys
+                if key.private_key is not None
+            ),
+            None,
+        )
+        # O documento é montado uma vez e servido como está
+        self.jwks = json.dumps(
+            {"keys": [key.to_jwk() for key in keys]},
+            separators=(",", ":"),
+        ).encode()
+
+    def get(self, kid: str) -> Optional[SigningKey]:
+        return self.keys.get(kid)
+
+    @classmethod
+    def from_files(cls, paths: List[str]) -> "KeySet":
+        keys = []
+        for path in paths:
+            with open(path, "rb") as file:
+                keys.append(
+                    SigningKey.from_pem(file.read())
+                )
+        return cls(keys)
+
+    @classmethod
+    def from_jwks(cls, document: dict) -> "KeySet":
+        return cls(
+            [
+                SigningKey.from_jwk(jwk)
+                for jwk in document.get("keys", [])
+            ]
+        )
+
+
+class RemoteKeySet(KeySet):
+    """
+    Chaves públicas lidas do endpoint JWKS da API, para serviços que
+    só verificam tokens. O documento fica em cache por `ttl_seconds`;
+    um kid desconhecido força uma nova leitura, no máximo uma vez a
+    cada `min_refresh_seconds`.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: int = 300,
+        min_refresh_seconds: int = 30,
+        timeout_seconds: float = 2.0,
+    ):
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_seconds = min_refresh_seconds
+        self.timeout_seconds = timeout_seconds
+        self._fetched_at = float("-inf")
+        self._lock = threading.Lock()
+        super().__init__([])
+
+    def _refresh(self, min_age: float):
+        with self._lock:
+            if (
+                time.monotonic() - self._fetched_at
+                < min_age
+            ):
+                return
+            try:
+                with urllib.request.urlopen(
+                    self.url, timeout=self.timeout_seconds
+                ) as response:  # nosec B310
+                    keys = KeySet.from_jwks(
+                        json.loads(response.read())
+                    )
+            except Exception as e:
+                logger.warning(f"JWKS fetch error: {e}")
+                return
+            finally:
+                self._fetched_at = time.monotonic()
+            self._set_keys(list(keys.keys.values()))
+
+    def get(self, kid: str) -> Optional[SigningKey]:
+        if (
+            time.monotonic() - self._fetched_at
+            >= self.ttl_seconds
+        ):
+            self._refresh(self.ttl_seconds)
+        key = self.keys.get(kid)
+        if key is None:
+            self._refresh(self.min_refresh_seconds)
+            key = self.keys.get(kid)
+        return key
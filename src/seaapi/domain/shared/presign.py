@@ -0,0 +1,69 @@
+import time
+from typing import BinaryIO, Dict, Optional, Tuple
+from src.seaapi.domain.ports.services.storage import (
+    StorageServiceInterface,
+)
+
+# Margem máxima antes do vencimento da assinatura em que a URL
+# deixa de ser reaproveitada
+EXPIRY_MARGIN_SECONDS = 60
+
+
+class PresignedUrlBatch(StorageServiceInterface):
+    """
+    Envolve um serviço de storage durante a montagem de uma resposta
+    para que cada chave seja assinada uma única vez, mesmo quando a
+    mesma foto aparece em várias pesagens e refeições
+    """
+
+    def __init__(
+        self, storage_service: StorageServiceInterface
+    ):
+        self.storage_service = storage_service
+        self._urls: Dict[
+            Tuple[str, Optional[int]], Tuple[str, float]
+        ] = {}
+
+    def _valid_until(self, expires: Optional[int]) -> float:
+        if expires is None:
+            return float("inf")
+        margin = min(EXPIRY_MARGIN_SECONDS, expires // 10)
+        return time.monotonic() + expires - margin
+
+    def get(self, path: str, expires: int = None) -> str:
+        key = (path, expires)
+        cached = self._urls.get(key)
+        if (
+            cached is not None
+            and cached[1] > time.monotonic()
+        ):
+            return cached[0]
+
+        url = self.storage_service.get(
+            path, expires=expires
+        )
+        self._urls[key] = (url, self._valid_until(expires))
+        return url
+
+    def upload(
+        self,
+        path: str,
+        content: bytes = None,
+        temp_file_path: str = None,
+        file: BinaryIO = None,
+    ):
+        self._forget(path)
+        return self.storage_service.upload(
+            path,
+            content=content,
+            temp_file_path=temp_file_path,
+            file=file,
+        )
+
+    def delete(self, path: str):
+        self._forget(path)
+        return self.storage_service.delete(path)
+
+    def _forget(self, path: str):
+        for key in [k for k in self._urls if k[0] == path]:
+            del self._urls[key]
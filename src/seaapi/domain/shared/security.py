@@ -1,12 +1,31 @@
 from abc import abstractmethod
+import hmac
+import json
 import hashlib
+import calendar
+import threading
 import six
 import secrets
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 from time import time
-from jose import jwt
+from jose import jwt, JWTError
+from jose.exceptions import (
+    ExpiredSignatureError,
+    JWTClaimsError,
+)
 from src.seaapi.config import settings
+from src.seaapi.domain.shared.keys import (
+    ASYMMETRIC_ALGORITHMS,
+    KeySet,
+    RemoteKeySet,
+    SigningKey,
+    b64decode,
+    b64encode,
+)
 
 
 class TokenGenerator:
@@ -103,7 +122,37 @@ def create_token(
     return encode_jwt(to_encode), expire
 
 
+@lru_cache(maxsize=None)
+def get_key_set() -> KeySet:
+    """
+    Chaves dos modos ES256/EdDSA, lidas uma única vez por processo:
+    arquivos PEM quando o processo assina tokens, ou o JWKS da API
+    quando só precisa verificá-los
+    """
+    if settings.JWT_KEY_PATHS:
+        return KeySet.from_files(settings.JWT_KEY_PATHS)
+    if settings.JWT_JWKS_URL:
+        return RemoteKeySet(
+            settings.JWT_JWKS_URL,
+            ttl_seconds=settings.JWT_JWKS_CACHE_SECONDS,
+        )
+    raise ValueError(
+        f"JWT_KEY_PATHS or JWT_JWKS_URL is required for {settings.ALGORITHM}"
+    )
+
+
+def get_jwks() -> bytes:
+    """Documento JWKS com as chaves públicas; vazio no modo HS*"""
+    if settings.ALGORITHM in ASYMMETRIC_ALGORITHMS:
+        return get_key_set().jwks
+    return b'{"keys":[]}'
+
+
 def encode_jwt(data: dict):
+    if settings.ALGORITHM in ASYMMETRIC_ALGORITHMS:
+        return encode_signed_jwt(
+            data, get_key_set().signing_key
+        )
     return jwt.encode(
         data,
         settings.SECRET_KEY,
@@ -112,6 +161,8 @@ def encode_jwt(data: dict):
 
 
 def decode_jwt(token: str):
+    if settings.ALGORITHM in ASYMMETRIC_ALGORITHMS:
+        return decode_signed_jwt(token, get_key_set())
     decoded_token = jwt.decode(
         token,
         settings.SECRET_KEY,
@@ -124,6 +175,257 @@ def decode_jwt(token: str):
     )
 
 
+def _json_segment(data: dict) -> str:
+    return b64encode(
+        json.dumps(data, separators=(",", ":")).encode()
+    )
+
+
+def encode_signed_jwt(data: dict, key: SigningKey) -> str:
+    """Assina um token ES256/EdDSA com o kid da chave no header"""
+    if key is None or key.private_key is None:
+        raise ValueError(
+            "No private key available to sign tokens"
+        )
+    claims = {
+        name: calendar.timegm(value.utctimetuple())
+        if isinstance(value, datetime)
+        else value
+        for name, value in data.items()
+    }
+    signing_input = (
+        _json_segment(
+            {
+                "alg": key.algorithm,
+                "typ": "JWT",
+                "kid": key.kid,
+            }
+        )
+        + "."
+        + _json_segment(claims)
+    )
+    return (
+        signing_input
+        + "."
+        + b64encode(key.sign(signing_input.encode()))
+    )
+
+
+def decode_signed_jwt(token: str, key_set: KeySet) -> dict:
+    """
+    Verifica um token ES256/EdDSA com a chave indicada pelo kid e
+    valida exp e nbf. Levanta as mesmas exceções do python-jose.
+    """
+    try:
+        (
+            header_segment,
+            payload_segment,
+            signature,
+        ) = token.encode("ascii").split(b".")
+        header = json.loads(b64decode(header_segment))
+        claims = json.loads(b64decode(payload_segment))
+        signature = b64decode(signature)
+    except (ValueError, TypeError):
+        raise JWTError("Invalid token")
+    if not isinstance(header, dict) or not isinstance(
+        claims, dict
+    ):
+        raise JWTError("Invalid token")
+
+    kid = header.get("kid")
+    key = key_set.get(kid) if isinstance(kid, str) else None
+    if (
+        key is None
+        or header.get("alg") != key.algorithm
+        or not key.verify(
+            signature,
+            header_segment + b"." + payload_segment,
+        )
+    ):
+        raise JWTError("Signature verification failed")
+
+    now = time()
+    for claim in ("exp", "nbf"):
+        value = claims.get(claim)
+        if value is None and claim == "nbf":
+            continue
+        if not isinstance(
+            value, (int, float)
+        ) or isinstance(value, bool):
+            raise JWTClaimsError(f"Invalid {claim} claim")
+    if claims["exp"] < now:
+        raise ExpiredSignatureError("Signature has expired")
+    if claims.get("nbf", now) > now:
+        raise JWTClaimsError("The token is not yet valid")
+    return claims
+
+
+HMAC_ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+class _UseFullDecode(Exception):
+    pass
+
+
+class TokenVerifier:
+    """
+    Verifica os tokens de acesso e guarda as claims já verificadas,
+    indexadas pelo digest do token, até o `exp`. Tokens inválidos não
+    entram no cache. Cada chamada devolve suas próprias claims, sem
+    estado compartilhado entre requisições.
+
+    Com `native`, tokens HS* no formato emitido pela API são conferidos
+    direto com hmac; os demais passam pelo python-jose. Com `key_set`,
+    os tokens são ES256/EdDSA e a chave é escolhida pelo kid.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        max_entries: int = 10000,
+        native: bool = True,
+        key_set: Optional[KeySet] = None,
+    ):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self.key_set = key_set
+        # Sem chave o HMAC aceitaria tokens assinados com chave vazia
+        self.native = (
+            native
+            and bool(secret_key)
+            and algorithm in HMAC_ALGORITHMS
+        )
+        self._key = (secret_key or "").encode()
+        self._entries: "OrderedDict[bytes, Tuple[Mapping, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def verify(
+        self, token: str, token_type: str = "access"
+    ) -> Optional[Mapping]:
+        """
+        Retorna as claims (somente leitura) se o token for válido, não
+        tiver expirado e for do tipo informado
+        """
+        digest = hashlib.blake2b(
+            token.encode(), digest_size=16
+        ).digest()
+        now = time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                if entry[1] >= now:
+                    self._entries.move_to_end(digest)
+                else:
+                    del self._entries[digest]
+                    entry = None
+
+        if entry is None:
+            claims = self._decode(token, now)
+            if claims is None:
+                return None
+            entry = (
+                MappingProxyType(claims),
+                claims["exp"],
+            )
+            with self._lock:
+                self._entries[digest] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        claims = entry[0]
+        if claims.get("type", "") != token_type:
+            return None
+        return claims
+
+    def _decode(
+        self, token: str, now: float
+    ) -> Optional[dict]:
+        if self.key_set is not None:
+            try:
+                return decode_signed_jwt(
+                    token, self.key_set
+                )
+            except (JWTError, KeyError, TypeError):
+                return None
+        if self.native:
+            try:
+                return self._decode_native(token, now)
+            except _UseFullDecode:
+                pass
+        try:
+            claims = jwt.decode(
+                token,
+                self.secret_key,
+                algorithms=[self.algorithm],
+            )
+            return claims if claims["exp"] >= now else None
+        except (JWTError, KeyError, TypeError):
+            return None
+
+    def _decode_native(
+        self, token: str, now: float
+    ) -> Optional[dict]:
+        try:
+            (
+                header_segment,
+                payload_segment,
+                signature,
+            ) = token.encode("ascii").split(b".")
+            header = json.loads(b64decode(header_segment))
+            if header.get("alg") != self.algorithm:
+                raise _UseFullDecode()
+            expected = hmac.new(
+                self._key,
+                header_segment + b"." + payload_segment,
+                HMAC_ALGORITHMS[self.algorithm],
+            ).digest()
+            if not hmac.compare_digest(
+                expected, b64decode(signature)
+            ):
+                return None
+            claims = json.loads(b64decode(payload_segment))
+        except (ValueError, TypeError, AttributeError):
+            # Token malformado; o python-jose também recusaria
+            return None
+
+        if not isinstance(claims, dict):
+            return None
+        # Claims que os tokens da API não usam ficam com as
+        # validações completas do python-jose
+        if (
+            "nbf" in claims
+            or "iat" in claims
+            or "aud" in claims
+        ):
+            raise _UseFullDecode()
+        exp = claims.get("exp")
+        if (
+            not isinstance(exp, (int, float))
+            or isinstance(exp, bool)
+            or exp < now
+        ):
+            return None
+        return claims
+
+
+token_verifier = TokenVerifier(
+    secret_key=settings.SECRET_KEY,
+    algorithm=settings.ALGORITHM,
+    max_entries=settings.JWT_VERIFY_CACHE_MAX_ENTRIES,
+    native=settings.JWT_VERIFY_BACKEND == "native",
+    key_set=get_key_set()
+    if settings.ALGORITHM in ASYMMETRIC_ALGORITHMS
+    else None,
+)
+
 password_reset_token_generator = (
     PasswordResetTokenGenerator(
         secret_key=settings.SECRET_KEY
@@ -0,0 +1,124 @@
+import os
+import sys
+import subprocess
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import create_engine, exc, text
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.db import engine as engine_module
+from src.seaapi.adapters.db.engine import (
+    InstrumentedQueuePool,
+    get_engine,
+    get_pool_stats,
+)
+
+
+def make_engine(path, **kwargs):
+    return create_engine(
+        f"sqlite:///{path}",
+        poolclass=InstrumentedQueuePool,
+        **{
+            "pool_size": 1,
+            "max_overflow": 0,
+            "pool_timeout": 0.05,
+            **kwargs,
+        },
+    )
+
+
+@pytest.fixture
+def process(monkeypatch, tmp_path):
+    """Engine do módulo zerado e um PID controlado pelo teste"""
+    state = SimpleNamespace(pid=os.getpid(), builds=0)
+
+    def build_engine(uri):
+        state.builds += 1
+        return make_engine(tmp_path / "db.sqlite")
+
+    monkeypatch.setattr(engine_module, "_engine", None)
+    monkeypatch.setattr(engine_module, "_engine_pid", None)
+    monkeypatch.setattr(
+        engine_module, "build_engine", build_engine
+    )
+    monkeypatch.setattr(
+        engine_module,
+        "os",
+        SimpleNamespace(getpid=lambda: state.pid),
+    )
+    return state
+
+
+def test_importing_containers_does_not_build_engine():
+    code = (
+        "import src.seaapi.config.containers\n"
+        "from src.seaapi.adapters.db import engine\n"
+        "assert engine._engine is None\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_engine_is_built_once_per_process(process):
+    assert get_pool_stats() == {
+        "message": "Engine ainda não foi criado"
+    }
+
+    assert get_engine() is get_engine()
+    assert process.builds == 1
+
+
+def test_new_pid_gets_new_pool(process):
+    engine = get_engine()
+    parent_connection = engine.connect()
+    parent_pool = engine.pool
+
+    process.pid += 1
+    assert get_pool_stats() == {
+        "message": "Engine ainda não foi criado"
+    }
+    assert get_engine() is engine
+    assert engine.pool is not parent_pool
+    assert process.builds == 1
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert get_pool_stats()["checked_out"] == 1
+    # A conexão do processo pai não foi fechada
+    assert (
+        parent_connection.execute(text("SELECT 1")).scalar()
+        == 1
+    )
+    assert parent_pool.connects == 1
+    assert get_pool_stats()["connects"] == 1
+    parent_connection.close()
+
+
+def test_pool_stats_report_saturation_and_timeouts(
+    tmp_path,
+):
+    engine = make_engine(tmp_path / "db.sqlite")
+    pool = engine.pool
+
+    with engine.connect():
+        stats = pool.get_stats()
+        assert stats["checked_out"] == 1
+        assert stats["saturation"] == 1.0
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = pool.get_stats()
+    assert stats["checked_out"] == 0
+    assert stats["checked_in"] == 1
+    assert stats["saturation"] == 0.0
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["slow_checkouts"] >= 1
+    assert stats["connects"] == 1
+    assert stats["max_wait_ms"] >= 50
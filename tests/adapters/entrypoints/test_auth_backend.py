@@ -0,0 +1,79 @@
+import time
+import threading
+from types import SimpleNamespace
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from jose import jwt
+from starlette.middleware.authentication import (
+    AuthenticationMiddleware,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.entrypoints.api.shared.middlewares import (
+    BearerTokenAuthBackend,
+)
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
+from src.seaapi.domain.shared.security import TokenVerifier
+
+SECRET_KEY = "segredo"
+
+
+class UserServiceStub:
+    def __init__(self):
+        self.threads = []
+
+    def get_principal(self, id_):
+        self.threads.append(threading.get_ident())
+        return Principal(
+            id=id_,
+            is_active=True,
+            is_super_user=False,
+            groups_ids=(),
+            permissions_codes=frozenset(),
+        )
+
+
+def make_app(user_service):
+    app = FastAPI()
+    app.container = SimpleNamespace(
+        user_service=lambda: user_service
+    )
+    app.add_middleware(
+        AuthenticationMiddleware,
+        backend=BearerTokenAuthBackend(
+            TokenVerifier(SECRET_KEY)
+        ),
+    )
+
+    @app.get("/me")
+    async def me(request: Request):
+        return {
+            "id": request.user.id,
+            "loop_thread": threading.get_ident(),
+        }
+
+    return app
+
+
+def test_principal_lookup_runs_off_the_event_loop():
+    user_service = UserServiceStub()
+    token = jwt.encode(
+        {
+            "user_id": 7,
+            "type": "access",
+            "exp": int(time.time()) + 60,
+        },
+        SECRET_KEY,
+    )
+
+    with TestClient(make_app(user_service)) as client:
+        response = client.get(
+            "/me",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.json()["id"] == 7
+    assert user_service.threads != [
+        response.json()["loop_thread"]
+    ]
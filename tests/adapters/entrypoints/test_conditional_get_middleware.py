@@ -0,0 +1,133 @@
+from fastapi import FastAPI, Response
+from fastapi.responses import (
+    PlainTextResponse,
+    StreamingResponse,
+)
+from fastapi.testclient import TestClient
+import pytest
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.entrypoints.api.shared.conditional_get_middleware import (
+    ConditionalGetMiddleware,
+)
+from src.seaapi.domain.shared.etags import compute_etag
+
+BODY = b'{"id":1,"name":"Arroz"}'
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(ConditionalGetMiddleware)
+
+    @app.get("/foods")
+    def get_foods():
+        return {"id": 1, "name": "Arroz"}
+
+    @app.post("/foods")
+    def create_food():
+        return {"id": 1, "name": "Arroz"}
+
+    @app.get("/missing", status_code=404)
+    def get_missing():
+        return {"detail": "Não encontrado"}
+
+    @app.get("/text")
+    def get_text():
+        return PlainTextResponse("Arroz")
+
+    @app.get("/stream")
+    def get_stream():
+        return StreamingResponse(
+            iter([b'{"id":', b"1}"]),
+            media_type="application/json",
+        )
+
+    @app.get("/menu")
+    def get_menu():
+        return Response(
+            BODY,
+            media_type="application/json",
+            headers={"ETag": '"cardapio"'},
+        )
+
+    return TestClient(app)
+
+
+def test_get_json_gets_etag(client):
+    response = client.get("/foods")
+
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["etag"] == compute_etag(BODY)
+
+
+def test_matching_if_none_match_returns_304(client):
+    etag = client.get("/foods").headers["etag"]
+
+    response = client.get(
+        "/foods", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "content-type" not in response.headers
+    assert "content-length" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        "*",
+        f"W/{compute_etag(BODY)}",
+        f'"outro", {compute_etag(BODY)}',
+    ],
+)
+def test_weak_and_wildcard_match_return_304(
+    client, if_none_match
+):
+    response = client.get(
+        "/foods", headers={"If-None-Match": if_none_match}
+    )
+
+    assert response.status_code == 304
+
+
+def test_stale_if_none_match_returns_body(client):
+    response = client.get(
+        "/foods", headers={"If-None-Match": '"antigo"'}
+    )
+
+    assert response.status_code == 200
+    assert response.content == BODY
+
+
+@pytest.mark.parametrize(
+    "method, path, status_code",
+    [
+        ("post", "/foods", 200),
+        ("get", "/missing", 404),
+        ("get", "/text", 200),
+        ("get", "/stream", 200),
+    ],
+)
+def test_other_responses_pass_through(
+    client, method, path, status_code
+):
+    response = getattr(client, method)(
+        path, headers={"If-None-Match": "*"}
+    )
+
+    assert response.status_code == status_code
+    assert "etag" not in response.headers
+    assert response.content
+
+
+def test_route_etag_is_kept(client):
+    response = client.get(
+        "/menu", headers={"If-None-Match": "*"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"cardapio"'
+    assert response.content == BODY
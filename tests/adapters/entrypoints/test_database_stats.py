@@ -0,0 +1,57 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from starlette.middleware.authentication import (
+    AuthenticationMiddleware,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.entrypoints.api.handlers import (
+    register_handlers,
+)
+from src.seaapi.adapters.entrypoints.api.v1 import database
+from tests.utils.principals import TokenAsPrincipalBackend
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(
+        database,
+        "get_pool_stats",
+        lambda: {"checked_out": 0},
+    )
+    app = FastAPI()
+    register_handlers(app)
+    app.add_middleware(
+        AuthenticationMiddleware,
+        backend=TokenAsPrincipalBackend(),
+    )
+    app.include_router(
+        database.router, prefix="/v1/database"
+    )
+    return TestClient(app)
+
+
+def test_admin_reads_pool_stats(client):
+    response = client.get(
+        "/v1/database/stats",
+        headers={"Authorization": "Bearer admin"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"stats": {"checked_out": 0}}
+
+
+@pytest.mark.parametrize("token", ["customer", None])
+def test_non_admins_are_refused(client, token):
+    headers = (
+        {"Authorization": f"Bearer {token}"}
+        if token
+        else {}
+    )
+
+    response = client.get(
+        "/v1/database/stats", headers=headers
+    )
+
+    assert response.status_code == 403
+    assert "stats" not in response.json()
@@ -0,0 +1,113 @@
+import time
+from types import SimpleNamespace
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+from starlette.middleware.authentication import (
+    AuthenticationMiddleware,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.entrypoints.api.shared.middlewares import (
+    BearerTokenAuthBackend,
+)
+from src.seaapi.adapters.entrypoints.api.shared.session_middleware import (
+    SessionScopeMiddleware,
+)
+from src.seaapi.adapters.services.caching import (
+    MemoryPrincipalCache,
+)
+from src.seaapi.adapters.unit_of_works import (
+    GroupSqlAlchemyUnitOfWork,
+    ScaleSqlAlchemyUnitOfWork,
+    UserSqlAlchemyUnitOfWork,
+)
+from src.seaapi.adapters.use_cases import UserService
+from src.seaapi.domain.entities.user_entity import (
+    user_model_factory,
+)
+from src.seaapi.domain.shared.security import TokenVerifier
+from tests.utils.database import memory_session_factory
+
+SECRET_KEY = "segredo"
+
+
+class TrackingSessionFactory:
+    """Sessionmaker que guarda as sessões abertas"""
+
+    def __init__(self):
+        self.factory = memory_session_factory()
+        self.sessions = []
+
+    def __call__(self):
+        session = self.factory()
+        self.sessions.append(session)
+        return session
+
+
+def make_app(sessions):
+    def factory():
+        return sessions
+
+    user_service = UserService(
+        uow=UserSqlAlchemyUnitOfWork(factory),
+        group_uow=GroupSqlAlchemyUnitOfWork(factory),
+        token_service=None,
+        notification_service=None,
+        principal_cache=MemoryPrincipalCache(),
+    )
+    scale_uow = ScaleSqlAlchemyUnitOfWork(factory)
+
+    app = FastAPI()
+    app.container = SimpleNamespace(
+        user_service=lambda: user_service
+    )
+    app.add_middleware(
+        AuthenticationMiddleware,
+        backend=BearerTokenAuthBackend(
+            TokenVerifier(SECRET_KEY)
+        ),
+    )
+    app.add_middleware(SessionScopeMiddleware)
+
+    @app.get("/scales")
+    def list_scales():
+        with scale_uow:
+            return {"count": scale_uow.scales.count_all()}
+
+    return app
+
+
+def test_auth_and_endpoint_share_one_session():
+    sessions = TrackingSessionFactory()
+    session = sessions.factory()
+    session.add(
+        user_model_factory(
+            first_name="Teste",
+            last_name="Usuário",
+            email="teste@sea.api",
+            password="x",
+            is_active=True,
+            is_super_user=False,
+            id=7,
+        )
+    )
+    session.commit()
+    session.close()
+    token = jwt.encode(
+        {
+            "user_id": 7,
+            "type": "access",
+            "exp": int(time.time()) + 60,
+        },
+        SECRET_KEY,
+    )
+
+    with TestClient(make_app(sessions)) as client:
+        response = client.get(
+            "/scales",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.json() == {"count": 0}
+    # A busca do principal e o endpoint usam a mesma sessão
+    assert len(sessions.sessions) == 1
@@ -0,0 +1,122 @@
+from typing import Optional
+import pytest
+from sqlalchemy import event
+from src.seaapi.adapters.repositories.sqlalchemy.foods import (
+    FoodSqlAlchemyRepository,
+)
+from src.seaapi.adapters.repositories.sqlalchemy.filter_plans import (
+    get_filter_plan,
+)
+from src.seaapi.domain.dtos.foods import (
+    FoodPaginationParams,
+)
+from src.seaapi.domain.dtos.mics import FilterValue
+from src.seaapi.domain.entities.food_entity import (
+    FoodEntity,
+    food_model_factory,
+)
+from src.seaapi.domain.entities.scale_entity import (
+    scale_model_factory,
+)
+from tests.utils.database import memory_session_factory
+from tests.utils.legacy_filters import legacy_find_all
+
+
+class NutrientPaginationParams(FoodPaginationParams):
+    """Expõe filtros do Meta que a rota não publica"""
+
+    id: Optional[FilterValue[int]]
+    calories: Optional[FilterValue[float]]
+    protein: Optional[FilterValue[float]]
+
+
+@pytest.fixture
+def repository():
+    session = memory_session_factory()()
+    scales = [
+        scale_model_factory(
+            name=f"Balança {i}", serial=f"SERIAL{i}"
+        )
+        for i in range(1, 4)
+    ]
+    names = ["Arroz", "Feijão", "Arroz integral", "Frango"]
+    for i in range(12):
+        food = food_model_factory(
+            name=f"{names[i % 4]} {i}",
+            description="Grelhado" if i % 3 else None,
+            protein=float(i),
+            carbs=float(12 - i),
+            fat=1.5,
+            calories=float(100 + 10 * (i % 5)),
+        )
+        # O relacionamento define o scale_id no flush
+        food.scale = scales[i % 4 - 1] if i % 4 else None
+        session.add(food)
+    session.commit()
+    yield FoodSqlAlchemyRepository(session)
+    session.close()
+
+
+PARAMS = [
+    dict(),
+    dict(page=None),
+    dict(name="arroz"),
+    dict(name="ARROZ INT", description="grelh"),
+    dict(search="grelhado"),
+    dict(search="Frango", name="frango"),
+    dict(search="   "),
+    dict(scale_id={"not": None}, page=None),
+    dict(scale_id=("in", [1, 3])),
+    dict(scale_id=("not_in", [1])),
+    dict(calories={"gte": 110.0, "lt": 140.0}),
+    dict(calories=120.0, order="protein,desc"),
+    dict(protein=("lte", 5.0), order="name,asc"),
+    dict(id=("gt", 6), order="calories,desc"),
+    dict(search="arroz", order="calories,asc", page=2),
+    dict(name="nada"),
+]
+
+
+@pytest.mark.parametrize("kwargs", PARAMS)
+def test_plan_matches_legacy_meta_handling(
+    repository, kwargs
+):
+    params = NutrientPaginationParams(
+        page_size=5, **{"page": 1, **kwargs}
+    )
+
+    items, results = repository.find_all(params=params)
+    legacy_items, legacy_results = legacy_find_all(
+        repository.session, FoodEntity, params
+    )
+
+    assert [item.id for item in items] == [
+        item.id for item in legacy_items
+    ]
+    assert results == legacy_results
+
+
+def test_plan_is_compiled_once_per_entity(repository):
+    assert get_filter_plan(FoodEntity) is get_filter_plan(
+        FoodEntity
+    )
+
+
+def test_empty_search_adds_no_like(repository):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = repository.session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        repository.find_all(
+            params=NutrientPaginationParams(page=None)
+        )
+    finally:
+        event.remove(
+            engine, "before_cursor_execute", record
+        )
+
+    assert "LIKE" not in statements[-1]
@@ -0,0 +1,143 @@
+import pytest
+from src.seaapi.adapters.repositories.sqlalchemy.scales import (
+    ScaleSqlAlchemyRepository,
+)
+from src.seaapi.domain.dtos.mics import (
+    PaginationParams,
+    pagination_options,
+)
+from src.seaapi.domain.entities.scale_entity import (
+    scale_model_factory,
+)
+from src.seaapi.domain.shared.cursors import next_cursor
+from tests.utils.database import memory_session_factory
+
+
+@pytest.fixture
+def repository():
+    session = memory_session_factory()()
+    for i in range(5):
+        session.add(
+            scale_model_factory(
+                name=f"Balança {i}", serial=f"SERIAL{i}"
+            )
+        )
+    session.commit()
+    yield ScaleSqlAlchemyRepository(session)
+    session.close()
+
+
+def walk_cursor(repository, **kwargs):
+    """Percorre a listagem seguindo os cursores até o fim"""
+    pages = []
+    after = None
+    while True:
+        params = PaginationParams(
+            page_size=2, after=after, **kwargs
+        )
+        items, results = repository.find_all(params=params)
+        cursor = next_cursor(items, params)
+        pages.append(
+            (
+                [item.id for item in items],
+                pagination_options(params, results, items),
+                cursor,
+            )
+        )
+        if cursor is None:
+            return pages
+        after = cursor
+
+
+def test_cursor_full_last_page_has_no_next(repository):
+    repository.delete(repository.find_by_id(5))
+    repository.session.commit()
+
+    pages = walk_cursor(repository, order="name,desc")
+
+    assert [ids for ids, _, _ in pages] == [[4, 3], [2, 1]]
+    assert pages[-1][1].has_next is False
+    assert pages[-1][2] is None
+
+
+COUNT_MODES = ["exact", "estimate", "window", "none"]
+
+
+@pytest.mark.parametrize("count", COUNT_MODES)
+def test_offset_last_page_has_no_next(repository, count):
+    params = PaginationParams(
+        page=3, page_size=2, count=count
+    )
+
+    items, results = repository.find_all(params=params)
+    options = pagination_options(params, results, items)
+
+    assert [item.id for item in items] == [5]
+    assert options.has_next is False
+    assert options.count_mode == count
+    if count == "none":
+        assert options.pages is None
+        assert options.results is None
+    else:
+        assert options.pages == 3
+        assert options.results == 5
+
+
+@pytest.mark.parametrize("count", COUNT_MODES)
+def test_offset_page_before_last_has_next(
+    repository, count
+):
+    params = PaginationParams(
+        page=2, page_size=2, count=count
+    )
+
+    items, results = repository.find_all(params=params)
+
+    assert [item.id for item in items] == [3, 4]
+    assert (
+        pagination_options(params, results, items).has_next
+        is True
+    )
+
+
+@pytest.mark.parametrize("count", COUNT_MODES)
+def test_cursor_last_page_per_count_mode(repository, count):
+    pages = walk_cursor(repository, count=count)
+
+    assert [ids for ids, _, _ in pages] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+    assert [
+        options.has_next for _, options, _ in pages
+    ] == [True, True, False]
+    assert all(
+        options.pages is None for _, options, _ in pages[1:]
+    )
+    expected_results = None if count == "none" else 5
+    assert all(
+        options.results == expected_results
+        for _, options, _ in pages[1:]
+    )
+
+
+@pytest.mark.parametrize("estimate", [1, 100])
+def test_estimate_does_not_drive_has_next(
+    repository, monkeypatch, estimate
+):
+    # A estimativa do planner pode errar para os dois lados
+    monkeypatch.setattr(
+        repository,
+        "_estimate_count",
+        lambda query: estimate,
+    )
+    for page, has_next in ((2, True), (3, False)):
+        params = PaginationParams(
+            page=page, page_size=2, count="estimate"
+        )
+        items, results = repository.find_all(params=params)
+        options = pagination_options(params, results, items)
+
+        assert options.results == estimate
+        assert options.has_next is has_next
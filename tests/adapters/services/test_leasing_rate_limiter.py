@@ -0,0 +1,210 @@
+import time
+import random
+import asyncio
+import bisect
+from types import SimpleNamespace
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.services.rate_limiting import (
+    LeasingRateLimiter,
+    redis_rate_limiter,
+)
+
+ENDPOINT = "GET:/v1/foods"
+LIMIT = 400
+WINDOW_SECONDS = 1
+DURATION_SECONDS = 2.5
+
+
+@pytest.fixture
+def redis_limiter_factory(monkeypatch):
+    """Limiters ligados ao mesmo Redis falso, um por worker"""
+    server = FakeServer()
+    monkeypatch.setattr(
+        redis_rate_limiter,
+        "aioredis",
+        SimpleNamespace(
+            from_url=lambda *args, **kwargs: FakeRedis(
+                server=server
+            )
+        ),
+    )
+
+    def factory(algorithm):
+        return redis_rate_limiter.RedisRateLimiter(
+            algorithm=algorithm, timeout_seconds=1
+        )
+
+    return factory
+
+
+def worst_window(allowed_at, window_seconds):
+    """Maior número de liberações dentro de uma mesma janela"""
+    allowed_at = sorted(allowed_at)
+    return max(
+        (
+            bisect.bisect_left(
+                allowed_at, moment + window_seconds
+            )
+            - i
+            for i, moment in enumerate(allowed_at)
+        ),
+        default=0,
+    )
+
+
+async def simulate(
+    limiters, duration, clients_per_worker=8, pause=0.002
+):
+    """
+    Várias requisições simultâneas por worker, todas para a mesma
+    chave, por `duration` segundos
+    """
+    allowed_at = []
+    end = time.monotonic() + duration
+
+    async def client(limiter):
+        while time.monotonic() < end:
+            allowed, _ = await limiter.is_allowed(
+                "user:1", LIMIT, WINDOW_SECONDS, ENDPOINT
+            )
+            if allowed:
+                # Momento da liberação, não do pedido: quem espera
+                # um lote entra só quando ele chega
+                allowed_at.append(time.monotonic())
+            await asyncio.sleep(random.random() * pause)
+
+    await asyncio.gather(
+        *[
+            client(limiter)
+            for limiter in limiters
+            for _ in range(clients_per_worker)
+        ]
+    )
+    return allowed_at
+
+
+_direct_worst_windows = {}
+
+
+def direct_worst_window(factory, algorithm):
+    """
+    Pior janela com os workers indo direto ao Redis, na mesma carga.
+    O GCRA admite uma rajada de um limite inteiro além da taxa e o
+    relógio é lido no cliente, então esta é a referência do limite
+    """
+    if algorithm not in _direct_worst_windows:
+        limiters = [factory(algorithm) for _ in range(4)]
+        _direct_worst_windows[algorithm] = worst_window(
+            asyncio.run(
+                simulate(limiters, DURATION_SECONDS)
+            ),
+            WINDOW_SECONDS,
+        )
+    return _direct_worst_windows[algorithm]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "algorithm", ["sliding_log", "gcra"]
+)
+@pytest.mark.parametrize(
+    "workers, max_overshoot",
+    [(4, 0.1), (8, 0.05), (3, 0.2)],
+)
+def test_overshoot_stays_within_bound(
+    redis_limiter_factory, algorithm, workers, max_overshoot
+):
+    direct = direct_worst_window(
+        redis_limiter_factory, algorithm
+    )
+    limiters = [
+        LeasingRateLimiter(
+            redis_limiter_factory(algorithm),
+            max_overshoot=max_overshoot,
+            workers=workers,
+        )
+        for _ in range(workers)
+    ]
+
+    allowed_at = asyncio.run(
+        simulate(limiters, DURATION_SECONDS)
+    )
+
+    # O arrendamento só pode somar a cota distribuída aos workers
+    assert worst_window(allowed_at, WINDOW_SECONDS) <= (
+        direct + LIMIT * max_overshoot
+    )
+    # Sob saturação a cota é consumida quase toda
+    assert len(allowed_at) >= LIMIT * 2
+    if algorithm == "sliding_log":
+        # No GCRA saturado a cota volta uma ficha por intervalo e
+        # cada lote sai com uma ficha só
+        assert sum(
+            limiter.local_hits for limiter in limiters
+        ) > (
+            sum(
+                limiter.remote_calls for limiter in limiters
+            )
+        )
+
+
+@pytest.mark.slow
+def test_below_limit_skips_redis(redis_limiter_factory):
+    limiters = [
+        LeasingRateLimiter(
+            redis_limiter_factory("sliding_log"),
+            max_overshoot=0.1,
+            workers=4,
+        )
+        for _ in range(4)
+    ]
+
+    # ~32 clientes a uma requisição a cada ~100 ms: bem abaixo do
+    # limite de 400 por segundo
+    allowed_at = asyncio.run(
+        simulate(limiters, duration=2, pause=0.2)
+    )
+
+    local_hits = sum(
+        limiter.local_hits for limiter in limiters
+    )
+    assert local_hits / len(allowed_at) > 0.8
+
+
+def test_small_limit_goes_straight_to_redis(
+    redis_limiter_factory,
+):
+    limiter = LeasingRateLimiter(
+        redis_limiter_factory("sliding_log"),
+        max_overshoot=0.1,
+        workers=4,
+    )
+
+    async def run():
+        return [
+            (
+                await limiter.is_allowed(
+                    "user:1", 5, 60, ENDPOINT
+                )
+            )[0]
+            for _ in range(7)
+        ]
+
+    assert asyncio.run(run()) == [True] * 5 + [False] * 2
+    assert limiter.local_hits == 0
+    assert limiter.remote_calls == 7
+
+
+def test_key_matches_wrapped_limiter(redis_limiter_factory):
+    redis_limiter = redis_limiter_factory("gcra")
+    limiter = LeasingRateLimiter(redis_limiter)
+
+    assert limiter.get_key("user:1", ENDPOINT) == (
+        redis_limiter.get_key("user:1", ENDPOINT)
+    )
+    assert limiter.get_key("user:1").startswith(
+        redis_limiter.key_prefix
+    )
@@ -0,0 +1,200 @@
+from types import SimpleNamespace
+import pytest
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from moto import mock_aws
+from starlette.middleware.authentication import (
+    AuthenticationMiddleware,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.entrypoints.api.handlers import (
+    register_handlers,
+)
+from src.seaapi.adapters.entrypoints.api.v1 import storage
+from src.seaapi.adapters.services.storage import cache
+from src.seaapi.adapters.services.storage.cache import (
+    PresignedUrlCache,
+)
+from src.seaapi.adapters.services.storage.minio import (
+    MinIOStorageService,
+)
+from src.seaapi.adapters.services.storage.s3 import (
+    S3StorageService,
+)
+from src.seaapi.config.containers import Container
+from src.seaapi.config.settings import settings
+from tests.utils.principals import TokenAsPrincipalBackend
+
+BUCKET = "sea-api-test"
+MINIO_URL = "http://minio.local:9000"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        cache,
+        "time",
+        SimpleNamespace(monotonic=lambda: clock.now),
+    )
+    return clock
+
+
+@pytest.fixture(
+    params=[S3StorageService, MinIOStorageService]
+)
+def storage_service(request, monkeypatch):
+    monkeypatch.setattr(settings, "STORAGE_BUCKET", BUCKET)
+    monkeypatch.setattr(
+        settings, "STORAGE_REGION", "us-east-1"
+    )
+    monkeypatch.setattr(
+        settings, "STORAGE_ENDPOINT_URL", MINIO_URL
+    )
+    monkeypatch.setattr(
+        settings, "STORAGE_ACCESS_KEY", "testing"
+    )
+    monkeypatch.setattr(
+        settings, "STORAGE_SECRET_KEY", "testing"
+    )
+    # O moto só intercepta endpoints fora da AWS listados aqui
+    monkeypatch.setenv(
+        "MOTO_S3_CUSTOM_ENDPOINTS", MINIO_URL
+    )
+    with mock_aws():
+        service = request.param()
+        service.client.create_bucket(Bucket=BUCKET)
+        service.upload("foods/1.png", content=b"foto")
+        yield service
+
+
+def test_url_is_reused_until_ttl_ratio(clock):
+    url_cache = PresignedUrlCache(ttl_ratio=0.5)
+    url_cache.put(BUCKET, "a.png", 60, "https://url")
+
+    clock.now += 29
+    assert (
+        url_cache.get(BUCKET, "a.png", 60) == "https://url"
+    )
+    # Outra validade é outra URL
+    assert url_cache.get(BUCKET, "a.png", 120) is None
+
+    clock.now += 1
+    assert url_cache.get(BUCKET, "a.png", 60) is None
+    # A entrada vencida sai do cache na própria consulta
+    assert url_cache.get_stats()["entries"] == 0
+
+
+def test_least_recently_used_url_is_evicted():
+    url_cache = PresignedUrlCache(max_entries=2)
+    url_cache.put(BUCKET, "a.png", 60, "https://a")
+    url_cache.put(BUCKET, "b.png", 60, "https://b")
+    url_cache.get(BUCKET, "a.png", 60)
+
+    url_cache.put(BUCKET, "c.png", 60, "https://c")
+
+    assert url_cache.get(BUCKET, "b.png", 60) is None
+    assert url_cache.get(BUCKET, "a.png", 60) == "https://a"
+    assert url_cache.get(BUCKET, "c.png", 60) == "https://c"
+    assert url_cache.get_stats() == {
+        "entries": 2,
+        "max_entries": 2,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "hit_ratio": 0.75,
+    }
+
+
+def test_invalidate_drops_every_expiry_of_the_path():
+    url_cache = PresignedUrlCache()
+    url_cache.put(BUCKET, "a.png", 60, "https://a60")
+    url_cache.put(BUCKET, "a.png", 120, "https://a120")
+    url_cache.put(BUCKET, "b.png", 60, "https://b")
+
+    url_cache.invalidate(BUCKET, "a.png")
+
+    assert url_cache.get(BUCKET, "a.png", 60) is None
+    assert url_cache.get(BUCKET, "a.png", 120) is None
+    assert url_cache.get(BUCKET, "b.png", 60) == "https://b"
+
+
+def test_service_reuses_presigned_url(storage_service):
+    url = storage_service.get("foods/1.png", 60)
+
+    assert storage_service.get("foods/1.png", 60) == url
+    stats = storage_service.get_stats()[
+        "presigned_url_cache"
+    ]
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.parametrize("change", ["upload", "delete"])
+def test_service_invalidates_on_change(
+    storage_service, change
+):
+    storage_service.get("foods/1.png", 60)
+    storage_service.get("foods/2.png", 60)
+
+    if change == "upload":
+        storage_service.upload(
+            "foods/1.png", content=b"nova"
+        )
+    else:
+        storage_service.delete("foods/1.png")
+    storage_service.get("foods/1.png", 60)
+    storage_service.get("foods/2.png", 60)
+
+    stats = storage_service.get_stats()[
+        "presigned_url_cache"
+    ]
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+
+
+@pytest.fixture
+def client(storage_service):
+    container = Container()
+    container.storage_service.override(
+        providers.Object(storage_service)
+    )
+    container.wire(modules=[storage])
+    app = FastAPI()
+    register_handlers(app)
+    app.add_middleware(
+        AuthenticationMiddleware,
+        backend=TokenAsPrincipalBackend(),
+    )
+    app.include_router(storage.router, prefix="/v1/storage")
+    yield TestClient(app)
+    container.unwire()
+
+
+def test_stats_endpoint_serves_cache_counters(
+    client, storage_service
+):
+    storage_service.get("foods/1.png", 60)
+    storage_service.get("foods/1.png", 60)
+
+    response = client.get(
+        "/v1/storage/stats",
+        headers={"Authorization": "Bearer admin"},
+    )
+    refused = client.get(
+        "/v1/storage/stats",
+        headers={"Authorization": "Bearer customer"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["stats"] == {
+        "provider": storage_service.get_stats()["provider"],
+        "presigned_url_cache": {
+            "entries": 1,
+            "max_entries": settings.STORAGE_URL_CACHE_MAX_ENTRIES,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "hit_ratio": 0.5,
+        },
+    }
+    assert refused.status_code == 403
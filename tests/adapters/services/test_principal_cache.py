@@ -0,0 +1,108 @@
+import pytest
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
+from src.seaapi.adapters.services.caching import (
+    memory_principal_cache,
+)
+
+TTL_SECONDS = 60
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(
+        memory_principal_cache.time, "monotonic", clock
+    )
+    return clock
+
+
+@pytest.fixture
+def cache(clock):
+    return memory_principal_cache.MemoryPrincipalCache(
+        ttl_seconds=TTL_SECONDS
+    )
+
+
+def make_principal(user_id):
+    return Principal(
+        id=user_id,
+        is_active=True,
+        is_super_user=False,
+        groups_ids=(),
+        permissions_codes=frozenset(),
+    )
+
+
+def test_stale_put_is_rejected_after_invalidation(cache):
+    version = cache.version(1)
+    cache.invalidate(1)
+
+    cache.put(version, make_principal(1))
+
+    assert cache.get(1, cache.version(1)) is None
+
+
+def test_user_versions_are_dropped_after_ttl(cache, clock):
+    for user_id in range(1000):
+        cache.invalidate(user_id)
+
+    clock.now += TTL_SECONDS + 1
+    cache.invalidate(1000)
+
+    assert list(cache._user_versions) == [1000]
+
+
+def test_user_versions_are_kept_within_ttl(cache, clock):
+    cache.invalidate(1)
+    clock.now += TTL_SECONDS / 2
+    cache.invalidate(2)
+    clock.now += TTL_SECONDS / 2
+    cache.invalidate(3)
+
+    assert list(cache._user_versions) == [2, 3]
+
+
+def test_versions_are_not_reused_after_being_dropped(
+    cache, clock
+):
+    cache.invalidate(1)
+    stale_version = cache.version(1)
+    cache.invalidate(1)
+    clock.now += TTL_SECONDS + 1
+    cache.invalidate(2)
+    cache.invalidate(1)
+
+    cache.put(stale_version, make_principal(1))
+
+    assert cache.get(1, stale_version) is None
+    assert cache.version(1) != stale_version
+
+
+def test_cached_entry_survives_other_invalidations(cache):
+    version = cache.version(1)
+    cache.put(version, make_principal(1))
+
+    cache.invalidate(2)
+
+    assert cache.get(1, cache.version(1)) == make_principal(
+        1
+    )
+
+
+def test_invalidate_all_drops_user_versions(cache):
+    cache.invalidate(1)
+
+    cache.invalidate_all()
+
+    assert not cache._user_versions
@@ -0,0 +1,144 @@
+import time
+import threading
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.entrypoints.api.handlers import (
+    register_handlers,
+)
+from src.seaapi.adapters.services.hashing import (
+    InlinePasswordHasher,
+    ProcessPoolPasswordHasher,
+)
+from src.seaapi.domain.entities.user_entity import (
+    user_model_factory,
+)
+from src.seaapi.domain.ports.shared.exceptions import (
+    PasswordHashingUnavailableException,
+)
+from src.seaapi.domain.shared.hash import Hasher
+
+ROUNDS = 4
+
+
+@pytest.fixture(scope="module")
+def hasher():
+    hasher = ProcessPoolPasswordHasher(
+        rounds=ROUNDS, max_workers=1, max_pending=1
+    )
+    yield hasher
+    hasher.executor.shutdown()
+
+
+@pytest.fixture
+def busy_pool(hasher):
+    """Ocupa a única vaga da fila com uma tarefa lenta"""
+    worker = threading.Thread(
+        target=hasher._run, args=(time.sleep, 0.5)
+    )
+    worker.start()
+    while hasher.pending < hasher.max_pending:
+        time.sleep(0.001)
+    yield
+    worker.join()
+
+
+@pytest.fixture
+def use_hasher():
+    yield Hasher.use
+    Hasher.use(None)
+
+
+def make_user(password):
+    return user_model_factory(
+        first_name="Teste",
+        last_name="Usuário",
+        email="teste@sea.api",
+        password=password,
+        is_active=True,
+        is_super_user=False,
+    )
+
+
+def test_round_trip_through_spawn_pool(hasher):
+    hashed = hasher.hash("segredo")
+
+    assert hashed.startswith(f"$2b$0{ROUNDS}$")
+    assert hasher.verify("segredo", hashed)
+    assert not hasher.verify("errada", hashed)
+    assert hasher.get_stats()["completed"] >= 3
+
+
+def test_parity_with_inline_hasher(hasher):
+    inline = InlinePasswordHasher(rounds=ROUNDS)
+    from_pool = hasher.hash("segredo")
+    from_inline = inline.hash("segredo")
+
+    assert inline.verify("segredo", from_pool)
+    assert hasher.verify("segredo", from_inline)
+    assert not inline.verify("errada", from_pool)
+    assert not hasher.verify("errada", from_inline)
+    for hashed in (from_pool, from_inline):
+        assert hasher.needs_update(
+            hashed
+        ) == inline.needs_update(hashed)
+
+
+def test_full_queue_is_rejected(hasher, busy_pool):
+    rejected = hasher.get_stats()["rejected"]
+
+    with pytest.raises(PasswordHashingUnavailableException):
+        hasher.hash("segredo")
+
+    assert hasher.get_stats()["rejected"] == rejected + 1
+
+
+def test_full_queue_returns_503_with_retry_after(
+    hasher, busy_pool
+):
+    app = FastAPI()
+    register_handlers(app)
+
+    @app.post("/login")
+    def login():
+        return {"hash": hasher.hash("segredo")}
+
+    response = TestClient(app).post("/login")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert (
+        response.json()["code"]
+        == "password_hashing_unavailable"
+    )
+
+
+def test_login_rehashes_old_cost(hasher, use_hasher):
+    use_hasher(hasher)
+    old = InlinePasswordHasher(rounds=ROUNDS + 1)
+    user = make_user(old.hash("segredo"))
+
+    assert user.authenticate("segredo")
+
+    assert user.password.startswith(f"$2b$0{ROUNDS}$")
+    assert not hasher.needs_update(user.password)
+    assert hasher.verify("segredo", user.password)
+
+
+def test_login_keeps_hash_when_pool_is_full(
+    hasher, use_hasher, monkeypatch
+):
+    old = InlinePasswordHasher(rounds=ROUNDS + 1)
+    user = make_user(old.hash("segredo"))
+    previous = user.password
+
+    def unavailable(password):
+        raise PasswordHashingUnavailableException()
+
+    # Só a troca do hash é recusada, a verificação passa
+    use_hasher(hasher)
+    monkeypatch.setattr(hasher, "hash", unavailable)
+
+    assert user.authenticate("segredo")
+    assert user.password == previous
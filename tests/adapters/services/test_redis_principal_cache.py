@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+import pytest
+import redis
+from fakeredis import FakeRedis, FakeServer
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
+from src.seaapi.adapters.services.caching import (
+    redis_principal_cache,
+)
+
+TTL_SECONDS = 60
+
+
+@pytest.fixture
+def redis_kwargs(monkeypatch):
+    """Clientes ligados ao mesmo Redis falso, um por worker"""
+    server = FakeServer()
+    calls = []
+
+    def from_url(url, **kwargs):
+        calls.append(kwargs)
+        return FakeRedis(server=server)
+
+    monkeypatch.setattr(
+        redis_principal_cache,
+        "redis",
+        SimpleNamespace(
+            from_url=from_url, RedisError=redis.RedisError
+        ),
+    )
+    return calls
+
+
+@pytest.fixture
+def make_cache(redis_kwargs):
+    return (
+        lambda: redis_principal_cache.RedisPrincipalCache(
+            ttl_seconds=TTL_SECONDS, timeout_seconds=0.05
+        )
+    )
+
+
+def make_principal(user_id, permissions=()):
+    return Principal(
+        id=user_id,
+        is_active=True,
+        is_super_user=False,
+        groups_ids=(),
+        permissions_codes=frozenset(permissions),
+    )
+
+
+def test_client_has_socket_timeouts(
+    make_cache, redis_kwargs
+):
+    make_cache()
+
+    assert redis_kwargs[0]["socket_timeout"] == 0.05
+    assert redis_kwargs[0]["socket_connect_timeout"] == 0.05
+
+
+def test_invalidation_reaches_other_workers(make_cache):
+    writer, reader = make_cache(), make_cache()
+    version = reader.version(1)
+    reader.put(version, make_principal(1, ["old"]))
+
+    writer.invalidate(1)
+
+    assert reader.get(1, reader.version(1)) is None
+
+
+def test_user_version_key_expires(make_cache):
+    cache = make_cache()
+
+    cache.invalidate(1)
+
+    ttl = cache.redis_client.ttl(cache._version_key(1))
+    assert TTL_SECONDS < ttl <= TTL_SECONDS * 2
+
+
+def test_versions_are_not_reused_after_expiry(make_cache):
+    writer, reader = make_cache(), make_cache()
+    writer.invalidate(1)
+    stale_version = reader.version(1)
+    reader.put(stale_version, make_principal(1, ["old"]))
+
+    # Chave de versão expirada e nova invalidação
+    writer.redis_client.delete(writer._version_key(1))
+    writer.invalidate(1)
+
+    version = make_cache().version(1)
+    assert version != stale_version
+    assert make_cache().get(1, version) is None
+
+
+def test_unavailable_redis_falls_back_to_database(
+    make_cache,
+):
+    cache = make_cache()
+
+    def unavailable(*args, **kwargs):
+        raise redis.exceptions.TimeoutError("Timeout")
+
+    cache.redis_client.mget = unavailable
+
+    assert cache.version(1) is None
@@ -0,0 +1,38 @@
+import time
+import socket
+import pytest
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.services.caching import (
+    RedisVersionedCache,
+)
+
+
+@pytest.fixture
+def hung_redis_url():
+    """Servidor que aceita conexões e nunca responde"""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    yield f"redis://127.0.0.1:{server.getsockname()[1]}"
+    server.close()
+
+
+def test_hung_redis_falls_back_within_timeout(
+    hung_redis_url,
+):
+    cache = RedisVersionedCache(
+        namespace="menu",
+        redis_url=hung_redis_url,
+        timeout_seconds=0.05,
+    )
+
+    started = time.monotonic()
+    version = cache.version()
+    payload = cache.put(version, b"[]")
+    cache.invalidate()
+
+    # Três chamadas ao Redis, cada uma limitada pelo timeout
+    assert time.monotonic() - started < 1
+    assert version == -1
+    assert payload.body == b"[]"
+    assert cache.get(version) is None
@@ -0,0 +1,208 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+from src.seaapi.adapters.unit_of_works import (
+    ScaleSqlAlchemyUnitOfWork,
+)
+from src.seaapi.adapters.unit_of_works.shared import (
+    session_scope,
+)
+from src.seaapi.domain.ports.shared.exceptions import (
+    TransactionRolledBackException,
+)
+from src.seaapi.domain.entities.scale_entity import (
+    ScaleEntity,
+    scale_model_factory,
+)
+from tests.utils.database import memory_session_factory
+
+
+@pytest.fixture
+def session_factory():
+    return memory_session_factory()
+
+
+@pytest.fixture
+def make_uow(session_factory):
+    return lambda: ScaleSqlAlchemyUnitOfWork(
+        lambda: session_factory
+    )
+
+
+def count_scales(session_factory):
+    session = session_factory()
+    try:
+        return session.query(ScaleEntity).count()
+    finally:
+        session.close()
+
+
+def add_scale(uow, serial="SERIAL1"):
+    uow.scales.create(
+        scale_model_factory(name="Balança", serial=serial)
+    )
+
+
+def test_after_commit_waits_for_outer_commit(
+    make_uow, session_factory
+):
+    seen = []
+
+    def on_commit():
+        seen.append(count_scales(session_factory))
+
+    with session_scope():
+        with make_uow():
+            with make_uow() as inner:
+                add_scale(inner)
+                inner.after_commit(on_commit)
+                inner.commit()
+            assert seen == []
+
+    assert seen == [1]
+
+
+def test_after_commit_runs_right_after_outer_commit(
+    make_uow, session_factory
+):
+    seen = []
+
+    with make_uow() as uow:
+        add_scale(uow)
+        uow.after_commit(
+            lambda: seen.append(
+                count_scales(session_factory)
+            )
+        )
+        uow.commit()
+        assert seen == [1]
+
+
+def test_outer_exit_without_commit_discards_changes(
+    make_uow, session_factory
+):
+    with session_scope():
+        with make_uow():
+            with make_uow() as inner:
+                add_scale(inner)
+                inner.flush()
+        # A próxima UoW do escopo não vê a escrita descartada
+        with make_uow() as uow:
+            assert uow.scales.count_all() == 0
+
+    assert count_scales(session_factory) == 0
+
+
+def test_failed_deferred_commit_rolls_back(
+    make_uow, session_factory
+):
+    with make_uow() as uow:
+        add_scale(uow)
+        uow.commit()
+    seen = []
+
+    with session_scope() as scope:
+        with pytest.raises(IntegrityError):
+            with make_uow():
+                with make_uow() as inner:
+                    add_scale(inner)
+                    inner.after_commit(
+                        lambda: seen.append(1)
+                    )
+                    inner.commit()
+        # A sessão do escopo continua utilizável
+        with make_uow() as uow:
+            assert uow.scales.count_all() == 1
+        assert scope.after_commit_callbacks == []
+
+    assert seen == []
+
+
+def test_rollback_discards_after_commit(make_uow):
+    seen = []
+
+    with make_uow() as uow:
+        add_scale(uow)
+        uow.after_commit(lambda: seen.append(1))
+        uow.rollback()
+        uow.commit()
+
+    assert seen == []
+
+
+def test_entities_stay_readable_after_read_only_exit(
+    make_uow,
+):
+    with make_uow() as uow:
+        add_scale(uow)
+        uow.commit()
+
+    with session_scope():
+        with make_uow() as uow:
+            scale = uow.scales.find_by_id(1)
+
+        assert scale.serial == "SERIAL1"
+
+
+def test_outer_commit_refused_after_nested_failure(
+    make_uow, session_factory
+):
+    seen = []
+
+    with session_scope():
+        with pytest.raises(TransactionRolledBackException):
+            with make_uow() as outer:
+                add_scale(outer, serial="OUTER")
+                try:
+                    with make_uow() as inner:
+                        add_scale(inner)
+                        inner.flush()
+                        raise ValueError()
+                except ValueError:
+                    pass
+                outer.after_commit(lambda: seen.append(1))
+                outer.commit()
+        # O escopo segue utilizável depois da recusa
+        with make_uow() as uow:
+            add_scale(uow, serial="AFTER")
+            uow.commit()
+
+    assert seen == []
+    assert count_scales(session_factory) == 1
+
+
+def test_deferred_commit_refused_after_failed_flush(
+    make_uow, session_factory
+):
+    with make_uow() as uow:
+        add_scale(uow)
+        uow.commit()
+
+    with session_scope():
+        with pytest.raises(TransactionRolledBackException):
+            with make_uow():
+                with make_uow() as middle:
+                    try:
+                        with make_uow() as inner:
+                            add_scale(inner)
+                            inner.flush()
+                    except IntegrityError:
+                        pass
+                    middle.commit()
+
+    assert count_scales(session_factory) == 1
+
+
+def test_nested_failure_without_commit_rolls_back(
+    make_uow, session_factory
+):
+    with session_scope():
+        with make_uow():
+            try:
+                with make_uow() as inner:
+                    add_scale(inner)
+                    inner.flush()
+                    raise ValueError()
+            except ValueError:
+                pass
+
+    assert count_scales(session_factory) == 0
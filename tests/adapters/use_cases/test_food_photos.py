@@ -0,0 +1,129 @@
+import asyncio
+import boto3
+import pytest
+from moto import mock_aws
+from src.seaapi.adapters.services.caching.memory_versioned_cache import (
+    MemoryVersionedCache,
+)
+from src.seaapi.adapters.services.storage.executor import (
+    ExecutorStorageService,
+)
+from src.seaapi.adapters.services.storage.s3 import (
+    S3StorageService,
+)
+from src.seaapi.adapters.unit_of_works import (
+    FoodSqlAlchemyUnitOfWork,
+    ScaleSqlAlchemyUnitOfWork,
+)
+from src.seaapi.adapters.unit_of_works.shared import (
+    session_scope,
+)
+from src.seaapi.adapters.use_cases import FoodService
+from src.seaapi.config.settings import settings
+from src.seaapi.domain.dtos.foods import FoodCreateInputDto
+from src.seaapi.domain.dtos.mics import UploadedFile
+from src.seaapi.domain.entities import FoodEntity
+from src.seaapi.domain.ports.shared.exceptions import (
+    CannotStorageFileException,
+)
+from tests.utils.database import (
+    memory_engine,
+    memory_session_factory,
+)
+
+BUCKET = "sea-api-test"
+PHOTO = b"\x89PNG\r\n\x1a\n" + b"0" * 1024
+
+
+@pytest.fixture
+def storage_service(monkeypatch):
+    monkeypatch.setattr(settings, "STORAGE_BUCKET", BUCKET)
+    monkeypatch.setattr(
+        settings, "STORAGE_REGION", "us-east-1"
+    )
+    monkeypatch.setattr(
+        settings, "STORAGE_ACCESS_KEY", "testing"
+    )
+    monkeypatch.setattr(
+        settings, "STORAGE_SECRET_KEY", "testing"
+    )
+    with mock_aws():
+        boto3.client(
+            "s3", region_name="us-east-1"
+        ).create_bucket(Bucket=BUCKET)
+        yield S3StorageService()
+
+
+@pytest.fixture
+def session_factory():
+    return memory_session_factory(memory_engine())
+
+
+@pytest.fixture
+def food_service(storage_service, session_factory):
+    return FoodService(
+        uow=FoodSqlAlchemyUnitOfWork(
+            lambda: session_factory
+        ),
+        scale_uow=ScaleSqlAlchemyUnitOfWork(
+            lambda: session_factory
+        ),
+        storage_service=storage_service,
+        async_storage_service=ExecutorStorageService(
+            storage_service, max_workers=2
+        ),
+        nutrition_service=None,
+        food_event_publisher=None,
+        menu_cache=MemoryVersionedCache(namespace="menu"),
+    )
+
+
+def food_input(**kwargs):
+    return FoodCreateInputDto(
+        name="Arroz",
+        protein=2.5,
+        carbs=28.0,
+        fat=0.3,
+        calories=130.0,
+        photo=UploadedFile(
+            filename="arroz.png", content=PHOTO
+        ),
+        **kwargs,
+    )
+
+
+def test_create_uploads_photo(
+    food_service, session_factory
+):
+    asyncio.run(food_service.create(food_input()))
+
+    food = session_factory().query(FoodEntity).one()
+    assert food.photo.startswith("photos/meals/1/")
+    body = food_service.storage_service.client.get_object(
+        Bucket=BUCKET, Key=food.photo
+    )["Body"].read()
+    assert body == PHOTO
+
+
+def test_failed_upload_discards_food(
+    food_service, session_factory, monkeypatch
+):
+    monkeypatch.setattr(
+        settings, "STORAGE_BUCKET", "missing-bucket"
+    )
+
+    with pytest.raises(CannotStorageFileException):
+        asyncio.run(food_service.create(food_input()))
+
+    assert session_factory().query(FoodEntity).count() == 0
+
+
+def test_create_uses_request_session(food_service):
+    async def request():
+        with session_scope() as scope:
+            await food_service.create(food_input())
+            # A unit of work rodou no pool de threads com a sessão
+            # do escopo da requisição
+            return scope.session
+
+    assert asyncio.run(request()) is not None
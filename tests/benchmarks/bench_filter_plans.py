@@ -0,0 +1,134 @@
+"""
+Compara o `_find_all` de comidas com o FilterPlan compilado contra a
+montagem anterior, que relia o Meta da entidade a cada chamada
+(tests/utils/legacy_filters.py), na consulta do cardápio e numa
+listagem paginada com filtro e busca.
+
+    python -m tests.benchmarks.bench_filter_plans
+    python -m tests.benchmarks.bench_filter_plans --rows 50 --number 5000
+
+Roda num SQLite temporário, criado e removido pelo script.
+"""
+import os
+import time
+import argparse
+import statistics
+import tempfile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from tests.utils.database import map_entities
+from tests.utils.legacy_filters import legacy_find_all
+from src.seaapi.adapters.db.orm import metadata
+from src.seaapi.adapters.repositories.sqlalchemy.foods import (
+    FoodSqlAlchemyRepository,
+)
+from src.seaapi.domain.dtos.foods import (
+    FoodPaginationParams,
+)
+from src.seaapi.domain.entities.food_entity import (
+    FoodEntity,
+    food_model_factory,
+)
+from src.seaapi.domain.entities.scale_entity import (
+    scale_model_factory,
+)
+
+SCENARIOS = {
+    "cardápio": dict(scale_id={"not": None}, page=None),
+    "nome e busca": dict(
+        name="arroz",
+        search="grelhado",
+        page=1,
+        page_size=10,
+    ),
+}
+
+
+def load_rows(session_factory, rows: int):
+    session = session_factory()
+    scales = [
+        scale_model_factory(
+            name=f"Balança {i}", serial=f"SERIAL{i:04d}"
+        )
+        for i in range(rows // 2)
+    ]
+    for i in range(rows):
+        food = food_model_factory(
+            name=f"{'Arroz' if i % 2 else 'Feijão'} {i}",
+            description="Grelhado" if i % 3 else None,
+            protein=1.0,
+            carbs=1.0,
+            fat=1.0,
+            calories=100.0,
+        )
+        food.scale = scales[i // 2] if i % 2 else None
+        session.add(food)
+    session.commit()
+    session.close()
+
+
+def measure(session, call, number: int, repeat: int):
+    call()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            call()
+        timings.append(
+            (time.perf_counter() - started) / number
+        )
+        session.expunge_all()
+    return statistics.median(timings) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    handle, database_file = tempfile.mkstemp(suffix=".db")
+    os.close(handle)
+    map_entities()
+    engine = create_engine(f"sqlite:///{database_file}")
+    metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    print(
+        f"{args.rows} comidas, {args.number} chamadas por rodada"
+    )
+    try:
+        load_rows(session_factory, args.rows)
+        session = session_factory()
+        repository = FoodSqlAlchemyRepository(session)
+        for scenario, kwargs in SCENARIOS.items():
+            params = FoodPaginationParams(**kwargs)
+            before = measure(
+                session,
+                lambda: legacy_find_all(
+                    session, FoodEntity, params
+                ),
+                args.number,
+                args.repeat,
+            )
+            after = measure(
+                session,
+                lambda: repository.find_all(params=params),
+                args.number,
+                args.repeat,
+            )
+            print(
+                f"{scenario:<14} Meta por chamada "
+                + f"{before:8.1f} µs  plano {after:8.1f} µs  "
+                + f"({before / after:.2f}x)"
+            )
+        session.close()
+    finally:
+        metadata.drop_all(engine)
+        engine.dispose()
+        os.remove(database_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Mede os algoritmos do MemoryRateLimiter contra o log de timestamps
+usado antes deles: tempo por verificação e memória com 100 mil
+clientes distintos, e uma chave quente presa no limite.
+
+    python -m tests.benchmarks.bench_memory_rate_limiter
+    python -m tests.benchmarks.bench_memory_rate_limiter --clients 10000
+"""
+import gc
+import time
+import asyncio
+import argparse
+import tracemalloc
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.services.rate_limiting.memory_rate_limiter import (
+    ALGORITHMS,
+    MemoryRateLimiter,
+)
+
+MAX_REQUESTS = 200
+WINDOW_SECONDS = 3600
+ENDPOINT = "GET:/v1/foods"
+
+
+class SlidingLogBaseline:
+    """
+    Log de timestamps por chave, refeito a cada verificação: o
+    MemoryRateLimiter anterior, mantido aqui como referência
+    """
+
+    def __init__(self):
+        self._requests = {}
+
+    async def is_allowed(
+        self,
+        identifier,
+        max_requests,
+        window_seconds,
+        endpoint,
+    ):
+        key = f"{identifier}:{endpoint}"
+        now = time.time()
+        cutoff = now - window_seconds
+        requests = [
+            moment
+            for moment in self._requests.get(key, [])
+            if moment > cutoff
+        ]
+        self._requests[key] = requests
+        if len(requests) >= max_requests:
+            return False, {}
+        requests.append(now)
+        return True, {}
+
+
+def limiters():
+    yield "log (anterior)", SlidingLogBaseline
+    for algorithm in ALGORITHMS:
+        yield algorithm, lambda: MemoryRateLimiter(
+            algorithm, sweep_interval_seconds=3600
+        )
+
+
+async def run_clients(limiter, keys, rounds: int):
+    for _ in range(rounds):
+        for key in keys:
+            await limiter.is_allowed(
+                key, MAX_REQUESTS, WINDOW_SECONDS, ENDPOINT
+            )
+
+
+async def many_clients(factory, clients: int, rounds: int):
+    keys = [f"ip:{i}" for i in range(clients)]
+    started = time.perf_counter()
+    await run_clients(factory(), keys, rounds)
+    elapsed = time.perf_counter() - started
+
+    # Memória retida depois da mesma carga, medida à parte para
+    # o tracemalloc não pesar no tempo
+    gc.collect()
+    tracemalloc.start()
+    limiter = factory()
+    await run_clients(limiter, keys, rounds)
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / (clients * rounds) * 1e6, memory / 1e6
+
+
+async def hot_key(factory, checks: int):
+    limiter = factory()
+    started = time.perf_counter()
+    for _ in range(checks):
+        await limiter.is_allowed(
+            "ip:hot", MAX_REQUESTS, WINDOW_SECONDS, ENDPOINT
+        )
+    return (time.perf_counter() - started) / checks * 1e6
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--clients", type=int, default=100000
+    )
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--hot-checks", type=int, default=20000
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"{args.clients} clientes x {args.rounds}, "
+        + f"limite {MAX_REQUESTS}/{WINDOW_SECONDS}s"
+    )
+    for name, factory in limiters():
+        per_check, memory = await many_clients(
+            factory, args.clients, args.rounds
+        )
+        hot = await hot_key(factory, args.hot_checks)
+        print(
+            f"{name:15s} {per_check:6.2f} us/verificação  "
+            + f"{memory:6.1f} MB  "
+            + f"chave quente no limite {hot:7.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
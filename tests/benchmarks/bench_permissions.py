@@ -0,0 +1,163 @@
+"""
+Mede as verificações de permissão que uma rota faz por requisição
+(dois has_role e dois has_permission, um deles ausente) no
+UserEntity anterior, no UserEntity atual e no Principal, para um
+usuário com poucos e com muitos grupos.
+
+    python -m tests.benchmarks.bench_permissions
+    python -m tests.benchmarks.bench_permissions --number 5000
+"""
+import timeit
+import argparse
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.domain import Role
+from src.seaapi.domain.entities.user_entity import (
+    user_model_factory,
+)
+from src.seaapi.domain.entities.group_entity import (
+    group_model_factory,
+)
+from src.seaapi.domain.entities.permission_entity import (
+    permission_model_factory,
+)
+
+SCENARIOS = ((3, 10), (40, 25))
+
+
+def check_privileges_baseline(role, groups, exact=False):
+    """
+    Role.check_privileges anterior: percorre os grupos a cada
+    chamada
+    """
+    user_priority = float("inf")
+    for group_id in groups:
+        if group_id >= 0 and group_id <= 2:
+            group = Role._member_map_[
+                Role._member_names_[group_id]
+            ]
+            user_priority = min(
+                user_priority, group.priority
+            )
+    priority = min(user_priority, Role.NORMAL.priority)
+    if exact:
+        return role.priority == priority
+    return priority <= role.priority
+
+
+class UserBaseline:
+    """
+    Verificações do UserEntity anterior, que refaziam o conjunto de
+    permissões e a lista de códigos a cada chamada
+    """
+
+    def __init__(self, user):
+        self.groups = user.groups
+        self.is_super_user = user.is_super_user
+
+    @property
+    def permissions(self):
+        permissions = set()
+        for group in self.groups:
+            for permission in group.permissions:
+                permissions.add(permission)
+        return permissions
+
+    @property
+    def permissions_codes(self):
+        return [p.code for p in self.permissions]
+
+    @property
+    def groups_ids(self):
+        ids = [g.id for g in self.groups]
+        return ids + [0] if self.is_super_user else ids
+
+    def has_role(self, role, exact=False):
+        return check_privileges_baseline(
+            role, self.groups_ids, exact
+        )
+
+    def has_permission(self, permission):
+        if self.is_super_user:
+            return True
+        return permission in self.permissions_codes
+
+
+def make_user(groups: int, permissions: int):
+    user = user_model_factory(
+        first_name="Bench",
+        last_name="User",
+        email="bench@sea.api",
+        password="x",
+        is_active=True,
+        is_super_user=False,
+        id=7,
+    )
+    for g in range(groups):
+        group = group_model_factory(
+            name=f"grupo{g}", default=False, id=g + 2
+        )
+        group.permissions = [
+            permission_model_factory(
+                name="permissão",
+                code=f"act{p}_res{g}",
+                id=g * 100 + p,
+            )
+            for p in range(permissions)
+        ]
+        user.groups.append(group)
+    return user
+
+
+def route_checks(groups: int):
+    present = f"act3_res{groups - 1}"
+
+    def check(user):
+        return (
+            user.has_role(Role.ADMIN),
+            user.has_role(Role.CUSTOMER),
+            user.has_permission(present),
+            user.has_permission("nao_existe"),
+        )
+
+    return check
+
+
+def per_call(func, number: int) -> float:
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    for groups, permissions in SCENARIOS:
+        user = make_user(groups, permissions)
+        baseline = UserBaseline(user)
+        principal = user.principal
+        check = route_checks(groups)
+        assert (
+            check(baseline)
+            == check(user)
+            == check(principal)
+        )
+
+        old = per_call(lambda: check(baseline), args.number)
+        entity = per_call(lambda: check(user), args.number)
+        build = per_call(
+            lambda: user.principal, args.number
+        )
+        cached = per_call(
+            lambda: check(principal), args.number * 50
+        )
+        print(
+            f"{groups} grupos x {permissions} permissões: "
+            + f"anterior {old:7.1f} us  "
+            + f"entidade {entity:7.1f} us  "
+            + f"principal {cached:5.2f} us "
+            + f"(montagem {build:.1f} us, uma vez por cache)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Requisições por segundo do RateLimitMiddleware (ASGI puro) contra um
+BaseHTTPMiddleware que faz o mesmo trabalho, como a versão anterior,
+e contra o app sem rate limiting. As chamadas são feitas direto na
+interface ASGI, sem rede, com o MemoryRateLimiter.
+
+    python -m tests.benchmarks.bench_rate_limit_middleware
+"""
+import time
+import asyncio
+import argparse
+from fastapi import FastAPI, Request
+from starlette.authentication import AuthenticationBackend
+from starlette.middleware.authentication import (
+    AuthenticationMiddleware,
+)
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.entrypoints.api.shared.rate_limit_middleware import (
+    RateLimitMiddleware,
+)
+from src.seaapi.adapters.services.rate_limiting.memory_rate_limiter import (
+    MemoryRateLimiter,
+)
+
+EXEMPT_ENDPOINTS = ["GET:/docs", "GET:/openapi.json"]
+
+
+class BaseHTTPRateLimitBaseline(BaseHTTPMiddleware):
+    """
+    Mesmo trabalho da versão anterior do middleware: chave pelo path
+    da URL, isenção por busca de substring e headers na resposta
+    """
+
+    def __init__(
+        self, app, rate_limiter, max_requests, window
+    ):
+        super().__init__(app)
+        self.rate_limiter = rate_limiter
+        self.max_requests = max_requests
+        self.window = window
+
+    async def dispatch(self, request: Request, call_next):
+        endpoint = f"{request.method}:{request.url.path}"
+        if any(
+            exempt in endpoint
+            for exempt in EXEMPT_ENDPOINTS
+        ):
+            return await call_next(request)
+        allowed, info = await self.rate_limiter.is_allowed(
+            identifier=f"ip:{request.client.host}",
+            max_requests=self.max_requests,
+            window_seconds=self.window,
+            endpoint=endpoint,
+        )
+        if not allowed:
+            return JSONResponse(
+                status_code=429, content={"error": "limit"}
+            )
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(
+            self.max_requests
+        )
+        response.headers["X-RateLimit-Remaining"] = str(
+            info.get("remaining_requests", 0)
+        )
+        return response
+
+
+class AnonymousBackend(AuthenticationBackend):
+    async def authenticate(self, conn):
+        return None
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/foods")
+    async def list_foods():
+        return {"ok": True}
+
+    @app.get("/v1/foods/{id}")
+    async def get_food(id: int):
+        return {"id": id}
+
+    limit, window = 10**9, 60
+    if variant == "asgi":
+        app.add_middleware(
+            RateLimitMiddleware,
+            rate_limiter=MemoryRateLimiter(),
+            default_max_requests=limit,
+            default_window_seconds=window,
+            exempt_endpoints=EXEMPT_ENDPOINTS,
+        )
+    elif variant == "basehttp":
+        app.add_middleware(
+            BaseHTTPRateLimitBaseline,
+            rate_limiter=MemoryRateLimiter(),
+            max_requests=limit,
+            window=window,
+        )
+    app.add_middleware(
+        AuthenticationMiddleware, backend=AnonymousBackend()
+    )
+    return app
+
+
+async def call(app, path: str):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("10.0.0.1", 1234),
+        "root_path": "",
+    }
+    received = False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {
+                "type": "http.request",
+                "body": b"",
+                "more_body": False,
+            }
+        await asyncio.Event().wait()
+
+    status = None
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--requests", type=int, default=5000
+    )
+    args = parser.parse_args(argv)
+
+    variants = (
+        ("sem rate limiting", "none"),
+        ("BaseHTTPMiddleware", "basehttp"),
+        ("ASGI puro", "asgi"),
+    )
+    for label, variant in variants:
+        app = build_app(variant)
+        # Aquece o app e os caches de rota do middleware
+        assert await call(app, "/v1/foods/1") == 200
+        for template in ("/v1/foods", "/v1/foods/{id}"):
+            started = time.perf_counter()
+            for i in range(args.requests):
+                await call(
+                    app, template.replace("{id}", str(i))
+                )
+            elapsed = time.perf_counter() - started
+            print(
+                f"{label:20s} GET {template:15s} "
+                + f"{args.requests / elapsed:8.0f} req/s"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,236 @@
+"""
+Teste de carga do RedisRateLimiter contra a verificação em dois
+pipelines usada antes do script Lua: latência e idas ao Redis por
+verificação, e quantas requisições cada um deixa passar quando
+vários workers disputam a mesma chave.
+
+    python -m tests.benchmarks.bench_redis_rate_limiter
+    python -m tests.benchmarks.bench_redis_rate_limiter --rtt-ms 1
+    python -m tests.benchmarks.bench_redis_rate_limiter \\
+        --redis-url redis://localhost:6379/15
+
+Sem `--redis-url` usa um fakeredis em memória que espera `--rtt-ms`
+a cada ida ao servidor, simulando a rede. Com `--redis-url` o banco
+informado é esvaziado entre as medições.
+"""
+import time
+import asyncio
+import argparse
+import statistics
+from types import SimpleNamespace
+from unittest import mock
+import redis.asyncio as aioredis
+from fakeredis import FakeServer
+from fakeredis.aioredis import (
+    FakeRedis,
+    FakeAsyncRedisConnection,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.adapters.services.rate_limiting import (
+    redis_rate_limiter,
+)
+
+ENDPOINT = "POST:/v1/auth/login"
+ALGORITHMS = ("pipelines", "sliding_log", "gcra")
+
+
+class Network:
+    """Conta as idas ao Redis: um envio por comando ou pipeline"""
+
+    rtt_seconds = 0.0
+    round_trips = 0
+
+
+def counting(connection_class):
+    class CountingConnection(connection_class):
+        async def send_packed_command(
+            self, *args, **kwargs
+        ):
+            Network.round_trips += 1
+            if Network.rtt_seconds:
+                await asyncio.sleep(Network.rtt_seconds)
+            return await super().send_packed_command(
+                *args, **kwargs
+            )
+
+    return CountingConnection
+
+
+class PipelineBaseline:
+    """
+    Conta em um pipeline e registra em outro, como o RedisRateLimiter
+    anterior; mantido aqui como referência
+    """
+
+    def __init__(self, redis_url: str):
+        self.redis_client = (
+            redis_rate_limiter.aioredis.from_url(redis_url)
+        )
+
+    async def is_allowed(
+        self,
+        identifier,
+        max_requests,
+        window_seconds,
+        endpoint,
+    ):
+        key = f"rate_limit:{identifier}:{endpoint}"
+        now = time.time()
+        pipe = self.redis_client.pipeline()
+        pipe.zremrangebyscore(key, 0, now - window_seconds)
+        pipe.zcard(key)
+        count = (await pipe.execute())[1]
+        if count >= max_requests:
+            await self.redis_client.zrange(
+                key, 0, 0, withscores=True
+            )
+            return False, {}
+        pipe = self.redis_client.pipeline()
+        pipe.zadd(key, {repr(now): now})
+        pipe.expire(key, window_seconds + 1)
+        await pipe.execute()
+        return True, {}
+
+
+def build_limiter(name: str, redis_url: str):
+    if name == "pipelines":
+        return PipelineBaseline(redis_url)
+    return redis_rate_limiter.RedisRateLimiter(
+        redis_url, algorithm=name, timeout_seconds=5
+    )
+
+
+async def latency(name: str, redis_url: str, checks: int):
+    limiter = build_limiter(name, redis_url)
+    Network.round_trips = 0
+    timings = []
+    for i in range(checks):
+        started = time.perf_counter()
+        await limiter.is_allowed(
+            f"ip:{i % 50}", 20, 60, ENDPOINT
+        )
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return (
+        statistics.mean(timings) * 1e6,
+        timings[int(len(timings) * 0.99)] * 1e6,
+        Network.round_trips / checks,
+    )
+
+
+async def contend(
+    name: str,
+    redis_url: str,
+    workers: int,
+    tasks: int,
+    requests: int,
+    limit: int,
+) -> int:
+    """
+    Cada worker tem o próprio limiter e pool de conexões, como os
+    processos do uvicorn, e várias requisições simultâneas
+    """
+
+    async def client(limiter):
+        allowed = 0
+        for _ in range(requests):
+            ok, _ = await limiter.is_allowed(
+                "ip:shared", limit, 3600, ENDPOINT
+            )
+            allowed += ok
+        return allowed
+
+    limiters = [
+        build_limiter(name, redis_url)
+        for _ in range(workers)
+    ]
+    results = await asyncio.gather(
+        *[
+            client(limiter)
+            for limiter in limiters
+            for _ in range(tasks)
+        ]
+    )
+    return sum(results)
+
+
+async def run(args, redis_url: str, flush):
+    attempts = args.workers * args.tasks * args.requests
+    print(
+        f"{args.checks} verificações em 50 chaves; disputa: "
+        + f"{args.workers} workers x {args.tasks} requisições "
+        + f"simultâneas x {args.requests} = {attempts} "
+        + f"tentativas, limite {args.limit}/h"
+    )
+    for name in ALGORITHMS:
+        await flush()
+        mean, p99, trips = await latency(
+            name, redis_url, args.checks
+        )
+        await flush()
+        allowed = await contend(
+            name,
+            redis_url,
+            args.workers,
+            args.tasks,
+            args.requests,
+            args.limit,
+        )
+        print(
+            f"{name:12s} média {mean:7.0f} us  "
+            + f"p99 {p99:7.0f} us  "
+            + f"{trips:.2f} idas/verificação  "
+            + f"permitidas {allowed} (limite {args.limit})"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url")
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--checks", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=25)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    if args.redis_url:
+        connection_class = counting(aioredis.Connection)
+
+        def from_url(url, **kwargs):
+            return aioredis.from_url(
+                url, connection_class=connection_class
+            )
+
+        redis_url = args.redis_url
+    else:
+        Network.rtt_seconds = args.rtt_ms / 1000
+        server = FakeServer()
+        connection_class = counting(
+            FakeAsyncRedisConnection
+        )
+
+        def from_url(url, **kwargs):
+            return FakeRedis(
+                server=server,
+                connection_class=connection_class,
+            )
+
+        redis_url = "redis://fake"
+
+    async def flush():
+        await from_url(redis_url).flushdb()
+
+    # O limiter cria o cliente pelo módulo; aqui ele passa a contar
+    # as idas ao servidor
+    with mock.patch.object(
+        redis_rate_limiter,
+        "aioredis",
+        SimpleNamespace(from_url=from_url),
+    ):
+        asyncio.run(run(args, redis_url, flush))
+
+
+if __name__ == "__main__":
+    main()
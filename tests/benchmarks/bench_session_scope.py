@@ -0,0 +1,232 @@
+"""
+Compara uma requisição típica (autenticação com o cache de usuários
+frio e registro de uma pesagem) com uma sessão por unidade de
+trabalho, como antes do SessionScopeMiddleware, e com uma sessão por
+requisição: checkouts do pool, instruções SQL e idas de controle de
+transação (begin, commit, rollback e reset) por requisição.
+
+    python -m tests.benchmarks.bench_session_scope
+    python -m tests.benchmarks.bench_session_scope --requests 1000
+
+Roda num SQLite temporário, criado e removido pelo script.
+"""
+import os
+import time
+import argparse
+import tempfile
+from collections import Counter
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import scoped_session, sessionmaker
+from tests.utils.database import map_entities
+from src.seaapi.adapters.db.orm import metadata
+from src.seaapi.adapters.db.engine import (
+    InstrumentedQueuePool,
+)
+from src.seaapi.adapters.unit_of_works import (
+    FoodSqlAlchemyUnitOfWork,
+    GroupSqlAlchemyUnitOfWork,
+    MealSqlAlchemyUnitOfWork,
+    UserSqlAlchemyUnitOfWork,
+)
+from src.seaapi.adapters.unit_of_works.shared import (
+    session_scope,
+)
+from src.seaapi.adapters.use_cases import (
+    MealService,
+    UserService,
+)
+from src.seaapi.adapters.services.caching import (
+    MemoryPrincipalCache,
+)
+from src.seaapi.domain.dtos.meals import (
+    FoodMeasurementCreateInputDto,
+)
+from src.seaapi.domain.entities.user_entity import (
+    user_model_factory,
+)
+from src.seaapi.domain.entities.meal_entity import (
+    meal_model_factory,
+)
+from src.seaapi.domain.entities.food_entity import (
+    food_model_factory,
+)
+from src.seaapi.domain.entities.scale_entity import (
+    scale_model_factory,
+)
+
+TRANSACTION_EVENTS = ("begin", "commit", "rollback")
+
+
+def count_events(engine) -> Counter:
+    counter = Counter()
+
+    def counting(name):
+        return lambda *args: counter.update([name])
+
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        counting("statements"),
+    )
+    for name in TRANSACTION_EVENTS:
+        event.listen(engine, name, counting(name))
+    event.listen(engine.pool, "reset", counting("reset"))
+    return counter
+
+
+def load_fixtures(session_factory):
+    session = session_factory()
+    session.add(
+        user_model_factory(
+            first_name="Bench",
+            last_name="User",
+            email="bench@sea.api",
+            password="x",
+            is_active=True,
+            is_super_user=True,
+            id=1,
+        )
+    )
+    session.add(
+        scale_model_factory(
+            name="Balança", serial="SER1", id=1
+        )
+    )
+    session.flush()
+    session.add(
+        food_model_factory(
+            name="Arroz",
+            protein=1,
+            carbs=1,
+            fat=1,
+            calories=1,
+            scale_id=1,
+            id=1,
+        )
+    )
+    session.add(
+        meal_model_factory(
+            user_id=1, plate_identifier="P1", id=1
+        )
+    )
+    session.commit()
+    session.execute(text("UPDATE foods SET scale_id = 1"))
+    session.commit()
+    session.close()
+
+
+def make_request(engine):
+    def factory():
+        # Como o DEFAULT_SESSION_FACTORY do container: um registro
+        # de sessões por unidade de trabalho
+        return scoped_session(
+            sessionmaker(
+                bind=engine, expire_on_commit=False
+            )
+        )
+
+    users = UserService(
+        uow=UserSqlAlchemyUnitOfWork(factory),
+        group_uow=GroupSqlAlchemyUnitOfWork(factory),
+        token_service=None,
+        notification_service=None,
+        principal_cache=MemoryPrincipalCache(),
+    )
+    meals = MealService(
+        uow=MealSqlAlchemyUnitOfWork(factory),
+        food_uow=FoodSqlAlchemyUnitOfWork(factory),
+        user_uow=UserSqlAlchemyUnitOfWork(factory),
+        storage_service=None,
+    )
+    measurement = FoodMeasurementCreateInputDto(
+        serial="SER1", weight=100.0, plate_identifier="P1"
+    )
+
+    def request():
+        # BearerTokenAuthBackend e depois o endpoint
+        users.get_principal(1)
+        meals.add_meal_food_measurement(
+            food_measurement=measurement
+        )
+
+    return request
+
+
+def run(engine, counter, request, requests: int, scoped):
+    checkouts = engine.pool.checkouts
+    before = counter.copy()
+    started = time.perf_counter()
+    for _ in range(requests):
+        if scoped:
+            with session_scope():
+                request()
+        else:
+            request()
+    elapsed = time.perf_counter() - started
+    delta = counter - before
+    control = sum(
+        delta[name]
+        for name in TRANSACTION_EVENTS + ("reset",)
+    )
+    return {
+        "checkouts": (engine.pool.checkouts - checkouts)
+        / requests,
+        "statements": delta["statements"] / requests,
+        "commits": delta["commit"] / requests,
+        "control": control / requests,
+        "ms": elapsed / requests * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    handle, database_file = tempfile.mkstemp(suffix=".db")
+    os.close(handle)
+    map_entities()
+    engine = create_engine(
+        f"sqlite:///{database_file}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=5,
+        max_overflow=5,
+        connect_args={"check_same_thread": False},
+    )
+    try:
+        metadata.create_all(engine)
+        load_fixtures(
+            sessionmaker(
+                bind=engine, expire_on_commit=False
+            )
+        )
+        counter = count_events(engine)
+        request = make_request(engine)
+
+        for name, scoped in (
+            ("sessão por UoW (anterior)", False),
+            ("sessão por requisição", True),
+        ):
+            result = run(
+                engine,
+                counter,
+                request,
+                args.requests,
+                scoped,
+            )
+            print(
+                f"{name:26s} "
+                + f"checkouts {result['checkouts']:4.1f}  "
+                + f"instruções {result['statements']:5.1f}  "
+                + f"commits {result['commits']:4.1f}  "
+                + "begin/commit/rollback/reset "
+                + f"{result['control']:4.1f}  "
+                + f"{result['ms']:6.2f} ms"
+            )
+    finally:
+        engine.dispose()
+        os.remove(database_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Mede as verificações de token por segundo: o python-jose a cada
+requisição, como antes do TokenVerifier, contra o TokenVerifier sem
+cache (HS256 nativo e EdDSA) e com os tokens já em cache.
+
+    python -m tests.benchmarks.bench_token_verifier
+    python -m tests.benchmarks.bench_token_verifier --tokens 10000
+"""
+import time
+import argparse
+import itertools
+from jose import jwt, JWTError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import (
+    ed25519,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.domain.shared.keys import KeySet, SigningKey
+from src.seaapi.domain.shared.security import (
+    TokenVerifier,
+    encode_signed_jwt,
+)
+
+SECRET_KEY = "bench-secret"
+
+
+def verify_baseline(token, token_type="access"):
+    """
+    Verificação anterior: python-jose a cada requisição, sem cache
+    """
+    try:
+        claims = jwt.decode(
+            token, SECRET_KEY, algorithms=["HS256"]
+        )
+    except (JWTError, KeyError):
+        return None
+    if claims["exp"] < time.time():
+        return None
+    return (
+        claims if claims.get("type") == token_type else None
+    )
+
+
+def make_signing_key() -> SigningKey:
+    pem = (
+        ed25519.Ed25519PrivateKey.generate().private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return SigningKey.from_pem(pem)
+
+
+def claims(user_id: int) -> dict:
+    return {
+        "user_id": user_id,
+        "type": "access",
+        "exp": int(time.time()) + 3600,
+    }
+
+
+def per_second(verify, tokens, number: int) -> float:
+    cycle = itertools.cycle(tokens)
+    started = time.perf_counter()
+    for _ in range(number):
+        assert verify(next(cycle)) is not None
+    return number / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    hs_tokens = [
+        jwt.encode(claims(i), SECRET_KEY, algorithm="HS256")
+        for i in range(args.tokens)
+    ]
+    key = make_signing_key()
+    ed_tokens = [
+        encode_signed_jwt(claims(i), key)
+        for i in range(args.tokens)
+    ]
+
+    def verifier(max_entries, **kwargs):
+        return TokenVerifier(
+            max_entries=max_entries, **kwargs
+        ).verify
+
+    hs = {"secret_key": SECRET_KEY, "algorithm": "HS256"}
+    ed = {
+        "secret_key": "",
+        "algorithm": "EdDSA",
+        "key_set": KeySet([key]),
+    }
+    runs = [
+        (
+            "python-jose (anterior)",
+            verify_baseline,
+            hs_tokens,
+        ),
+        (
+            "HS256 nativo, sem cache",
+            verifier(0, **hs),
+            hs_tokens,
+        ),
+        ("EdDSA, sem cache", verifier(0, **ed), ed_tokens),
+        (
+            "HS256 nativo, em cache",
+            verifier(args.tokens, **hs),
+            hs_tokens,
+        ),
+        (
+            "EdDSA, em cache",
+            verifier(args.tokens, **ed),
+            ed_tokens,
+        ),
+    ]
+
+    print(f"{args.tokens} tokens distintos")
+    for name, verify, tokens in runs:
+        # Primeira passada enche o cache dos verificadores com cache
+        per_second(verify, tokens, len(tokens))
+        rate = per_second(verify, tokens, args.number)
+        print(f"{name:25s} {rate:>12,.0f} verificações/s")
+
+
+if __name__ == "__main__":
+    main()
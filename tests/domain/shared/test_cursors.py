@@ -0,0 +1,71 @@
+import src.seaapi.domain.entities  # noqa: F401
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from types import SimpleNamespace
+import pytest
+from src.seaapi.domain.dtos.mics import PaginationParams
+from src.seaapi.domain.ports.shared.exceptions import (
+    InvalidCursorException,
+)
+from src.seaapi.domain.shared.cursors import (
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Arroz",
+        42,
+        1.5,
+        True,
+        Decimal("12.340"),
+        uuid.UUID("2f1c7d5e-8a4b-4c1e-9f0a-3b2d1c0e9f8a"),
+        datetime(2024, 5, 1, 12, 30, 15, 500),
+        date(2024, 5, 1),
+        time(7, 45),
+    ],
+)
+def test_cursor_round_trip(value):
+    entity = SimpleNamespace(id=7, weight=value)
+
+    cursor = encode_cursor(entity, "weight,desc")
+
+    assert decode_cursor(cursor, "weight,desc") == (
+        "weight",
+        "desc",
+        value,
+        7,
+    )
+    assert type(
+        decode_cursor(cursor, "weight,desc")[2]
+    ) is type(value)
+
+
+def test_unsupported_order_value_is_rejected():
+    entity = SimpleNamespace(id=7, weight=object())
+
+    with pytest.raises(InvalidCursorException):
+        encode_cursor(entity, "weight,asc")
+
+
+def test_unsupported_order_value_has_no_next_cursor():
+    params = PaginationParams(
+        page_size=1, order="weight,asc"
+    )
+    items = [SimpleNamespace(id=7, weight=object())]
+
+    assert next_cursor(items, params) is None
+
+
+def test_cursor_for_another_order_is_rejected():
+    cursor = encode_cursor(
+        SimpleNamespace(id=7, weight=Decimal("1")),
+        "weight,asc",
+    )
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, "weight,desc")
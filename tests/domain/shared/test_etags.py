@@ -0,0 +1,40 @@
+import src.seaapi.domain.entities  # noqa: F401
+import pytest
+from src.seaapi.domain.shared.etags import (
+    compute_etag,
+    etag_matches,
+)
+
+ETAG = compute_etag(b'{"id": 1}')
+
+
+def test_compute_etag_is_strong_and_stable():
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert compute_etag(b'{"id": 1}') == ETAG
+    assert compute_etag(b'{"id": 2}') != ETAG
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        ETAG,
+        f"W/{ETAG}",
+        "*",
+        " * ",
+        f'"outro", {ETAG}',
+        f'W/"outro", W/{ETAG}',
+    ],
+)
+def test_etag_matches(if_none_match):
+    assert etag_matches(if_none_match, ETAG)
+
+
+def test_weak_etag_matches_strong_header():
+    assert etag_matches(ETAG, f"W/{ETAG}")
+
+
+@pytest.mark.parametrize(
+    "if_none_match", [None, "", '"outro"', ETAG[:-2] + '"']
+)
+def test_etag_does_not_match(if_none_match):
+    assert not etag_matches(if_none_match, ETAG)
@@ -0,0 +1,283 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import pytest
+from jose import jwt
+from jose.exceptions import JWTError
+from cryptography.hazmat.primitives import (
+    hashes,
+    serialization,
+)
+from cryptography.hazmat.primitives.asymmetric import (
+    ec,
+    ed25519,
+)
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    encode_dss_signature,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.domain.shared import keys, security
+from src.seaapi.domain.shared.keys import (
+    KeySet,
+    RemoteKeySet,
+    SigningKey,
+    b64decode,
+    b64encode,
+)
+from src.seaapi.domain.shared.security import (
+    decode_signed_jwt,
+    encode_signed_jwt,
+)
+
+JWKS_URL = "https://sea.api/v1/auth/jwks.json"
+
+
+def make_key(algorithm="ES256") -> SigningKey:
+    private_key = (
+        ec.generate_private_key(ec.SECP256R1())
+        if algorithm == "ES256"
+        else ed25519.Ed25519PrivateKey.generate()
+    )
+    return SigningKey.from_pem(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+
+def public_only(key: SigningKey) -> SigningKey:
+    return SigningKey.from_jwk(key.to_jwk())
+
+
+def make_claims(minutes=5):
+    return {
+        "sub": "7",
+        "exp": datetime.now(timezone.utc)
+        + timedelta(minutes=minutes),
+    }
+
+
+def test_es256_signature_is_raw_r_and_s():
+    key = make_key()
+    data = b"header.payload"
+
+    signature = key.sign(data)
+
+    assert len(signature) == 64
+    assert key.verify(signature, data)
+    # r||s convertido para DER confere com a própria cryptography
+    key.public_key.verify(
+        encode_dss_signature(
+            int.from_bytes(signature[:32], "big"),
+            int.from_bytes(signature[32:], "big"),
+        ),
+        data,
+        ec.ECDSA(hashes.SHA256()),
+    )
+    assert not key.verify(signature, b"header.outro")
+    assert not key.verify(signature[:-1], data)
+
+
+def test_es256_der_signature_is_rejected():
+    key = make_key()
+    der = key.private_key.sign(
+        b"data", ec.ECDSA(hashes.SHA256())
+    )
+
+    assert not key.verify(der, b"data")
+
+
+def test_es256_token_verifies_with_jose():
+    key = make_key()
+    token = encode_signed_jwt(make_claims(), key)
+    pem = key.public_key.public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+    claims = jwt.decode(token, pem, algorithms=["ES256"])
+
+    assert claims["sub"] == "7"
+    assert (
+        jwt.get_unverified_header(token)["kid"] == key.kid
+    )
+
+
+def test_kid_is_rfc_thumbprint():
+    # Exemplo da RFC 8037, apêndice A.3
+    key = SigningKey.from_jwk(
+        {
+            "kty": "OKP",
+            "crv": "Ed25519",
+            "x": "11qYAYKxCrfVS_7TyWQHOg7hcvPapiMlrwIaaPcHURo",
+        }
+    )
+
+    assert (
+        key.kid
+        == "kPrK_qmxVWaYVA9wwBF6Iuo3vVzz7TxHCTwXBygrS4k"
+    )
+
+
+def test_es256_jwk_round_trip():
+    key = make_key()
+
+    jwk = key.to_jwk()
+    loaded = SigningKey.from_jwk(jwk)
+
+    assert jwk["kty"] == "EC" and jwk["crv"] == "P-256"
+    assert jwk["alg"] == "ES256" and jwk["use"] == "sig"
+    assert len(b64decode(jwk["x"])) == 32
+    assert "d" not in jwk
+    assert loaded.kid == key.kid == key.thumbprint()
+    assert loaded.verify(key.sign(b"data"), b"data")
+
+
+def test_jwks_document_lists_public_keys():
+    current, previous = make_key(), make_key("EdDSA")
+
+    document = json.loads(KeySet([current, previous]).jwks)
+
+    assert [jwk["kid"] for jwk in document["keys"]] == [
+        current.kid,
+        previous.kid,
+    ]
+    assert all("d" not in jwk for jwk in document["keys"])
+    assert KeySet.from_jwks(document).keys.keys() == {
+        current.kid,
+        previous.kid,
+    }
+
+
+def test_get_jwks_follows_algorithm(monkeypatch):
+    key_set = KeySet([make_key()])
+    monkeypatch.setattr(
+        security, "get_key_set", lambda: key_set
+    )
+
+    monkeypatch.setattr(
+        security.settings, "ALGORITHM", "HS256"
+    )
+    assert json.loads(security.get_jwks()) == {"keys": []}
+
+    monkeypatch.setattr(
+        security.settings, "ALGORITHM", "ES256"
+    )
+    assert security.get_jwks() is key_set.jwks
+
+
+def test_rotation_keeps_old_tokens_valid():
+    old, new = make_key(), make_key()
+    old_token = encode_signed_jwt(make_claims(), old)
+
+    key_set = KeySet([new, public_only(old)])
+    new_token = encode_signed_jwt(
+        make_claims(), key_set.signing_key
+    )
+
+    assert key_set.signing_key is new
+    assert (
+        jwt.get_unverified_header(new_token)["kid"]
+        == new.kid
+    )
+    assert (
+        decode_signed_jwt(old_token, key_set)["sub"] == "7"
+    )
+    assert (
+        decode_signed_jwt(new_token, key_set)["sub"] == "7"
+    )
+    with pytest.raises(JWTError):
+        decode_signed_jwt(
+            new_token, KeySet([public_only(old)])
+        )
+
+
+@pytest.mark.parametrize("alg", ["EdDSA", "HS256", "none"])
+def test_alg_that_does_not_match_key_is_rejected(alg):
+    key = make_key()
+    token = encode_signed_jwt(make_claims(), key)
+    _, payload, signature = token.split(".")
+    header = b64encode(
+        json.dumps(
+            {"alg": alg, "typ": "JWT", "kid": key.kid}
+        ).encode()
+    )
+
+    with pytest.raises(JWTError):
+        decode_signed_jwt(
+            f"{header}.{payload}.{signature}", KeySet([key])
+        )
+
+
+class FakeJwksServer:
+    def __init__(self, monkeypatch, keys_):
+        self.keys = keys_
+        self.requests = 0
+        self.now = 1000.0
+        monkeypatch.setattr(
+            keys.urllib.request, "urlopen", self.urlopen
+        )
+        monkeypatch.setattr(
+            keys,
+            "time",
+            SimpleNamespace(monotonic=lambda: self.now),
+        )
+
+    def urlopen(self, url, timeout):
+        assert url == JWKS_URL
+        self.requests += 1
+        return io.BytesIO(KeySet(self.keys).jwks)
+
+
+def test_unknown_kid_refetch_is_rate_limited(monkeypatch):
+    old, new = make_key(), make_key()
+    server = FakeJwksServer(monkeypatch, [old])
+    key_set = RemoteKeySet(
+        JWKS_URL, ttl_seconds=300, min_refresh_seconds=30
+    )
+
+    assert key_set.get(old.kid).kid == old.kid
+    assert server.requests == 1
+
+    # Chave nova publicada logo depois da última leitura
+    server.keys = [new, public_only(old)]
+    server.now += 10
+    assert key_set.get(new.kid) is None
+    assert key_set.get("desconhecido") is None
+    assert server.requests == 1
+
+    server.now += 21
+    assert key_set.get(new.kid).kid == new.kid
+    assert server.requests == 2
+    assert key_set.get("desconhecido") is None
+    assert server.requests == 2
+
+    # Sem kids novos, o documento é relido pelo TTL
+    server.now += 300
+    assert key_set.get(old.kid) is not None
+    assert server.requests == 3
+
+
+def test_failed_fetch_keeps_previous_keys(monkeypatch):
+    key = make_key()
+    server = FakeJwksServer(monkeypatch, [key])
+    key_set = RemoteKeySet(JWKS_URL, ttl_seconds=300)
+    key_set.get(key.kid)
+
+    def unavailable(url, timeout):
+        server.requests += 1
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(
+        keys.urllib.request, "urlopen", unavailable
+    )
+    server.now += 301
+
+    assert key_set.get(key.kid).kid == key.kid
+    assert server.requests == 2
+    # A falha também conta para o intervalo mínimo
+    assert key_set.get(key.kid) is not None
+    assert server.requests == 2
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+from jose import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import (
+    ed25519,
+)
+import src.seaapi.domain.entities  # noqa: F401
+from src.seaapi.domain.shared.keys import KeySet, SigningKey
+from src.seaapi.domain.shared.security import (
+    TokenVerifier,
+    encode_signed_jwt,
+)
+
+
+def make_signing_key() -> SigningKey:
+    pem = (
+        ed25519.Ed25519PrivateKey.generate().private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return SigningKey.from_pem(pem)
+
+
+def make_claims(minutes=5, type="access"):
+    return {
+        "sub": "7",
+        "type": type,
+        "exp": datetime.now(timezone.utc)
+        + timedelta(minutes=minutes),
+    }
+
+
+def test_signed_token_uses_verifier_key_set():
+    key = make_signing_key()
+    verifier = TokenVerifier(
+        secret_key="",
+        algorithm="EdDSA",
+        key_set=KeySet([key]),
+    )
+
+    claims = verifier.verify(
+        encode_signed_jwt(make_claims(), key)
+    )
+
+    assert claims["sub"] == "7"
+
+
+def test_signed_token_from_another_key_set_is_rejected():
+    verifier = TokenVerifier(
+        secret_key="",
+        algorithm="EdDSA",
+        key_set=KeySet([make_signing_key()]),
+    )
+
+    token = encode_signed_jwt(
+        make_claims(), make_signing_key()
+    )
+
+    assert verifier.verify(token) is None
+
+
+def test_expired_signed_token_is_rejected():
+    key = make_signing_key()
+    verifier = TokenVerifier(
+        secret_key="",
+        algorithm="EdDSA",
+        key_set=KeySet([key]),
+    )
+
+    token = encode_signed_jwt(make_claims(minutes=-1), key)
+
+    assert verifier.verify(token) is None
+
+
+def test_jose_path_uses_verifier_secret():
+    verifier = TokenVerifier(
+        secret_key="segredo",
+        algorithm="HS512",
+        native=False,
+    )
+
+    token = jwt.encode(
+        make_claims(), "segredo", algorithm="HS512"
+    )
+    forged = jwt.encode(
+        make_claims(), "outro", algorithm="HS512"
+    )
+
+    assert verifier.verify(token)["sub"] == "7"
+    assert verifier.verify(forged) is None
+    assert verifier.verify(token, "refresh") is None
@@ -31,6 +31,18 @@ from src.seaapi.adapters.services.pdf.jinja import (
 from src.seaapi.adapters.services.storage.fake import (
     FakeStorageService,
 )
+from src.seaapi.adapters.services.storage.executor import (
+    ExecutorStorageService,
+)
+from src.seaapi.adapters.services.caching.memory_versioned_cache import (
+    MemoryVersionedCache,
+)
+from src.seaapi.adapters.services.caching.memory_principal_cache import (
+    MemoryPrincipalCache,
+)
+from src.seaapi.adapters.services.hashing.inline_password_hasher import (
+    InlinePasswordHasher,
+)
 
 
 class Container(containers.DeclarativeContainer):
@@ -100,6 +112,23 @@ class Container(containers.DeclarativeContainer):
         FakeStorageService
     )
 
+    async_storage_service = providers.Singleton(
+        ExecutorStorageService,
+        storage_service=storage_service,
+    )
+
+    menu_cache = providers.Singleton(
+        MemoryVersionedCache, namespace="menu"
+    )
+
+    principal_cache = providers.Singleton(
+        MemoryPrincipalCache
+    )
+
+    password_hasher = providers.Singleton(
+        InlinePasswordHasher
+    )
+
     token_service = providers.Factory(
         TokenService,
         uow=token_uow,
@@ -111,12 +140,14 @@ class Container(containers.DeclarativeContainer):
         group_uow=group_uow,
         token_service=token_service,
         notification_service=notification_service,
+        principal_cache=principal_cache,
     )
 
     group_service = providers.Factory(
         GroupService,
         uow=group_uow,
         permission_uow=permission_uow,
+        principal_cache=principal_cache,
     )
 
     permission_service = providers.Factory(
@@ -128,6 +159,8 @@ class Container(containers.DeclarativeContainer):
         uow=food_uow,
         scale_uow=scale_uow,
         storage_service=storage_service,
+        async_storage_service=async_storage_service,
+        menu_cache=menu_cache,
     )
 
     meal_service = providers.Factory(
@@ -141,4 +174,5 @@ class Container(containers.DeclarativeContainer):
     scale_service = providers.Factory(
         ScaleService,
         uow=scale_uow,
+        menu_cache=menu_cache,
     )
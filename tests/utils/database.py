@@ -0,0 +1,53 @@
+import src.seaapi.domain.entities  # noqa: F401
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.seaapi.adapters.db.models import (
+    TablesRegistration,
+)
+from src.seaapi.adapters.db.orm import (
+    metadata,
+    mapper_registry,
+    general_tables,
+    users_tables,
+    foods_tables,
+)
+
+
+def map_entities():
+    """
+    Mapeia as entidades sem cadastrar as permissões padrão, que
+    dependem do container e do banco da aplicação
+    """
+    if mapper_registry.mappers:
+        return
+    register = TablesRegistration.register
+    TablesRegistration.register = lambda self: None
+    try:
+        for tables in (
+            general_tables,
+            users_tables,
+            foods_tables,
+        ):
+            type(tables).register(tables)
+    finally:
+        TablesRegistration.register = register
+
+
+def memory_engine():
+    """SQLite em memória com as tabelas criadas"""
+    map_entities()
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    metadata.create_all(engine)
+    return engine
+
+
+def memory_session_factory(engine=None):
+    return sessionmaker(
+        bind=engine or memory_engine(),
+        expire_on_commit=False,
+    )
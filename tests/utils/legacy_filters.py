@@ -0,0 +1,179 @@
+"""
+Montagem das consultas de `_find_all` anterior ao FilterPlan, que
+relia o Meta da entidade a cada chamada. Serve de referência para o
+teste de equivalência e para o benchmark dos planos.
+"""
+from datetime import date, datetime
+from typing import List, Tuple
+from sqlalchemy import and_, asc, desc, func, not_, or_
+from sqlalchemy.orm import noload
+from src.seaapi.domain.dtos.mics import Operator
+from src.seaapi.domain.shared.cursors import resolve_order
+
+
+def legacy_query(session, entity, params, **kwargs):
+    search_query = params.search or ""
+    query = session.query(entity)
+
+    if hasattr(entity.Meta, "joins"):
+        for join in getattr(entity.Meta, "joins", []):
+            query = query.outerjoin(join)
+
+    if hasattr(entity.Meta, "no_load"):
+        noload_items = []
+        for field in getattr(entity.Meta, "no_load", []):
+            noload_items.append(getattr(entity, field))
+        query = query.options(
+            noload(item) for item in noload_items
+        )
+
+    composite_field = None
+    if entity is not None and hasattr(
+        entity.Meta, "composite_field"
+    ):
+        composite_field = entity.Meta.composite_field
+
+    if kwargs.get(composite_field, None) is not None:
+        composite_field_value = kwargs.get(
+            composite_field, None
+        )
+        query = query.filter(
+            getattr(entity, composite_field)
+            == composite_field_value
+        )
+
+    if hasattr(entity.Meta, "search"):
+        clauses = [
+            func.lower(getattr(entity, field)).like(
+                f"%{search_query.lower()}%"
+            )
+            for field in entity.Meta.search
+        ]
+        if len(clauses) > 0:
+            query = query.filter(or_(*clauses))
+
+    if hasattr(entity.Meta, "filters"):
+
+        def operator_mapper(operator, attribute, value):
+            if operator == Operator.IN.value:
+                return getattr(entity, attribute).in_(value)
+            elif operator == Operator.NOT_IN.value:
+                return getattr(entity, attribute).notin_(
+                    value
+                )
+            elif operator == Operator.LTE.value:
+                return getattr(entity, attribute) <= value
+            elif operator == Operator.LT.value:
+                return getattr(entity, attribute) < value
+            elif operator == Operator.GTE.value:
+                return getattr(entity, attribute) >= value
+            elif operator == Operator.GT.value:
+                return getattr(entity, attribute) > value
+            elif operator == Operator.NOT.value:
+                return not_(
+                    getattr(entity, attribute) == value
+                )
+            elif operator == Operator.EXACT.value:
+                return getattr(entity, attribute) == value
+            return True
+
+        def filter_mapper(field):
+            is_valid_field = getattr(
+                entity, field
+            ) and hasattr(params, field)
+            if is_valid_field:
+                value = getattr(params, field)
+                value_type = type(value)
+                if hasattr(
+                    entity.Meta, "filter_mapper"
+                ) and field in getattr(
+                    entity.Meta, "filter_mapper"
+                ):
+                    mapper_func = getattr(
+                        entity.Meta, "filter_mapper"
+                    )
+                    clause = mapper_func[field](value)
+                    if type(clause) is tuple:
+                        method = clause[0]
+                        conditions = clause[1]
+                        return (
+                            or_(*conditions)
+                            if method == "or"
+                            else and_(*conditions)
+                        )
+                    elif type(clause) is list:
+                        return and_(*clause)
+                    else:
+                        return clause
+                elif value_type == str:
+                    return func.lower(
+                        getattr(entity, field)
+                    ).like(f"%{value.lower()}%")
+                elif value_type == tuple:
+                    operator, v = value
+                    return operator_mapper(
+                        operator=operator,
+                        value=v,
+                        attribute=field,
+                    )
+                elif value_type == dict:
+                    operations = []
+                    for operator, v in value.items():
+                        operations.append(
+                            operator_mapper(
+                                operator=operator,
+                                value=v,
+                                attribute=field,
+                            )
+                        )
+                    return and_(*operations)
+
+                elif (
+                    value_type == int
+                    or value_type == bool
+                    or value_type == float
+                    or value_type == date
+                    or value_type == datetime
+                ):
+                    return getattr(entity, field) == value
+            return None
+
+        clauses = [
+            filter_mapper(field)
+            for field in entity.Meta.filters
+        ]
+        clauses = [
+            clause
+            for clause in clauses
+            if clause is not None
+        ]
+
+        query = query.filter(and_(True, *clauses))
+
+    field, direction = resolve_order(
+        getattr(params, "order", None)
+    ).split(",")
+    sort = asc if direction.lower() == "asc" else desc
+    if hasattr(entity, field):
+        query = query.order_by(sort(getattr(entity, field)))
+        if field != "id":
+            query = query.order_by(
+                sort(getattr(entity, "id"))
+            )
+    return query
+
+
+def legacy_find_all(
+    session, entity, params, **kwargs
+) -> Tuple[List, int]:
+    """`_find_all` anterior com a contagem exata"""
+    query = legacy_query(session, entity, params, **kwargs)
+    if params.page is None:
+        data = query.all()
+        return data, len(data)
+    results = query.count()
+    offset = (params.page - 1) * params.page_size
+    return (
+        query.offset(offset).limit(params.page_size).all(),
+        results,
+    )
@@ -0,0 +1,40 @@
+from starlette.authentication import (
+    AuthCredentials,
+    AuthenticationBackend,
+)
+from starlette.requests import HTTPConnection
+from src.seaapi.domain import Role
+from src.seaapi.domain.entities.principal_entity import (
+    Principal,
+)
+
+PRINCIPALS = {
+    "admin": Principal(
+        id=1,
+        is_active=True,
+        is_super_user=False,
+        groups_ids=(Role.ADMIN.id,),
+        permissions_codes=frozenset(),
+    ),
+    "customer": Principal(
+        id=2,
+        is_active=True,
+        is_super_user=False,
+        groups_ids=(Role.CUSTOMER.id,),
+        permissions_codes=frozenset(),
+    ),
+}
+
+
+class TokenAsPrincipalBackend(AuthenticationBackend):
+    """
+    Autenticação dos testes de rotas: o token Bearer é o nome de um
+    dos principals acima
+    """
+
+    async def authenticate(self, conn: HTTPConnection):
+        token = conn.headers.get("Authorization", "")
+        principal = PRINCIPALS.get(token.split(" ")[-1])
+        if principal is None:
+            return None
+        return AuthCredentials(), principal